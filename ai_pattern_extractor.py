@@ -10,22 +10,35 @@ Features:
 3. Extracts product/tool mentions
 4. Generates actionable SaaS opportunity summaries
 5. Scores opportunities based on validation signals
+6. Map-reduce over large corpora: posts are sharded into token-budgeted
+   chunks, patterns are extracted per chunk concurrently (bounded by a
+   semaphore), then merged and deduped in a reduce step
+7. Optional LLMCache: a prompt identical to an earlier one (same model,
+   posts and context) reuses the stored response instead of calling Gemini
+8. Token-budgeted prompts: posts are ranked by validation score and signal
+   density, stripped of whitespace and boilerplate (sign-offs, link URLs,
+   template lines repeated across posts) and packed until the budget is full
 
 Usage:
     from ai_pattern_extractor import AIPatternExtractor
+    from llm_cache import LLMCache
     
-    extractor = AIPatternExtractor()
+    extractor = AIPatternExtractor(cache=LLMCache())
     patterns = await extractor.extract_patterns(posts)
     summary = await extractor.generate_opportunity_summary(patterns)
 """
 
+import asyncio
 import json
 import os
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, replace
 from typing import Optional
 
 from dotenv import load_dotenv
 
+from llm_cache import LLMCache
+
 load_dotenv()
 
 # Try to import Google AI
@@ -36,6 +49,126 @@ except ImportError:
     GEMINI_AVAILABLE = False
     print("⚠️ google-generativeai not installed. AI features disabled.")
 
+# Rough prompt size estimate (Gemini averages ~4 characters per token for English)
+CHARS_PER_TOKEN = 4
+
+# Tokens reserved for the pattern prompt's instructions around the posts
+PATTERN_PROMPT_TOKENS = 800
+
+# Post body characters kept after boilerplate is stripped
+BODY_CHARS = 500
+
+# Packing rank = validation score + this * signals per 100 tokens (capped)
+SIGNAL_DENSITY_WEIGHT = 2.0
+MAX_SIGNAL_DENSITY = 3.0
+
+# Posts always get at least this many tokens, however large the rest of the prompt is
+MIN_POSTS_TOKENS = 1000
+
+# A body line found in this many posts is template text (automod notices, sign-offs)
+REPEATED_LINE_MIN_POSTS = 3
+
+# Filler that carries no signal for pattern analysis
+BOILERPLATE_PATTERNS = [
+    re.compile(r"&amp;#x200B;|&#x200B;|\u200b"),
+    re.compile(r"(?im)^\s*(edit|update)\s*\d*\s*:\s*(thanks|thank you|wow|typo|formatting)\b.*$"),
+    re.compile(r"(?i)\b(thanks|thank you)( so much)? in advance\b[.!]*|\btia\b[.!]*"),
+    re.compile(r"(?i)\bany (help|advice|input|suggestions?) (is|would be) (greatly |much )?appreciated\b[.!]*"),
+    re.compile(r"(?i)\bsorry (for|about) (the )?(long post|wall of text|formatting|bad english|my english)\b[.!]*"),
+    re.compile(r"(?i)\b(sent|posted) from my (iphone|android|phone|mobile)\b[.!]*"),
+]
+_MARKDOWN_LINK = re.compile(r"\[([^\]]*)\]\(\s*https?://[^)\s]*\s*\)")
+_URL = re.compile(r"https?://(?:www\.)?([^/\s)\]]+)\S*")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of `text`."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def parse_json_response(text: str) -> dict:
+    """Parse a model's JSON reply, dropping a surrounding markdown code fence."""
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.split("```")[1]
+        if text.startswith("json"):
+            text = text[4:]
+    return json.loads(text)
+
+
+def compact_text(text: str, drop_lines: frozenset = frozenset(), max_chars: Optional[int] = None) -> str:
+    """
+    Strip `drop_lines` (normalized, see repeated_lines), boilerplate and
+    link URLs (kept as their domain), collapse whitespace and cut to
+    `max_chars` at a word boundary.
+    """
+    if not text:
+        return ""
+    if drop_lines:
+        text = "\n".join(line for line in text.splitlines() if _normalize_line(line) not in drop_lines)
+    text = _MARKDOWN_LINK.sub(r"\1", text)
+    text = _URL.sub(r"<\1>", text)
+    for pattern in BOILERPLATE_PATTERNS:
+        text = pattern.sub(" ", text)
+    text = _WHITESPACE.sub(" ", text).strip()
+    if max_chars is not None and len(text) > max_chars:
+        text = text[:max_chars].rsplit(" ", 1)[0] + "…"
+    return text
+
+
+def _normalize_line(line: str) -> str:
+    return _WHITESPACE.sub(" ", line).strip().lower()
+
+
+def repeated_lines(bodies: list[str], min_posts: int = REPEATED_LINE_MIN_POSTS) -> frozenset:
+    """Normalized lines (20+ chars) that appear in at least `min_posts` different bodies."""
+    counts: dict[str, int] = {}
+    for body in bodies:
+        for line in {_normalize_line(line) for line in (body or "").splitlines()}:
+            if len(line) >= 20:
+                counts[line] = counts.get(line, 0) + 1
+    return frozenset(line for line, count in counts.items() if count >= min_posts)
+
+
+def post_fields(post) -> dict:
+    """Fields used for prompting and packing, from a post dict or dataclass."""
+    # Handle both dict and dataclass posts
+    get = (lambda name, default: getattr(post, name, default)) if hasattr(post, 'title') else post.get
+    intents = get('intents', []) or []
+    if hasattr(intents[0] if intents else None, 'value'):
+        intents = [i.value for i in intents]
+    return {
+        "title": get('title', '') or '',
+        "body": get('body', '') or '',
+        "upvotes": get('upvotes', 0),
+        "comments": get('comments', 0),
+        "subreddit": get('subreddit', ''),
+        "intents": intents,
+        "validation_score": get('validation_score', 0.0) or 0.0,
+        "signals": (
+            len(get('payment_signals', []) or []) + len(get('pain_signals', []) or [])
+            + sum(1 for intent in intents if intent != 'general')
+        ),
+    }
+
+
+@dataclass
+class PackedPosts:
+    """Posts formatted into a prompt under a token budget."""
+    text: str
+    included: int
+    total: int
+    tokens: int
+    
+    def summary(self) -> str:
+        return f"{self.included}/{self.total} posts, ~{self.tokens:,} tokens"
+
+
+def pattern_key(name: str) -> str:
+    """Merge key for a pattern name: lowercase words, order-insensitive."""
+    return " ".join(sorted(set(re.findall(r"[a-z0-9]+", name.lower()))))
+
 
 @dataclass
 class AIPattern:
@@ -70,15 +203,81 @@ class SaaSOpportunity:
     pricing_suggestion: str
 
 
+def pattern_from_dict(p: dict) -> AIPattern:
+    """Build an AIPattern from one entry of the model's `patterns` list."""
+    return AIPattern(
+        name=p.get("name", "Unknown Pattern"),
+        description=p.get("description", ""),
+        problem_statement=p.get("problem_statement", ""),
+        target_audience=p.get("target_audience", ""),
+        post_count=p.get("post_count", 0),
+        validation_signals=p.get("validation_signals", []),
+        example_quotes=p.get("example_quotes", []),
+        competition_notes=p.get("competition_notes", ""),
+        opportunity_score=p.get("opportunity_score", 0.0),
+        recommended_features=p.get("recommended_features", []),
+        monetization_potential=p.get("monetization_potential", "")
+    )
+
+
+def _union(*lists: list, limit: int = 5) -> list:
+    merged = []
+    for items in lists:
+        for item in items:
+            if item not in merged:
+                merged.append(item)
+    return merged[:limit]
+
+
+def merge_patterns(patterns: list[AIPattern]) -> list[AIPattern]:
+    """
+    Merge patterns with the same name (ignoring case, punctuation and word
+    order): post counts add up, the score is the post-weighted average and
+    evidence lists are unioned. Text fields come from the largest pattern.
+    """
+    groups: dict[str, list[AIPattern]] = {}
+    for pattern in patterns:
+        groups.setdefault(pattern_key(pattern.name), []).append(pattern)
+    
+    merged = []
+    for group in groups.values():
+        group.sort(key=lambda p: p.post_count, reverse=True)
+        total = sum(p.post_count for p in group)
+        score = (
+            sum(p.opportunity_score * p.post_count for p in group) / total if total
+            else max(p.opportunity_score for p in group)
+        )
+        merged.append(replace(
+            group[0],
+            post_count=total,
+            opportunity_score=round(score, 1),
+            validation_signals=_union(*(p.validation_signals for p in group)),
+            example_quotes=_union(*(p.example_quotes for p in group), limit=3),
+            recommended_features=_union(*(p.recommended_features for p in group)),
+        ))
+    return sorted(merged, key=lambda p: p.opportunity_score, reverse=True)
+
+
 class AIPatternExtractor:
     """
     Uses Gemini AI to extract patterns and opportunities from Reddit posts.
     Replicates GummySearch's AI-powered pattern detection.
     """
     
-    def __init__(self, model_name: str = "gemini-3-flash-preview"):
+    def __init__(
+        self,
+        model_name: str = "gemini-3-flash-preview",
+        max_concurrency: int = 4,
+        chunk_token_budget: int = 12000,
+        cache: Optional[LLMCache] = None
+    ):
         self.model_name = model_name
         self.model = None
+        # Map-reduce settings: parallel Gemini calls and prompt size per chunk
+        self.max_concurrency = max(1, max_concurrency)
+        self.chunk_token_budget = chunk_token_budget
+        # Responses to previously seen prompts, reused instead of calling the model
+        self.cache = cache
         
         if GEMINI_AVAILABLE:
             api_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
@@ -88,57 +287,94 @@ class AIPatternExtractor:
             else:
                 print("⚠️ No GOOGLE_API_KEY or GEMINI_API_KEY found. AI features disabled.")
     
-    def _prepare_posts_for_analysis(self, posts: list, max_posts: int = 100) -> str:
-        """Format posts for AI analysis."""
-        formatted = []
-        
-        for i, post in enumerate(posts[:max_posts]):
-            # Handle both dict and dataclass posts
-            if hasattr(post, 'title'):
-                title = post.title
-                body = getattr(post, 'body', '')
-                upvotes = getattr(post, 'upvotes', 0)
-                comments = getattr(post, 'comments', 0)
-                subreddit = getattr(post, 'subreddit', '')
-                intents = getattr(post, 'intents', [])
-                if hasattr(intents[0] if intents else None, 'value'):
-                    intents = [i.value for i in intents]
-            else:
-                title = post.get('title', '')
-                body = post.get('body', '')
-                upvotes = post.get('upvotes', 0)
-                comments = post.get('comments', 0)
-                subreddit = post.get('subreddit', '')
-                intents = post.get('intents', [])
-            
-            formatted.append(f"""
-POST {i+1}:
+    async def _generate(self, prompt: str, parse_json: bool = False):
+        """
+        Response text for `prompt` (or its parsed JSON), from the cache when
+        this model has answered the same prompt before. A response is only
+        cached once it parses, so malformed replies are retried.
+        """
+        text = self.cache.get(self.model_name, prompt) if self.cache is not None else None
+        cached = text is not None
+        if not cached:
+            text = (await self.model.generate_content_async(prompt)).text
+        result = parse_json_response(text) if parse_json else text
+        if not cached and self.cache is not None:
+            self.cache.put(self.model_name, prompt, text)
+        return result
+    
+    @staticmethod
+    def _format_post(fields: dict, number: int, drop_lines: frozenset = frozenset()) -> str:
+        """Format one post's fields (see post_fields) for AI analysis."""
+        title = compact_text(fields["title"], max_chars=300)
+        body = compact_text(fields["body"], drop_lines, BODY_CHARS)
+        intents = fields["intents"]
+        return f"""
+POST {number}:
 Title: {title}
-Body: {body[:500] if body else 'N/A'}
-Subreddit: r/{subreddit}
-Engagement: ↑{upvotes} comments:{comments}
+Body: {body or 'N/A'}
+Subreddit: r/{fields["subreddit"]}
+Engagement: ↑{fields["upvotes"]} comments:{fields["comments"]}
 Detected Intents: {', '.join(intents) if intents else 'general'}
----""")
-        
-        return "\n".join(formatted)
+---"""
     
-    async def extract_patterns(
-        self,
-        posts: list,
-        audience_context: str = "",
-        max_patterns: int = 10
-    ) -> list[AIPattern]:
+    def _prepare_posts_for_analysis(self, posts: list, token_budget: Optional[int] = None) -> PackedPosts:
         """
-        Extract common patterns from posts using AI.
-        Like GummySearch's "Find Patterns" feature.
+        Format the highest-signal posts that fit in `token_budget` (default:
+        one chunk). Posts are ranked by validation score plus signal density
+        (payment/pain signals and intents per 100 tokens), then added greedily;
+        a post that doesn't fit is skipped so shorter ones can still fill the
+        remaining budget. The budget never drops below MIN_POSTS_TOKENS.
         """
-        if not self.model:
-            print("⚠️ AI model not available. Using fallback pattern extraction.")
-            return self._fallback_pattern_extraction(posts)
+        budget = token_budget if token_budget is not None else self.chunk_token_budget - PATTERN_PROMPT_TOKENS
+        budget = max(budget, MIN_POSTS_TOKENS)
+        fields = [post_fields(post) for post in posts]
+        drop_lines = repeated_lines([f["body"] for f in fields])
+        
+        candidates = []
+        for f in fields:
+            text = self._format_post(f, 0, drop_lines)
+            tokens = estimate_tokens(text)
+            density = min(f["signals"] * 100 / tokens, MAX_SIGNAL_DENSITY)
+            candidates.append((f["validation_score"] + SIGNAL_DENSITY_WEIGHT * density, f))
+        candidates.sort(key=lambda c: c[0], reverse=True)
         
-        posts_text = self._prepare_posts_for_analysis(posts)
+        texts, used = [], 0
+        for _, f in candidates:
+            text = self._format_post(f, len(texts) + 1, drop_lines)
+            tokens = estimate_tokens(text)
+            if used + tokens > budget:
+                continue
+            texts.append(text)
+            used += tokens
         
-        prompt = f"""You are an expert at identifying SaaS product opportunities from online discussions.
+        packed = PackedPosts("\n".join(texts), len(texts), len(fields), used)
+        print(f"   📦 Packed {packed.summary()}")
+        if fields and not texts:
+            print(f"   ⚠️ No post fits in {budget:,} tokens; the prompt has no post data")
+        return packed
+    
+    def _chunk_posts(self, posts: list) -> list[str]:
+        """Format every post, packed greedily into chunks of at most `chunk_token_budget` tokens."""
+        budget = max(self.chunk_token_budget - PATTERN_PROMPT_TOKENS, 1)
+        fields = [post_fields(post) for post in posts]
+        drop_lines = repeated_lines([f["body"] for f in fields])
+        chunks, current, used = [], [], 0
+        for f in fields:
+            text = self._format_post(f, len(current) + 1, drop_lines)
+            tokens = estimate_tokens(text)
+            if current and used + tokens > budget:
+                chunks.append("\n".join(current))
+                current, used = [], 0
+                text = self._format_post(f, 1, drop_lines)
+            current.append(text)
+            used += tokens
+        if current:
+            chunks.append("\n".join(current))
+        return chunks
+    
+    def _pattern_prompt(self, posts_text: str, audience_context: str, max_patterns: int) -> str:
+        """Prompt asking for the top `max_patterns` patterns in `posts_text`."""
+        return f"""You are an expert at identifying SaaS product opportunities from online discussions.
 
 CONTEXT: {audience_context if audience_context else 'General SaaS audience research'}
 
@@ -185,41 +421,151 @@ Focus on actionable SaaS opportunities. Prioritize patterns where people explici
 - Specific feature requests
 
 Return ONLY valid JSON, no other text."""
-
+    
+    async def _generate_patterns(self, prompt: str) -> list[AIPattern]:
+        """Run a pattern prompt and parse the patterns it returns."""
+        result = await self._generate(prompt, parse_json=True)
+        return [pattern_from_dict(p) for p in result.get("patterns", [])]
+    
+    async def extract_patterns(
+        self,
+        posts: list,
+        audience_context: str = "",
+        max_patterns: int = 10,
+        map_reduce: bool = True
+    ) -> list[AIPattern]:
+        """
+        Extract common patterns from posts using AI.
+        Like GummySearch's "Find Patterns" feature.
+        
+        Corpora that don't fit in one chunk are analyzed map-reduce style so
+        every post is covered; `map_reduce=False` analyzes only the
+        highest-signal posts that fit in a single prompt.
+        """
+        if not self.model:
+            print("⚠️ AI model not available. Using fallback pattern extraction.")
+            return self._fallback_pattern_extraction(posts)
+        
+        chunks = self._chunk_posts(posts) if map_reduce else [self._prepare_posts_for_analysis(posts).text]
+        
         try:
-            response = await self.model.generate_content_async(prompt)
-            result_text = response.text.strip()
-            
-            # Clean up response (remove markdown code blocks if present)
-            if result_text.startswith("```"):
-                result_text = result_text.split("```")[1]
-                if result_text.startswith("json"):
-                    result_text = result_text[4:]
-            
-            result = json.loads(result_text)
-            
-            patterns = []
-            for p in result.get("patterns", []):
-                patterns.append(AIPattern(
-                    name=p.get("name", "Unknown Pattern"),
-                    description=p.get("description", ""),
-                    problem_statement=p.get("problem_statement", ""),
-                    target_audience=p.get("target_audience", ""),
-                    post_count=p.get("post_count", 0),
-                    validation_signals=p.get("validation_signals", []),
-                    example_quotes=p.get("example_quotes", []),
-                    competition_notes=p.get("competition_notes", ""),
-                    opportunity_score=p.get("opportunity_score", 0.0),
-                    recommended_features=p.get("recommended_features", []),
-                    monetization_potential=p.get("monetization_potential", "")
-                ))
-            
+            if len(chunks) > 1:
+                return await self._map_reduce_patterns(chunks, audience_context, max_patterns)
+            patterns = await self._generate_patterns(
+                self._pattern_prompt(chunks[0] if chunks else "", audience_context, max_patterns)
+            )
             return sorted(patterns, key=lambda p: p.opportunity_score, reverse=True)
             
         except Exception as e:
             print(f"⚠️ AI pattern extraction failed: {e}")
             return self._fallback_pattern_extraction(posts)
     
+    async def _map_reduce_patterns(
+        self,
+        chunks: list[str],
+        audience_context: str,
+        max_patterns: int
+    ) -> list[AIPattern]:
+        """Extract patterns per chunk concurrently, then merge them into the top `max_patterns`."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        print(f"   🗺️ Map: {len(chunks)} chunks, {self.max_concurrency} concurrent Gemini calls")
+        
+        async def map_chunk(i: int, chunk: str) -> Optional[list[AIPattern]]:
+            async with semaphore:
+                try:
+                    return await self._generate_patterns(
+                        self._pattern_prompt(chunk, audience_context, max_patterns)
+                    )
+                except Exception as e:
+                    print(f"   ⚠️ Chunk {i + 1}/{len(chunks)} failed: {e}")
+                    return None
+        
+        results = await asyncio.gather(*(map_chunk(i, chunk) for i, chunk in enumerate(chunks)))
+        # A chunk without patterns is a valid answer; only errors count as failures
+        failed = sum(1 for r in results if r is None)
+        if failed == len(chunks):
+            raise RuntimeError("every chunk failed")
+        
+        patterns = merge_patterns([p for chunk_patterns in results for p in chunk_patterns or []])
+        print(f"   🧮 Reduce: {len(patterns)} distinct patterns from {len(chunks) - failed} chunks")
+        return await self._reduce_patterns(patterns, audience_context, max_patterns)
+    
+    def _reduce_prompt(self, patterns: list[AIPattern], audience_context: str, max_patterns: int) -> str:
+        """Prompt asking the model to merge overlapping patterns from different chunks."""
+        compact = [
+            {
+                "name": p.name,
+                "description": p.description,
+                "problem_statement": p.problem_statement,
+                "target_audience": p.target_audience,
+                "post_count": p.post_count,
+                "validation_signals": p.validation_signals[:3],
+                "example_quotes": p.example_quotes[:2],
+                "competition_notes": p.competition_notes,
+                "opportunity_score": p.opportunity_score,
+                "recommended_features": p.recommended_features[:4],
+                "monetization_potential": p.monetization_potential,
+            }
+            for p in patterns
+        ]
+        return f"""You are an expert at identifying SaaS product opportunities from online discussions.
+
+CONTEXT: {audience_context if audience_context else 'General SaaS audience research'}
+
+These patterns were extracted separately from different batches of the same Reddit corpus, so several may describe the same underlying need under different names.
+
+PATTERNS:
+{json.dumps(compact, indent=1)}
+
+Merge patterns that describe the same need into one: sum their post_count, combine their validation signals, quotes and features, and re-score opportunity_score (0-10) for the merged pattern. Keep distinct needs separate.
+
+Return the TOP {max_patterns} merged patterns in this exact JSON format (same fields as the input):
+{{
+    "patterns": [ {{ "name": "...", "description": "...", "problem_statement": "...", "target_audience": "...", "post_count": 5, "validation_signals": [], "example_quotes": [], "competition_notes": "...", "opportunity_score": 7.5, "recommended_features": [], "monetization_potential": "..." }} ]
+}}
+
+Return ONLY valid JSON, no other text."""
+    
+    async def _reduce_patterns(
+        self,
+        patterns: list[AIPattern],
+        audience_context: str,
+        max_patterns: int
+    ) -> list[AIPattern]:
+        """
+        Merge semantically overlapping patterns with the model. Pattern lists
+        too large for one prompt are reduced in token-budgeted groups first.
+        Falls back to the name-merged patterns if the model call fails.
+        """
+        if len(patterns) <= max_patterns:
+            return patterns
+        
+        groups, current = [], []
+        for pattern in patterns:
+            current.append(pattern)
+            if estimate_tokens(self._reduce_prompt(current, audience_context, max_patterns)) > self.chunk_token_budget:
+                if len(current) > 1:
+                    groups.append(current[:-1])
+                    current = [pattern]
+        groups.append(current)
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def reduce_group(group: list[AIPattern]) -> list[AIPattern]:
+            async with semaphore:
+                try:
+                    return await self._generate_patterns(self._reduce_prompt(group, audience_context, max_patterns))
+                except Exception as e:
+                    print(f"   ⚠️ Reduce step failed ({e}); keeping name-merged patterns")
+                    return group
+        
+        results = await asyncio.gather(*(reduce_group(group) for group in groups))
+        reduced = merge_patterns([p for group in results for p in group])
+        if len(groups) > 1 and len(reduced) < len(patterns):
+            # Another round over the groups' outputs
+            return await self._reduce_patterns(reduced, audience_context, max_patterns)
+        return reduced[:max_patterns]
+    
     async def generate_opportunity_summary(
         self,
         posts: list,
@@ -233,14 +579,16 @@ Return ONLY valid JSON, no other text."""
             print("⚠️ AI model not available.")
             return []
         
-        posts_text = self._prepare_posts_for_analysis(posts, max_posts=50)
-        
         patterns_text = ""
         if patterns:
             patterns_text = "\n\nIDENTIFIED PATTERNS:\n"
             for p in patterns[:5]:
                 patterns_text += f"- {p.name}: {p.description} (Score: {p.opportunity_score})\n"
         
+        posts_text = self._prepare_posts_for_analysis(
+            posts, self.chunk_token_budget - PATTERN_PROMPT_TOKENS - estimate_tokens(patterns_text)
+        ).text
+        
         prompt = f"""You are a SaaS product strategist. Based on this research data, identify the TOP 5 most promising SaaS product opportunities.
 
 CONTEXT: {audience_context if audience_context else 'General audience'}
@@ -280,15 +628,7 @@ Prioritize opportunities with:
 Return ONLY valid JSON."""
 
         try:
-            response = await self.model.generate_content_async(prompt)
-            result_text = response.text.strip()
-            
-            if result_text.startswith("```"):
-                result_text = result_text.split("```")[1]
-                if result_text.startswith("json"):
-                    result_text = result_text[4:]
-            
-            result = json.loads(result_text)
+            result = await self._generate(prompt, parse_json=True)
             
             opportunities = []
             for o in result.get("opportunities", []):
@@ -318,7 +658,8 @@ Return ONLY valid JSON."""
         if not self.model:
             return "AI analysis not available."
         
-        posts_text = self._prepare_posts_for_analysis(posts, max_posts=30)
+        # Competition analysis needs fewer discussions than pattern finding
+        posts_text = self._prepare_posts_for_analysis(posts, self.chunk_token_budget // 2).text
         
         prompt = f"""Analyze the competitive landscape for this product idea based on Reddit discussions:
 
@@ -339,8 +680,7 @@ Provide:
 Be specific and cite evidence from the posts."""
 
         try:
-            response = await self.model.generate_content_async(prompt)
-            return response.text
+            return await self._generate(prompt)
         except Exception as e:
             return f"Analysis failed: {e}"
     
@@ -498,6 +838,5 @@ async def demo():
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(demo())
 
@@ -0,0 +1,174 @@
+"""
+Warm page pool for scraping, on top of a browser-use BrowserSession.
+
+Opening a tab (and re-installing init scripts and request routing) for every
+search pays the page setup cost each time. The pool keeps a small set of
+pages alive and hands them out with checkout/return semantics:
+1. Pages are Playwright pages opened in the session's browser over CDP
+   (`BrowserSession.cdp_url`), so they share its profile and cookies but
+   never touch the agent's own tab, and the page helpers (page_waits,
+   script_registry, scroll_paginator) get the Playwright page API they use
+2. At most `size` pages are checked out at once
+3. Idle pages are health-checked before being handed out again
+4. Pages are recycled (closed and replaced) after `max_uses` navigations
+5. An optional async `setup(page)` hook runs once on every new page (e.g. to
+   install init scripts before its first navigation)
+
+The session must be started before the first checkout. `close()` closes the
+pool's pages and disconnects; the session and its browser keep running.
+
+Usage:
+    from browser_pool import BrowserPool
+
+    await browser.start()
+    pool = BrowserPool(browser, size=4, max_uses=25)
+    async with pool.page() as page:
+        await page.goto("https://www.reddit.com/r/SaaS/")
+    await pool.close()
+    await browser.kill()
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+from playwright.async_api import async_playwright
+
+
+@dataclass
+class PooledPage:
+    """A pooled page and how many navigations it has served."""
+    page: object
+    uses: int = 0
+
+
+class BrowserPool:
+    """
+    Reusable pool of warm pages in a BrowserSession's browser, shared across searches.
+    """
+
+    def __init__(
+        self,
+        browser,
+        size: int = 4,
+        max_uses: int = 25,
+        health_check: bool = True,
+        setup: Optional[Callable[[object], Awaitable]] = None
+    ):
+        self.browser = browser
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.health_check = health_check
+        self.setup = setup
+        self._idle: list[PooledPage] = []
+        self._slots = asyncio.Semaphore(self.size)
+        self._closed = False
+        self._playwright = None
+        self._cdp_browser = None
+        self._connect_lock = asyncio.Lock()
+        self.stats = {"created": 0, "reused": 0, "recycled": 0, "unhealthy": 0}
+
+    async def _context(self):
+        """The session browser's default context, connecting over CDP on first use."""
+        async with self._connect_lock:
+            if self._cdp_browser is None:
+                cdp_url = getattr(self.browser, "cdp_url", None)
+                if not cdp_url:
+                    raise RuntimeError("BrowserPool needs a started browser session (no CDP URL yet)")
+                self._playwright = await async_playwright().start()
+                try:
+                    self._cdp_browser = await self._playwright.chromium.connect_over_cdp(cdp_url)
+                except BaseException:
+                    await self._playwright.stop()
+                    self._playwright = None
+                    raise
+        contexts = self._cdp_browser.contexts
+        return contexts[0] if contexts else await self._cdp_browser.new_context()
+
+    async def _create(self) -> PooledPage:
+        page = await (await self._context()).new_page()
+        if self.setup is not None:
+            try:
+                await self.setup(page)
+            except BaseException:
+                await self._discard(PooledPage(page=page))
+                raise
+        self.stats["created"] += 1
+        return PooledPage(page=page)
+
+    async def _is_healthy(self, entry: PooledPage) -> bool:
+        if not self.health_check:
+            return True
+        try:
+            await entry.page.evaluate("() => document.readyState")
+            return True
+        except Exception:
+            return False
+
+    async def _discard(self, entry: PooledPage):
+        try:
+            await entry.page.close()
+        except Exception:
+            pass
+
+    async def acquire(self) -> PooledPage:
+        """Check out a healthy page, creating one if no idle page is available."""
+        if self._closed:
+            raise RuntimeError("BrowserPool is closed")
+
+        await self._slots.acquire()
+        try:
+            while self._idle:
+                entry = self._idle.pop()
+                if await self._is_healthy(entry):
+                    self.stats["reused"] += 1
+                    return entry
+                self.stats["unhealthy"] += 1
+                await self._discard(entry)
+            return await self._create()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def release(self, entry: PooledPage):
+        """Return a checked-out page, recycling it once it hits `max_uses`."""
+        entry.uses += 1
+        try:
+            if self._closed or entry.uses >= self.max_uses:
+                if not self._closed:
+                    self.stats["recycled"] += 1
+                await self._discard(entry)
+            else:
+                self._idle.append(entry)
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def page(self):
+        """Context manager yielding a pooled page for one navigation."""
+        entry = await self.acquire()
+        try:
+            yield entry.page
+        finally:
+            await self.release(entry)
+
+    async def close(self):
+        """
+        Close all idle pages and disconnect from the browser (which keeps
+        running). Pages still checked out are closed on return.
+        """
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for entry in idle:
+            await self._discard(entry)
+
+        cdp_browser, self._cdp_browser = self._cdp_browser, None
+        playwright, self._playwright = self._playwright, None
+        if cdp_browser is not None:
+            try:
+                await cdp_browser.close()
+            except Exception:
+                pass
+        if playwright is not None:
+            await playwright.stop()
@@ -0,0 +1,245 @@
+"""
+Lean browser profile for bulk scraping.
+
+Scrapes only need the DOM text, but a default browser renders a visible
+window and downloads every image, video, web font and ad/analytics script
+on the page. The scraping profile skips all of that:
+1. Runs headless, with launch flags that disable images, remote fonts,
+   media autoplay and background networking
+2. Tracker/ad hosts never resolve (host resolver rules), so their scripts
+   and beacons are never fetched
+3. `block_resources()` intercepts requests on each page and aborts images,
+   media, fonts and tracker URLs the flags don't catch
+4. `page_load_metrics()` reads load time and bytes transferred from the
+   page's Performance API, and `python browser_profiles.py` compares the
+   default and scraping profiles on real URLs
+
+Not yet validated: no comparison run has been recorded, so the load-time
+and bytes savings are expected rather than measured, and nobody has checked
+that blocking the tracker hosts above leaves Reddit/GummySearch extraction
+intact. Until a comparison is recorded here, the finder only uses this
+profile with --block-resources.
+
+Usage:
+    from browser_profiles import block_resources, scraping_browser
+
+    browser = scraping_browser()
+    await browser.start()
+    pool = BrowserPool(browser, size=4, setup=block_resources)
+
+    python browser_profiles.py --url "https://www.reddit.com/r/SaaS/search/?q=looking+for+tool" --runs 3
+"""
+
+import argparse
+import asyncio
+import re
+from dataclasses import dataclass, field
+
+from browser_use import Browser
+
+from browser_pool import BrowserPool
+from page_waits import goto_and_wait
+
+# Request types that scraping never reads
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+
+# Ad, analytics and tracking hosts seen on Reddit/GummySearch pages
+TRACKER_HOSTS = [
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googletagmanager.com",
+    "google-analytics.com",
+    "googleadservices.com",
+    "adservice.google.com",
+    "facebook.net",
+    "connect.facebook.net",
+    "ads.reddit.com",
+    "alb.reddit.com",
+    "pixel-config.reddit.com",
+    "events.redditmedia.com",
+    "amazon-adsystem.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "hotjar.com",
+    "segment.io",
+    "intercom.io",
+]
+
+# URL patterns for Network.setBlockedURLs when interception goes through CDP
+BLOCKED_URL_PATTERNS = [
+    *(f"*.{ext}*" for ext in ("png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico",
+                              "mp4", "webm", "m3u8", "woff", "woff2", "ttf", "otf")),
+    *(f"*{host}*" for host in TRACKER_HOSTS),
+]
+
+SCRAPING_BROWSER_ARGS = [
+    "--blink-settings=imagesEnabled=false",
+    "--disable-remote-fonts",
+    "--autoplay-policy=user-gesture-required",
+    "--mute-audio",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--host-resolver-rules=" + ", ".join(
+        rule for host in TRACKER_HOSTS for rule in (f"MAP {host} ~NOTFOUND", f"MAP *.{host} ~NOTFOUND")
+    ),
+]
+
+_TRACKER_PATTERN = re.compile(
+    r"^https?://([^/]+\.)?(" + "|".join(re.escape(host) for host in TRACKER_HOSTS) + r")(:\d+)?/"
+)
+
+# Navigation timing plus bytes transferred for the document and its resources
+PAGE_METRICS_JS = """
+() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const resources = performance.getEntriesByType('resource');
+    const bytes = resources.reduce((sum, r) => sum + (r.transferSize || 0), nav ? nav.transferSize || 0 : 0);
+    return {
+        dom_content_loaded_ms: nav ? nav.domContentLoadedEventEnd - nav.startTime : 0,
+        load_ms: nav ? (nav.loadEventEnd || performance.now()) - nav.startTime : 0,
+        transfer_bytes: bytes,
+        requests: resources.length + 1
+    };
+}
+"""
+
+
+def is_blocked_request(url: str, resource_type: str) -> bool:
+    """True for requests the scraping profile aborts."""
+    return resource_type in BLOCKED_RESOURCE_TYPES or bool(_TRACKER_PATTERN.match(url))
+
+
+def scraping_browser(headless: bool = True, **kwargs) -> Browser:
+    """Browser using the scraping profile; extra kwargs go to Browser (`args` are appended)."""
+    args = SCRAPING_BROWSER_ARGS + list(kwargs.pop("args", []))
+    return Browser(headless=headless, args=args, **kwargs)
+
+
+async def block_resources(page) -> bool:
+    """
+    Abort image/media/font and tracker requests on `page`. Uses request
+    routing when the page supports it, else CDP URL blocking. Returns False
+    if neither is available (the launch flags still apply).
+    """
+    route = getattr(page, "route", None)
+    if route is not None:
+        async def handle(request_route):
+            request = request_route.request
+            if is_blocked_request(request.url, request.resource_type):
+                await request_route.abort()
+            else:
+                await request_route.continue_()
+
+        try:
+            await route("**/*", handle)
+            return True
+        except Exception:
+            return False
+
+    client = getattr(page, "_client", None)
+    ensure_session = getattr(page, "_ensure_session", None)
+    if client is None or ensure_session is None:
+        return False
+    try:
+        session_id = await ensure_session()
+        await client.send.Network.enable(session_id=session_id)
+        await client.send.Network.setBlockedURLs(params={"urls": BLOCKED_URL_PATTERNS}, session_id=session_id)
+        return True
+    except Exception:
+        return False
+
+
+async def page_load_metrics(page) -> dict:
+    """Load timings, bytes transferred and request count of the current page."""
+    try:
+        return await page.evaluate(PAGE_METRICS_JS) or {}
+    except Exception:
+        return {}
+
+
+@dataclass
+class ProfileMeasurement:
+    """Page loads measured under one browser profile."""
+    loads: int = 0
+    load_ms: float = 0.0
+    dom_content_loaded_ms: float = 0.0
+    transfer_bytes: int = 0
+    requests: int = 0
+    failures: list = field(default_factory=list)
+
+    def add(self, metrics: dict):
+        self.loads += 1
+        self.load_ms += metrics.get("load_ms", 0)
+        self.dom_content_loaded_ms += metrics.get("dom_content_loaded_ms", 0)
+        self.transfer_bytes += metrics.get("transfer_bytes", 0)
+        self.requests += metrics.get("requests", 0)
+
+    def average(self, name: str) -> float:
+        return getattr(self, name) / self.loads if self.loads else 0.0
+
+
+async def measure_profile(browser: Browser, urls: list[str], runs: int, blocked: bool) -> ProfileMeasurement:
+    """Load each URL `runs` times in fresh pages and total their metrics."""
+    measurement = ProfileMeasurement()
+    await browser.start()
+    # max_uses=1: every load gets a new page, so nothing is served from a warm one
+    pool = BrowserPool(browser, size=1, max_uses=1, setup=block_resources if blocked else None)
+    try:
+        for _ in range(runs):
+            for url in urls:
+                try:
+                    async with pool.page() as page:
+                        await goto_and_wait(page, url, label="profile_benchmark")
+                        measurement.add(await page_load_metrics(page))
+                except Exception as e:
+                    measurement.failures.append(f"{url}: {e}")
+    finally:
+        await pool.close()
+        await browser.kill()
+    return measurement
+
+
+def format_profile_comparison(results: dict[str, ProfileMeasurement]) -> str:
+    """Markdown table of average load time, bytes and requests per profile."""
+    lines = [
+        "| Profile | Loads | DOMContentLoaded ms | Load ms | KB transferred | Requests |",
+        "|---------|-------|---------------------|---------|----------------|----------|",
+    ]
+    for name, m in results.items():
+        lines.append(
+            f"| {name} | {m.loads} | {m.average('dom_content_loaded_ms'):.0f} | {m.average('load_ms'):.0f} | "
+            f"{m.average('transfer_bytes') / 1024:.0f} | {m.average('requests'):.0f} |"
+        )
+    return "\n".join(lines)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Compare page load cost of the default and scraping browser profiles")
+    parser.add_argument("--url", action="append", required=True, help="Page to load (repeatable)")
+    parser.add_argument("--runs", type=int, default=3, help="Loads per URL and profile")
+    parser.add_argument("--headed", action="store_true", help="Show the default-profile browser window")
+    args = parser.parse_args()
+
+    print(f"⏱️ Loading {len(args.url)} URL(s) x {args.runs} runs per profile...")
+    results = {
+        "default": await measure_profile(Browser(headless=not args.headed), args.url, args.runs, blocked=False),
+        "scraping": await measure_profile(scraping_browser(), args.url, args.runs, blocked=True),
+    }
+    print(f"\n📊 Profile comparison:\n{format_profile_comparison(results)}")
+
+    for name, m in results.items():
+        for failure in m.failures:
+            print(f"   ⚠️ {name}: {failure}")
+
+    default, scraping = results["default"], results["scraping"]
+    if default.transfer_bytes and default.load_ms:
+        print(
+            f"\n💡 Scraping profile: {1 - scraping.average('transfer_bytes') / default.average('transfer_bytes'):.0%} fewer bytes, "
+            f"{1 - scraping.average('load_ms') / default.average('load_ms'):.0%} faster load"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
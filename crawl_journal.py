@@ -0,0 +1,124 @@
+"""
+Checkpoint journal for long crawls.
+
+Audience crawls can run for hours; a browser crash, captcha or Ctrl-C used to
+lose every post collected so far. The journal makes each finished search
+unit durable as soon as it completes:
+1. Each completed (subreddit, intent, query) unit is appended as one JSON
+   line together with its posts, then flushed and fsynced
+2. Reopening the journal with `resume=True` loads the completed units so a
+   restarted crawl can skip them
+3. A torn last line (crash mid-write) is ignored; that unit simply reruns
+4. Each crawl target gets its own journal (`journal_path()`), and opening a
+   journal never erases it: only `complete()` (a crawl that finished with no
+   failed searches) or `fresh=True` (an explicit restart) drops old units
+
+Usage:
+    from crawl_journal import CrawlJournal, journal_path
+
+    journal = CrawlJournal(journal_path("saas_founders"), resume=True)
+    key = journal.unit_key("SaaS", "pain_point", "frustrated with", "relevance", "year", 8)
+    if key in journal:
+        posts = journal.posts(key)
+    else:
+        posts = ...
+        journal.record(key, posts)
+    journal.complete()
+"""
+
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_JOURNAL_DIR = Path(__file__).parent / ".cache" / "crawl_journals"
+
+
+def journal_path(target: str, directory: Path | str = DEFAULT_JOURNAL_DIR) -> Path:
+    """Journal file for one crawl target (an audience key or subreddit list)."""
+    slug = re.sub(r"[^a-z0-9_-]+", "_", target.lower()).strip("_")[:100] or "default"
+    return Path(directory) / f"{slug}.jsonl"
+
+
+class CrawlJournal:
+    """Append-only JSON Lines journal of completed search units."""
+
+    def __init__(self, path: Path | str, resume: bool = False, fresh: bool = False):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._units: dict[str, list[dict]] = {}
+        self.skipped = 0
+
+        # Without `resume` old units are kept on disk (just not replayed), so a
+        # plain run after a crash doesn't destroy what a later --resume needs
+        if self.path.exists() and not fresh:
+            self._drop_torn_line()
+            if resume:
+                self._load()
+        self._file = open(self.path, "w" if fresh else "a", encoding="utf-8")
+
+    @staticmethod
+    def unit_key(
+        subreddit: str,
+        intent: str,
+        query: str,
+        sort: str,
+        time_filter: str,
+        max_posts: int
+    ) -> str:
+        """Journal key for one search unit."""
+        return json.dumps([subreddit.lower(), intent, query, sort, time_filter, max_posts])
+
+    def _drop_torn_line(self):
+        """Truncate a torn last line (crash mid-write) so new entries start on a fresh line."""
+        with open(self.path, "r+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            if not size:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return
+            f.seek(0)
+            data = f.read()
+            f.truncate(data.rfind(b"\n") + 1)
+
+    def _load(self):
+        for line in self.path.read_text(encoding="utf-8").splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            self._units[entry["unit"]] = entry["posts"]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._units
+
+    def __len__(self) -> int:
+        return len(self._units)
+
+    def posts(self, key: str) -> Optional[list[dict]]:
+        """Post dicts recorded for a completed unit (None if it hasn't completed)."""
+        posts = self._units.get(key)
+        if posts is not None:
+            self.skipped += 1
+        return posts
+
+    def record(self, key: str, posts: list[dict]):
+        """Durably append a completed unit and its post dicts."""
+        line = json.dumps({"unit": key, "at": time.time(), "posts": posts})
+        self._file.write(line + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._units[key] = posts
+
+    def complete(self):
+        """Close and delete the journal once its crawl has finished cleanly."""
+        self._file.close()
+        self.path.unlink(missing_ok=True)
+
+    def close(self):
+        """Close the journal file."""
+        if not self._file.closed:
+            self._file.close()
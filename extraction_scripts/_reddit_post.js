@@ -0,0 +1,65 @@
+// Shared helpers: one rendered Reddit post node -> raw post dict (null if it has no usable title)
+
+// First element matching the selectors in priority order (not document order)
+function firstMatch(root, selectors) {
+    for (const selector of selectors) {
+        const el = root.querySelector(selector);
+        if (el) return el;
+    }
+    return null;
+}
+
+// "1,234", "1.2k", "17 comments" -> number
+function parseCount(text) {
+    const match = (text || '').replace(/,/g, '').match(/-?\d+(\.\d+)?\s*[km]?/i);
+    if (!match) return 0;
+    const unit = match[0].slice(-1).toLowerCase();
+    return Math.round(parseFloat(match[0]) * (unit === 'k' ? 1000 : unit === 'm' ? 1000000 : 1));
+}
+
+function extractRedditPost(post, titleChars, bodyChars) {
+    let title = '';
+    let body = '';
+    let upvotes = '0';
+    let comments = '0';
+    let author = '';
+    let timestamp = '';
+    let url = '';
+    let subreddit = '';
+
+    // shreddit-post (new Reddit)
+    if (post.tagName === 'SHREDDIT-POST') {
+        title = post.getAttribute('post-title') || '';
+        author = post.getAttribute('author') || '';
+        upvotes = post.getAttribute('score') || '0';
+        comments = post.getAttribute('comment-count') || '0';
+        url = post.getAttribute('permalink') || '';
+        subreddit = post.getAttribute('subreddit-prefixed-name') || '';
+        timestamp = post.getAttribute('created-timestamp') || '';
+    } else {
+        // Fallback selectors
+        title = post.querySelector('h3, h2, [slot="title"], a.title, .title')?.textContent?.trim() || '';
+        body = firstMatch(post, ['[slot="text-body"]', '.md', '.usertext-body', 'p:not(.title):not(.tagline)'])?.textContent?.trim() || '';
+        // Old Reddit renders dislikes/unvoted/likes scores; the unvoted one is the real score
+        upvotes = firstMatch(post, ['[data-testid="post-vote-score"]', '.score.unvoted', '.score', 'faceplate-number'])?.textContent || '0';
+        // The title link also points at /comments/, so prefer the comment-count link
+        const commentLink = firstMatch(post, ['a.comments', '[data-testid="comments-count"]', 'a[href*="comments"]']);
+        comments = commentLink?.textContent || '0';
+        url = commentLink?.getAttribute('href') || '';
+        author = post.querySelector('a[href*="/user/"]')?.textContent || '';
+        const timeEl = post.querySelector('time, [datetime]');
+        timestamp = timeEl?.getAttribute('datetime') || timeEl?.textContent || '';
+    }
+
+    if (!title || title.length <= 10) return null;
+    return {
+        title: title.substring(0, titleChars),
+        body: body.substring(0, bodyChars),
+        upvotes: parseCount(upvotes),
+        comments: parseCount(comments),
+        author,
+        timestamp,
+        subreddit: subreddit.replace(/^r\//, ''),
+        url
+    };
+}
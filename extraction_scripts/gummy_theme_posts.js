@@ -0,0 +1,68 @@
+// Posts on a GummySearch theme results page (listitem layout). Returns {layout, items}.
+([selectors, maxPosts]) => {
+    const results = [];
+    // GummySearch uses listitem elements for posts
+    const layout = selectors.find((s) => document.querySelector(s)) || null;
+    const items = document.querySelectorAll(selectors.join(', '));
+
+    items.forEach((item, idx) => {
+        if (idx >= maxPosts) return;
+
+        const text = item.textContent || '';
+        const links = item.querySelectorAll('a');
+        let title = '';
+        let body = '';
+        let subreddit = '';
+        let category = '';
+        let upvotes = '';
+        let comments = '';
+        let date = '';
+        let author = '';
+
+        // Extract title from heading
+        const heading = item.querySelector('h1, h2, h3, h4, h5, h6');
+        if (heading) title = heading.textContent.trim();
+
+        // Extract links for title and body
+        links.forEach(link => {
+            const href = link.getAttribute('href') || '';
+            const linkText = link.textContent.trim();
+            if (href.includes('reddit.com') && linkText.length > 20) {
+                if (!title) title = linkText;
+                else if (!body) body = linkText;
+            }
+            if (linkText.startsWith('r/')) subreddit = linkText;
+            if (linkText.startsWith('u/')) author = linkText;
+        });
+
+        // Extract metadata from text patterns
+        const upvoteMatch = text.match(/↑\s*(\d+)/);
+        const commentMatch = text.match(/💬\s*(\d+)|○\s*(\d+)/);
+        const dateMatch = text.match(/(\w{3}\s+\d{1,2}\/\d{1,2}\/\d{4}|\d{1,2}\/\d{1,2}\/\d{4})/);
+
+        if (upvoteMatch) upvotes = upvoteMatch[1];
+        if (commentMatch) comments = commentMatch[1] || commentMatch[2];
+        if (dateMatch) date = dateMatch[1];
+
+        // Extract category tags
+        const categoryPatterns = ['Software Tool', 'Service', 'Physical Product', 'Website', 'API', 'Mobile App', 'Frustration', 'Disappointment', 'Advice'];
+        categoryPatterns.forEach(cat => {
+            if (text.includes(cat)) category = cat;
+        });
+
+        if (title && title.length > 10) {
+            results.push({
+                title: title.substring(0, 200),
+                body: body.substring(0, 500),
+                subreddit,
+                category,
+                upvotes,
+                comments,
+                date,
+                author
+            });
+        }
+    });
+
+    return {layout, items: results};
+}
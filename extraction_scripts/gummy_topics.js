@@ -0,0 +1,34 @@
+// Topics on a GummySearch audience's Topics tab, deduped by name. Returns {layout, items}.
+(selectors) => {
+    const layout = selectors.find((s) => document.querySelector(s)) || null;
+    const results = [];
+    const links = document.querySelectorAll(selectors.join(', '));
+
+    links.forEach(link => {
+        const text = link.textContent || '';
+        const parent = link.closest('div, li');
+        const fullText = parent ? parent.textContent : text;
+
+        // Extract topic name and metadata
+        const topicMatch = text.match(/^([A-Za-z\s-]+)/);
+        const growthMatch = fullText.match(/-?\d+%/);
+        const subredditMatch = fullText.match(/r\/[\w_]+/g);
+
+        if (topicMatch && topicMatch[1].trim().length > 2) {
+            results.push({
+                topic: topicMatch[1].trim(),
+                growth: growthMatch ? growthMatch[0] : '',
+                subreddits: subredditMatch || []
+            });
+        }
+    });
+
+    // Dedupe
+    const seen = new Set();
+    const items = results.filter(t => {
+        if (seen.has(t.topic)) return false;
+        seen.add(t.topic);
+        return true;
+    });
+    return {layout, items};
+}
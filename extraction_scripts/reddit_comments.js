@@ -0,0 +1,12 @@
+// Text of the comments rendered on a Reddit thread. Returns {layout, items}.
+([selectors, maxComments]) => {
+    const layout = selectors.find((s) => document.querySelector(s)) || null;
+    const items = [];
+    document.querySelectorAll(selectors.join(', ')).forEach(el => {
+        const text = el.textContent || el.innerText;
+        if (text && text.length > 30 && text.length < 2000) {
+            items.push(text.trim());
+        }
+    });
+    return {layout, items: items.slice(0, maxComments)};
+}
@@ -0,0 +1,13 @@
+// One-shot extraction of the Reddit posts currently rendered.
+// The first selector with matches picks the layout. Returns {layout, items}.
+([selectors, maxPosts, titleChars, bodyChars]) => {
+    const layout = selectors.find((s) => document.querySelector(s)) || null;
+    const items = [];
+    if (!layout) return {layout, items};
+    for (const post of document.querySelectorAll(layout)) {
+        if (items.length >= maxPosts) break;
+        const raw = extractRedditPost(post, titleChars, bodyChars);
+        if (raw) items.push(raw);
+    }
+    return {layout, items};
+}
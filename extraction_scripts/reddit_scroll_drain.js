@@ -0,0 +1,11 @@
+// Extracts and empties the queue of post nodes added since the last call
+([titleChars, bodyChars]) => {
+    const state = window.__redditScroll;
+    if (!state) return [];
+    const results = [];
+    for (const post of state.queue.splice(0)) {
+        const raw = extractRedditPost(post, titleChars, bodyChars);
+        if (raw) results.push(raw);
+    }
+    return results;
+}
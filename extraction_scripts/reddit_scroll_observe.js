@@ -0,0 +1,27 @@
+// Queues post nodes (already rendered and added later) for reddit_scroll_drain.
+// The first selector with matches picks the layout, as one post can match
+// several. Returns that selector, or null if no layout has rendered yet.
+(selectors) => {
+    if (window.__redditScroll) window.__redditScroll.observer.disconnect();
+    const layout = selectors.find((s) => document.querySelector(s)) || null;
+    const selector = layout || selectors.join(', ');
+    const state = window.__redditScroll = {queue: [], seen: new WeakSet(), selector};
+    const enqueue = (node) => {
+        if (!state.seen.has(node)) {
+            state.seen.add(node);
+            state.queue.push(node);
+        }
+    };
+    document.querySelectorAll(selector).forEach(enqueue);
+    state.observer = new MutationObserver((mutations) => {
+        for (const mutation of mutations) {
+            for (const node of mutation.addedNodes) {
+                if (node.nodeType !== 1) continue;
+                if (node.matches(selector)) enqueue(node);
+                node.querySelectorAll(selector).forEach(enqueue);
+            }
+        }
+    });
+    state.observer.observe(document.body, {childList: true, subtree: true});
+    return layout;
+}
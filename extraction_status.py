@@ -0,0 +1,147 @@
+"""
+Structured results for DOM extraction scripts.
+
+An extraction script that finds nothing used to return an empty list, which
+looks exactly like a page with no results. Scripts now report which layout
+(selector) they matched, and empty extractions are classified:
+1. ok: items were extracted
+2. empty: the page rendered a known layout (or says "no results") but had
+   no items
+3. blocked: captcha, rate-limit or access-denied page
+4. layout_unknown: none of the expected selectors rendered
+
+Blocked and layout_unknown results are worth retrying; empty ones are not.
+Every extraction is counted per (label, layout) so yield per layout can be
+compared across runs.
+
+Extraction scripts (see script_registry) return
+`{layout: <matched selector or null>, items: [...]}`.
+
+Usage:
+    from extraction_status import extract_with_retry
+
+    result = await extract_with_retry(
+        page, "gummy_theme_posts", [GUMMY_POST_SELECTORS, 50], GUMMY_POST_SELECTORS, label="gummy_theme"
+    )
+    if result.ok:
+        posts = result.items
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+
+from page_waits import detect_block, wait_for_content
+from script_registry import run_script
+
+EXTRACTION_OK = "ok"
+EXTRACTION_EMPTY = "empty"
+EXTRACTION_BLOCKED = "blocked"
+EXTRACTION_LAYOUT_UNKNOWN = "layout_unknown"
+
+# Statuses that usually clear up on a retry
+RETRYABLE_STATUSES = (EXTRACTION_BLOCKED, EXTRACTION_LAYOUT_UNKNOWN)
+
+
+@dataclass
+class ExtractionResult:
+    """Items from one extraction plus what the page looked like."""
+    status: str
+    items: list = field(default_factory=list)
+    layout: str = ""  # Selector that matched, "" if none did
+    reason: str = ""  # Block reason (captcha, rate_limited, blocked)
+    attempts: int = 1
+
+    @property
+    def ok(self) -> bool:
+        return self.status == EXTRACTION_OK
+
+    def summary(self) -> str:
+        """Short status line for logs and tool results."""
+        text = f"status={self.status}, layout={self.layout or 'none'}"
+        if self.reason:
+            text += f", reason={self.reason}"
+        if self.attempts > 1:
+            text += f", attempts={self.attempts}"
+        return text
+
+
+@dataclass
+class LayoutYield:
+    """Extraction counts for one (label, layout) pair."""
+    calls: int = 0
+    items: int = 0
+    statuses: dict = field(default_factory=dict)
+
+    @property
+    def avg_items(self) -> float:
+        return self.items / self.calls if self.calls else 0.0
+
+
+# Per-(label, layout) extraction yield for the current process
+EXTRACTION_STATS: dict[tuple[str, str], LayoutYield] = {}
+
+
+def record_extraction(label: str, status: str, layout: str, item_count: int):
+    """Count one extraction towards its label/layout yield."""
+    stats = EXTRACTION_STATS.setdefault((label, layout or "none"), LayoutYield())
+    stats.calls += 1
+    stats.items += item_count
+    stats.statuses[status] = stats.statuses.get(status, 0) + 1
+
+
+async def classify_empty_page(page, layout: str, selectors: list[str]) -> tuple[str, str]:
+    """(status, block reason) for an extraction that returned no items."""
+    reason = await detect_block(page, selectors)
+    if reason in ("captcha", "rate_limited", "blocked"):
+        return EXTRACTION_BLOCKED, reason
+    if not layout and reason == "empty":
+        return EXTRACTION_LAYOUT_UNKNOWN, ""
+    return EXTRACTION_EMPTY, ""
+
+
+async def extract_with_retry(
+    page,
+    script: str,
+    arg,
+    selectors: list[str],
+    label: str = "extract",
+    retries: int = 2,
+    backoff: float = 2.0
+) -> ExtractionResult:
+    """
+    Run a registered extraction script by name, retrying blocked/layout-unknown
+    results after a backoff and a fresh wait for `selectors`.
+    """
+    for attempt in range(1, retries + 2):
+        output = await run_script(page, script, arg) or {}
+        items = output.get("items") or []
+        layout = output.get("layout") or ""
+
+        if items:
+            result = ExtractionResult(EXTRACTION_OK, items, layout, attempts=attempt)
+        else:
+            status, reason = await classify_empty_page(page, layout, selectors)
+            result = ExtractionResult(status, [], layout, reason, attempts=attempt)
+        record_extraction(label, result.status, layout, len(items))
+
+        if result.status not in RETRYABLE_STATUSES or attempt > retries:
+            return result
+        await asyncio.sleep(backoff * attempt)
+        await wait_for_content(page, selectors, label=f"{label}_retry")
+
+
+def format_extraction_stats() -> str:
+    """Format per-layout extraction yield as a markdown table."""
+    if not EXTRACTION_STATS:
+        return ""
+
+    lines = [
+        "| Extraction | Layout | Calls | Items | Avg items | Statuses |",
+        "|------------|--------|-------|-------|-----------|----------|",
+    ]
+    for (label, layout), stats in sorted(EXTRACTION_STATS.items()):
+        statuses = ", ".join(f"{status}: {count}" for status, count in sorted(stats.statuses.items()))
+        lines.append(
+            f"| {label} | `{layout}` | {stats.calls} | {stats.items} | {stats.avg_items:.1f} | {statuses} |"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,143 @@
+"""
+Content-addressed on-disk cache of LLM responses.
+
+AIPatternExtractor sends the same prompt again whenever the same posts are
+re-analyzed (regenerating a report, tweaking report formatting, re-running
+an offline analysis), and each call costs seconds of Gemini latency. The
+cache returns the earlier response instead:
+1. Keyed by a SHA-256 of the model name and the exact prompt text, so any
+   change to the posts, audience context or prompt wording is a miss
+2. Entries expire after a TTL
+3. Least-recently-used entries are evicted once the cache exceeds `max_bytes`
+4. Hit/miss counters for the current process
+
+Only responses the caller could use are stored (AIPatternExtractor puts a
+response after it parses), so a malformed reply is retried next run.
+
+Usage:
+    from llm_cache import LLMCache
+
+    cache = LLMCache(ttl_seconds=7 * 86400)
+    text = cache.get("gemini-3-flash-preview", prompt)
+    if text is None:
+        text = (await model.generate_content_async(prompt)).text
+        cache.put("gemini-3-flash-preview", prompt, text)
+"""
+
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_LLM_CACHE_PATH = Path(__file__).parent / ".cache" / "llm_cache.sqlite3"
+
+
+class LLMCache:
+    """SQLite-backed TTL cache of model responses keyed by prompt hash."""
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_LLM_CACHE_PATH,
+        ttl_seconds: float = 30 * 86400,
+        max_bytes: int = 50 * 1024 * 1024
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                size INTEGER NOT NULL,
+                response TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_cache(last_used)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, prompt: str) -> str:
+        """Build the cache key for a prompt sent to `model`."""
+        return hashlib.sha256(f"{model}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, model: str, prompt: str) -> Optional[str]:
+        """Return the cached response text, or None if missing or expired."""
+        key = self.make_key(model, prompt)
+        row = self._conn.execute(
+            "SELECT created_at, response FROM llm_cache WHERE key = ?", (key,)
+        ).fetchone()
+
+        now = time.time()
+        if row is None or now - row[0] > self.ttl_seconds:
+            if row is not None:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+            self.misses += 1
+            return None
+
+        self._conn.execute("UPDATE llm_cache SET last_used = ? WHERE key = ?", (now, key))
+        self._conn.commit()
+        self.hits += 1
+        return row[1]
+
+    def put(self, model: str, prompt: str, response: str):
+        """Store a response, evicting expired and old entries if over the size limit."""
+        now = time.time()
+        self._conn.execute(
+            """
+            INSERT OR REPLACE INTO llm_cache (key, model, created_at, last_used, size, response)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (self.make_key(model, prompt), model, now, now, len(response.encode("utf-8")), response)
+        )
+        self._evict(now)
+        self._conn.commit()
+
+    def _evict(self, now: float):
+        """Drop expired entries, then least-recently-used ones until the cache fits in `max_bytes`."""
+        self._conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        excess = total - self.max_bytes
+        doomed = []
+        for key, size in self._conn.execute("SELECT key, size FROM llm_cache ORDER BY last_used ASC"):
+            doomed.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM llm_cache WHERE key = ?", doomed)
+
+    def clear(self):
+        """Remove every cached response."""
+        self._conn.execute("DELETE FROM llm_cache")
+        self._conn.commit()
+
+    def stats(self) -> dict:
+        """Hit/miss counters for this process plus current cache size."""
+        entries, size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+        ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": entries,
+            "bytes": size,
+        }
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
@@ -0,0 +1,136 @@
+"""
+Near-duplicate detection for cross-posted Reddit threads.
+
+The same complaint is often cross-posted to several subreddits with a
+slightly different title. Exact IDs (post_index) can't catch that, so posts
+are clustered by the similarity of their text instead:
+1. Word shingles of the normalized title + body
+2. MinHash signatures estimate Jaccard similarity between shingle sets
+3. LSH banding finds candidate matches by bucket lookup, so each insert
+   only compares against a handful of candidates (no pairwise pass)
+4. Candidates above `threshold` estimated similarity join the same cluster
+
+Signatures are vectorized with NumPy when it is installed.
+
+Usage:
+    from near_duplicates import NearDuplicateIndex
+
+    index = NearDuplicateIndex(threshold=0.5)
+    for i, post in enumerate(posts):
+        index.add(i, post.title + " " + post.body)
+    clusters = index.clusters()
+"""
+
+import random
+import zlib
+
+from post_index import normalize_text
+
+# Try to import numpy for vectorized signatures
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+_MERSENNE_PRIME = (1 << 31) - 1
+
+
+def shingles(text: str, size: int = 3) -> set[int]:
+    """Hashed word `size`-grams of the normalized text (the whole text if shorter)."""
+    words = normalize_text(text).split()
+    if not words:
+        return set()
+    if len(words) <= size:
+        return {zlib.crc32(" ".join(words).encode("utf-8")) % _MERSENNE_PRIME}
+    return {
+        zlib.crc32(" ".join(words[i:i + size]).encode("utf-8")) % _MERSENNE_PRIME
+        for i in range(len(words) - size + 1)
+    }
+
+
+class NearDuplicateIndex:
+    """MinHash/LSH index clustering near-duplicate texts."""
+
+    def __init__(
+        self,
+        num_perm: int = 64,
+        bands: int = 16,
+        threshold: float = 0.5,
+        shingle_size: int = 3,
+        seed: int = 1
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+
+        rng = random.Random(seed)
+        self._a = [rng.randrange(1, _MERSENNE_PRIME) for _ in range(num_perm)]
+        self._b = [rng.randrange(0, _MERSENNE_PRIME) for _ in range(num_perm)]
+        if NUMPY_AVAILABLE:
+            self._a_np = np.array(self._a, dtype=np.uint64)[:, None]
+            self._b_np = np.array(self._b, dtype=np.uint64)[:, None]
+
+        self._buckets: list[dict[tuple, list]] = [{} for _ in range(bands)]
+        self._signatures: dict = {}
+        self._parent: dict = {}
+
+    def signature(self, text: str) -> tuple[int, ...]:
+        """MinHash signature of the text's shingles (empty if the text has no words)."""
+        hashes = shingles(text, self.shingle_size)
+        if not hashes:
+            return ()
+        if NUMPY_AVAILABLE:
+            x = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+            return tuple(((self._a_np * x + self._b_np) % _MERSENNE_PRIME).min(axis=1).tolist())
+        return tuple(
+            min((a * x + b) % _MERSENNE_PRIME for x in hashes)
+            for a, b in zip(self._a, self._b)
+        )
+
+    def similarity(self, sig_a: tuple, sig_b: tuple) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        return sum(x == y for x, y in zip(sig_a, sig_b)) / self.num_perm
+
+    def _find(self, key):
+        parent = self._parent
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    def add(self, key, text: str):
+        """Index `text` under `key`, joining the cluster of any near-duplicate already indexed."""
+        sig = self.signature(text)
+        self._parent[key] = key
+        if not sig:
+            return
+
+        candidates = set()
+        for band in range(self.bands):
+            band_key = sig[band * self.rows:(band + 1) * self.rows]
+            bucket = self._buckets[band].setdefault(band_key, [])
+            candidates.update(bucket)
+            bucket.append(key)
+
+        for other in candidates:
+            if self.similarity(sig, self._signatures[other]) >= self.threshold:
+                root, other_root = self._find(key), self._find(other)
+                if root != other_root:
+                    self._parent[root] = other_root
+        self._signatures[key] = sig
+
+    def cluster_of(self, key):
+        """Representative key of the cluster `key` belongs to."""
+        return self._find(key)
+
+    def clusters(self) -> dict:
+        """Cluster root -> member keys (in insertion order)."""
+        groups = {}
+        for key in self._parent:
+            groups.setdefault(self._find(key), []).append(key)
+        return groups
@@ -0,0 +1,124 @@
+"""
+Offline HTML snapshot corpus of scraped pages.
+
+Extraction can only be measured against live Reddit/GummySearch pages, which
+change, rate-limit and block. Snapshots freeze what a scrape actually saw:
+1. `capture()` saves the rendered DOM (scripts stripped, so a replayed page
+   can't re-hydrate or navigate away) as `<label>/<stamp>-<hash>.html`
+   (`-2`, `-3`, ... appended when the same URL is captured twice in a second)
+2. A JSON sidecar records the URL, the script_registry script and argument
+   that extracted it, the layout that matched and how many items it returned
+3. snapshot_replay serves the corpus back to a headless browser and
+   benchmarks the current extraction scripts against it
+
+Usage:
+    from page_snapshots import SnapshotStore
+
+    store = SnapshotStore("snapshots")
+    await store.capture(page, "gummy_topics", "gummy_topics", GUMMY_TOPIC_SELECTORS, result.layout, len(result.items))
+    for snapshot in store.snapshots(labels=["gummy_topics"]):
+        print(snapshot.url, snapshot.item_count)
+"""
+
+import hashlib
+import json
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+from script_registry import REGISTRY
+
+DEFAULT_SNAPSHOT_DIR = Path(__file__).parent / "snapshots"
+
+# Rendered DOM without scripts, plus the URL it was loaded from
+SNAPSHOT_HTML_JS = """
+() => {
+    const root = document.documentElement.cloneNode(true);
+    root.querySelectorAll('script, iframe, link[rel="preload"], link[rel="modulepreload"]').forEach((el) => el.remove());
+    return {url: location.href, html: '<!DOCTYPE html>\\n' + root.outerHTML};
+}
+"""
+
+
+@dataclass
+class Snapshot:
+    """Metadata for one saved page."""
+    label: str
+    url: str
+    script: str
+    arg: object
+    layout: str
+    item_count: int
+    captured_at: float
+    script_version: str
+    html_file: str  # Relative to the store directory
+
+
+class SnapshotStore:
+    """Directory of saved pages grouped by extraction label."""
+
+    def __init__(self, directory: Path | str = DEFAULT_SNAPSHOT_DIR):
+        self.directory = Path(directory)  # Created by the first capture, not by replay
+        self.captured = 0
+
+    async def capture(
+        self,
+        page,
+        label: str,
+        script: str,
+        arg=None,
+        layout: str = "",
+        item_count: int = 0
+    ) -> Optional[Path]:
+        """
+        Save the page's current DOM with the extraction that ran on it.
+        Returns the HTML path, or None if the page couldn't be serialized
+        (snapshots never interrupt a scrape).
+        """
+        try:
+            output = await page.evaluate(SNAPSHOT_HTML_JS) or {}
+        except Exception:
+            return None
+        html = output.get("html")
+        if not html:
+            return None
+
+        url = output.get("url", "")
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        name = f"{stamp}-{hashlib.sha1(url.encode('utf-8')).hexdigest()[:8]}"
+        html_path = self.directory / label / f"{name}.html"
+        html_path.parent.mkdir(parents=True, exist_ok=True)
+        copy = 1
+        while html_path.exists():
+            copy += 1
+            html_path = html_path.with_name(f"{name}-{copy}.html")
+        html_path.write_text(html, encoding="utf-8")
+
+        snapshot = Snapshot(
+            label=label,
+            url=url,
+            script=script,
+            arg=arg,
+            layout=layout or "",
+            item_count=item_count,
+            captured_at=time.time(),
+            script_version=REGISTRY.scripts[script].version,
+            html_file=html_path.relative_to(self.directory).as_posix(),
+        )
+        html_path.with_suffix(".json").write_text(json.dumps(asdict(snapshot), indent=2), encoding="utf-8")
+        self.captured += 1
+        return html_path
+
+    def snapshots(self, labels: Optional[list[str]] = None) -> list[Snapshot]:
+        """Saved snapshots (optionally only some labels), oldest first."""
+        found = []
+        for path in sorted(self.directory.glob("*/*.json")):
+            if labels and path.parent.name not in labels:
+                continue
+            try:
+                found.append(Snapshot(**json.loads(path.read_text(encoding="utf-8"))))
+            except (ValueError, TypeError):
+                continue
+        found.sort(key=lambda s: s.captured_at)
+        return found
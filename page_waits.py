@@ -0,0 +1,232 @@
+"""
+Readiness-based waiting for scraping paths.
+
+Instead of `wait_until="networkidle"` plus fixed `wait_for_timeout` sleeps,
+pages are scraped as soon as their content is actually there:
+1. Wait for the post/item selectors a page is expected to render
+2. Or, when there is nothing specific to wait for, wait for DOM-mutation
+   quiescence (no DOM changes for `quiet_ms`)
+3. Every wait is capped by a timeout and timed per label
+4. Pages that never got ready are checked for block/captcha pages, and
+   goto_with_backoff retries them behind a shared per-host rate limiter
+
+Usage:
+    from page_waits import REDDIT_POST_SELECTORS, goto_and_wait, format_wait_stats
+
+    await goto_and_wait(page, url, REDDIT_POST_SELECTORS, label="reddit_search")
+    print(format_wait_stats())
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+from search_scheduler import BlockedError, HostRateLimiter
+
+# Selectors that mean "the content we scrape has rendered"
+REDDIT_POST_SELECTORS = [
+    'shreddit-post',
+    '[data-testid="post-container"]',
+    'article',
+    '.Post',
+    '.thing.link',
+]
+REDDIT_COMMENT_SELECTORS = ['shreddit-comment', '[data-testid="comment"]', '.comment']
+GUMMY_POST_SELECTORS = ['li[role="listitem"]', '[role="listitem"]']
+GUMMY_PATTERN_SELECTORS = ['[class*="pattern"]', '[data-pattern]']
+GUMMY_TOPIC_SELECTORS = ['a[href*="/topics/"]']
+GUMMY_THEME_SELECTORS = ['a[href*="/themes/"]']
+
+# Resolves true once any element matches the selector, false on timeout
+SELECTOR_READY_JS = """
+([selector, timeoutMs]) => new Promise((resolve) => {
+    if (document.querySelector(selector)) return resolve(true);
+    const observer = new MutationObserver(() => {
+        if (document.querySelector(selector)) {
+            observer.disconnect();
+            clearTimeout(cap);
+            resolve(true);
+        }
+    });
+    observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true});
+    const cap = setTimeout(() => { observer.disconnect(); resolve(false); }, timeoutMs);
+})
+"""
+
+# Resolves true once the DOM has been quiet for quietMs, false on timeout
+DOM_QUIET_JS = """
+([quietMs, timeoutMs]) => new Promise((resolve) => {
+    let quiet;
+    const done = (result) => {
+        observer.disconnect();
+        clearTimeout(quiet);
+        clearTimeout(cap);
+        resolve(result);
+    };
+    const observer = new MutationObserver(() => {
+        clearTimeout(quiet);
+        quiet = setTimeout(() => done(true), quietMs);
+    });
+    observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+    quiet = setTimeout(() => done(true), quietMs);
+    const cap = setTimeout(() => done(false), timeoutMs);
+})
+"""
+
+# Returns why a page looks blocked ("captcha", "rate_limited", "blocked",
+# "empty") or null. "empty" means none of `selectors` rendered and the page
+# doesn't say it simply has no results.
+BLOCK_CHECK_JS = """
+(selectors) => {
+    const text = ((document.title || '') + ' ' + (document.body?.innerText || '')).toLowerCase().slice(0, 5000);
+    if (/captcha|verify you are human|are you a robot|checking your browser|just a moment/.test(text)) return 'captcha';
+    if (/too many requests|whoa there, pardner|rate limit/.test(text)) return 'rate_limited';
+    if (/you've been blocked|you have been blocked|access denied|request blocked/.test(text)) return 'blocked';
+    if (selectors.length && !document.querySelector(selectors.join(', '))
+        && !/no results|couldn't find any|no posts/.test(text)) return 'empty';
+    return null;
+}
+"""
+
+
+@dataclass
+class WaitStats:
+    """Timing stats for one wait label."""
+    calls: int = 0
+    ready: int = 0
+    timeouts: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+
+# Per-label wait timings for the current process
+WAIT_STATS: dict[str, WaitStats] = {}
+
+
+def _record(label: str, started: float, ready: bool):
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    stats = WAIT_STATS.setdefault(label, WaitStats())
+    stats.calls += 1
+    stats.total_ms += elapsed_ms
+    stats.max_ms = max(stats.max_ms, elapsed_ms)
+    if ready:
+        stats.ready += 1
+    else:
+        stats.timeouts += 1
+
+
+async def wait_for_quiet(
+    page,
+    label: str = "quiet",
+    quiet_ms: int = 500,
+    timeout_ms: int = 5000
+) -> bool:
+    """Wait until the DOM stops changing. Returns False if it timed out."""
+    started = time.perf_counter()
+    try:
+        ready = bool(await page.evaluate(DOM_QUIET_JS, [quiet_ms, timeout_ms]))
+    except Exception:
+        ready = False
+    _record(label, started, ready)
+    return ready
+
+
+async def wait_for_content(
+    page,
+    selectors: list[str] = None,
+    label: str = "content",
+    timeout_ms: int = 10000,
+    quiet_ms: int = 500
+) -> bool:
+    """
+    Wait until any of `selectors` matches, or for DOM quiescence if no
+    selectors are given. Returns False if the wait timed out.
+    """
+    if not selectors:
+        return await wait_for_quiet(page, label, quiet_ms, timeout_ms)
+
+    started = time.perf_counter()
+    try:
+        ready = bool(await page.evaluate(SELECTOR_READY_JS, [", ".join(selectors), timeout_ms]))
+    except Exception:
+        ready = False
+    _record(label, started, ready)
+    return ready
+
+
+async def goto_and_wait(
+    page,
+    url: str,
+    selectors: list[str] = None,
+    label: str = "page",
+    timeout_ms: int = 10000
+) -> bool:
+    """Navigate to `url` and wait for its content to be ready."""
+    await page.goto(url, wait_until="domcontentloaded")
+    return await wait_for_content(page, selectors, label, timeout_ms)
+
+
+async def detect_block(page, selectors: list[str] = None) -> str | None:
+    """Why the current page looks blocked, or None if it looks fine."""
+    try:
+        return await page.evaluate(BLOCK_CHECK_JS, selectors or [])
+    except Exception:
+        return None
+
+
+async def goto_with_backoff(
+    page,
+    url: str,
+    selectors: list[str] = None,
+    label: str = "page",
+    limiter: HostRateLimiter = None,
+    max_retries: int = 2,
+    timeout_ms: int = 10000
+) -> bool:
+    """
+    goto_and_wait paced by a per-host rate limiter. Pages that never get
+    ready and show a captcha, rate-limit or access-denied page slow the host
+    down and are retried with jittered backoff; raises BlockedError once
+    retries run out. (Pages that are merely empty don't count here, since
+    many pages legitimately lack `selectors`, e.g. a login page when
+    already logged in.)
+    """
+    host = urlparse(url).netloc
+    for attempt in range(max_retries + 1):
+        if limiter:
+            await limiter.acquire(host)
+        ready = await goto_and_wait(page, url, selectors, label, timeout_ms)
+        reason = None if ready else await detect_block(page)
+        if reason is None:
+            if limiter:
+                limiter.report_success(host)
+            return ready
+
+        if limiter:
+            limiter.report_block(host)
+        if attempt == max_retries:
+            raise BlockedError(f"{host}: {reason}")
+        delay = limiter.backoff_delay(host, attempt) if limiter else 2.0 ** attempt
+        await asyncio.sleep(delay)
+
+
+def format_wait_stats() -> str:
+    """Format per-label wait timings as a markdown table."""
+    if not WAIT_STATS:
+        return ""
+
+    lines = [
+        "| Wait | Calls | Ready | Timeouts | Avg ms | Max ms |",
+        "|------|-------|-------|----------|--------|--------|",
+    ]
+    for label, stats in sorted(WAIT_STATS.items()):
+        lines.append(
+            f"| {label} | {stats.calls} | {stats.ready} | {stats.timeouts} "
+            f"| {stats.avg_ms:.0f} | {stats.max_ms:.0f} |"
+        )
+    return "\n".join(lines)
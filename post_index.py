@@ -0,0 +1,163 @@
+"""
+Stable post identity and a persistent dedupe index.
+
+The same post often comes back from several queries, intents and runs. Every
+post gets one canonical ID so it is classified, scored and stored once:
+1. Permalink-derived ID (`t3_<base36 id>`) whenever the URL has one
+2. Otherwise a hash of the normalized subreddit/title/body, so case,
+   punctuation and whitespace differences don't create new posts, while
+   different posts that share a title still get different IDs
+3. PostIndex keeps every post it has seen (in SQLite) across runs, plus
+   per-(subreddit, query) high-water marks for incremental refreshes
+
+Usage:
+    from post_index import PostIndex, canonical_post_id
+
+    post_id = canonical_post_id(raw["url"], raw["title"], raw["body"], "SaaS")
+    index = PostIndex()
+    stored = index.get(post_id)
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_INDEX_PATH = Path(__file__).parent / ".cache" / "post_index.sqlite3"
+
+_PERMALINK_ID = re.compile(r"/comments/([a-z0-9]+)", re.IGNORECASE)
+_NON_WORD = re.compile(r"[^\w]+")
+
+# Only the start of the body is hashed: backends truncate bodies at different lengths
+_HASH_BODY_CHARS = 200
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    return _NON_WORD.sub(" ", (text or "").lower()).strip()
+
+
+def canonical_post_id(url: str = "", title: str = "", body: str = "", subreddit: str = "") -> str:
+    """
+    Canonical ID for a post: `t3_<id>` from its permalink, or `h_<hash>` of
+    its normalized content when there is no permalink.
+    """
+    match = _PERMALINK_ID.search(url or "")
+    if match:
+        return f"t3_{match.group(1).lower()}"
+
+    content = "\n".join([
+        normalize_text(subreddit),
+        normalize_text(title),
+        normalize_text(body)[:_HASH_BODY_CHARS],
+    ])
+    return "h_" + hashlib.sha1(content.encode("utf-8")).hexdigest()[:16]
+
+
+class PostIndex:
+    """SQLite-backed index of every post seen, keyed by canonical post ID."""
+
+    def __init__(self, path: Path | str = DEFAULT_INDEX_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.known = 0
+        self.added = 0
+
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS posts (
+                post_id TEXT PRIMARY KEY,
+                subreddit TEXT NOT NULL,
+                title TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                payload TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_subreddit ON posts(subreddit COLLATE NOCASE)")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS high_water_marks (
+                subreddit TEXT NOT NULL,
+                query TEXT NOT NULL,
+                post_id TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (subreddit, query)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, post_id: str) -> Optional[dict]:
+        """Return the stored post dict, or None if the post hasn't been seen."""
+        row = self._conn.execute("SELECT payload FROM posts WHERE post_id = ?", (post_id,)).fetchone()
+        if row is None:
+            return None
+        self.known += 1
+        return json.loads(row[0])
+
+    def __contains__(self, post_id: str) -> bool:
+        return self._conn.execute("SELECT 1 FROM posts WHERE post_id = ?", (post_id,)).fetchone() is not None
+
+    def put_many(self, posts: list[dict]):
+        """Insert or refresh post dicts (each must have a `post_id`)."""
+        now = time.time()
+        rows = [
+            (p["post_id"], p.get("subreddit", ""), p.get("title", ""), now, now, json.dumps(p))
+            for p in posts
+        ]
+        before = self._conn.total_changes
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO posts (post_id, subreddit, title, first_seen, last_seen, payload) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            rows
+        )
+        self.added += self._conn.total_changes - before
+        self._conn.executemany(
+            "UPDATE posts SET last_seen = ?, payload = ? WHERE post_id = ?",
+            [(now, payload, post_id) for post_id, _, _, _, _, payload in rows]
+        )
+        self._conn.commit()
+
+    def posts_in(self, subreddits: list[str]) -> list[dict]:
+        """All stored post dicts from the given subreddits (case-insensitive)."""
+        if not subreddits:
+            return []
+        placeholders = ", ".join("?" for _ in subreddits)
+        rows = self._conn.execute(
+            f"SELECT payload FROM posts WHERE subreddit COLLATE NOCASE IN ({placeholders}) ORDER BY first_seen",
+            subreddits
+        )
+        return [json.loads(payload) for (payload,) in rows]
+
+    def get_high_water(self, subreddit: str, query: str) -> Optional[tuple[str, str]]:
+        """(post_id, timestamp) of the newest post seen for a subreddit/query, if any."""
+        row = self._conn.execute(
+            "SELECT post_id, timestamp FROM high_water_marks WHERE subreddit = ? AND query = ?",
+            (subreddit.lower(), query)
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def set_high_water(self, subreddit: str, query: str, post_id: str, timestamp: str):
+        """Record the newest post seen for a subreddit/query."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO high_water_marks (subreddit, query, post_id, timestamp, updated_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (subreddit.lower(), query, post_id, timestamp, time.time())
+        )
+        self._conn.commit()
+
+    def stats(self) -> dict:
+        """Known/added counters for this process plus the total indexed posts."""
+        entries = self._conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+        return {"known": self.known, "added": self.added, "entries": entries}
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
@@ -0,0 +1,302 @@
+"""
+Persistent warehouse of scored posts for offline analysis.
+
+RedditSaaSFinder.posts only lives for one process, so every question about
+older data meant scraping again. The warehouse keeps every scored post:
+1. One row per canonical post ID, upserted in one transaction per scraped
+   batch (engagement counts and scores refresh; first_seen is kept, and the
+   stored title/body only change when a later fetch returns non-empty text)
+2. Indexed subreddit, validation score and posted-at columns, plus a
+   post_intents table indexed by intent, for filtered/top-N queries
+3. An FTS5 index over title/body (when SQLite has FTS5) kept in sync by
+   triggers; only rows whose text changed are reindexed
+4. `posts()` returns post dicts (post_to_dict format) so the finder can run
+   find_patterns, get_top_validated_ideas and reports without scraping
+5. `search()` ranks full-text matches by BM25 (title weighted over body)
+   under the same filters
+
+Usage:
+    from post_warehouse import PostWarehouse
+
+    warehouse = PostWarehouse()
+    warehouse.put_posts([post_to_dict(p) for p in posts])
+    recent = warehouse.posts(subreddits=["SaaS"], since=time.time() - 90 * 86400)
+    matches = warehouse.search('invoic* "would pay"', intents=["willingness_to_pay"], limit=50)
+"""
+
+import json
+import re
+import sqlite3
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_WAREHOUSE_PATH = Path(__file__).parent / ".cache" / "post_warehouse.sqlite3"
+
+# BM25 column weights for (title, body): a match in the title counts more
+_BM25_WEIGHTS = (4.0, 1.0)
+
+_QUERY_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def _fts5_available() -> bool:
+    try:
+        sqlite3.connect(":memory:").execute("CREATE VIRTUAL TABLE probe USING fts5(text)")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+FTS5_AVAILABLE = _fts5_available()
+
+_COLUMNS = (
+    "post_id", "subreddit", "title", "body", "author", "url", "timestamp", "created_utc",
+    "upvotes", "comments", "validation_score", "intents", "payment_signals", "pain_signals",
+    "first_seen", "last_seen",
+)
+
+
+def _created_utc(timestamp: str) -> Optional[float]:
+    """Epoch seconds of an ISO post timestamp (naive ones are taken as UTC), or None."""
+    if not timestamp:
+        return None
+    try:
+        parsed = datetime.fromisoformat(timestamp)
+    except ValueError:
+        return None
+    return (parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)).timestamp()
+
+
+class PostWarehouse:
+    """SQLite store of scored posts with indexed filters and full-text search."""
+
+    def __init__(self, path: Path | str = DEFAULT_WAREHOUSE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.written = 0
+
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS posts (
+                post_id TEXT PRIMARY KEY,
+                subreddit TEXT NOT NULL,
+                title TEXT NOT NULL,
+                body TEXT NOT NULL,
+                author TEXT NOT NULL,
+                url TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                created_utc REAL,
+                upvotes INTEGER NOT NULL,
+                comments INTEGER NOT NULL,
+                validation_score REAL NOT NULL,
+                intents TEXT NOT NULL,
+                payment_signals TEXT NOT NULL,
+                pain_signals TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_wh_subreddit ON posts(subreddit COLLATE NOCASE);
+            CREATE INDEX IF NOT EXISTS idx_wh_score ON posts(validation_score);
+            CREATE INDEX IF NOT EXISTS idx_wh_created ON posts(created_utc);
+            CREATE TABLE IF NOT EXISTS post_intents (
+                post_id TEXT NOT NULL,
+                intent TEXT NOT NULL,
+                PRIMARY KEY (post_id, intent)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_wh_intent ON post_intents(intent, post_id);
+            """
+        )
+        if FTS5_AVAILABLE:
+            self._conn.executescript(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+                    title, body, content='posts', content_rowid='rowid', tokenize='porter unicode61'
+                );
+                CREATE TRIGGER IF NOT EXISTS posts_fts_insert AFTER INSERT ON posts BEGIN
+                    INSERT INTO posts_fts(rowid, title, body) VALUES (new.rowid, new.title, new.body);
+                END;
+                CREATE TRIGGER IF NOT EXISTS posts_fts_delete AFTER DELETE ON posts BEGIN
+                    INSERT INTO posts_fts(posts_fts, rowid, title, body) VALUES ('delete', old.rowid, old.title, old.body);
+                END;
+                DROP TRIGGER IF EXISTS posts_fts_update;
+                CREATE TRIGGER posts_fts_update AFTER UPDATE OF title, body ON posts
+                WHEN old.title IS NOT new.title OR old.body IS NOT new.body BEGIN
+                    INSERT INTO posts_fts(posts_fts, rowid, title, body) VALUES ('delete', old.rowid, old.title, old.body);
+                    INSERT INTO posts_fts(rowid, title, body) VALUES (new.rowid, new.title, new.body);
+                END;
+                """
+            )
+        self._conn.commit()
+
+    def put_posts(self, posts: list[dict]):
+        """Upsert post dicts (post_to_dict format, each with a `post_id`) in one transaction."""
+        if not posts:
+            return
+        now = time.time()
+        rows = [
+            (
+                p["post_id"], p.get("subreddit", ""), p.get("title", ""), p.get("body") or "",
+                p.get("author") or "", p.get("url") or "", p.get("timestamp") or "",
+                _created_utc(p.get("timestamp")), int(p.get("upvotes") or 0), int(p.get("comments") or 0),
+                float(p.get("validation_score") or 0.0), " ".join(p.get("intents", [])),
+                json.dumps(p.get("payment_signals", [])), json.dumps(p.get("pain_signals", [])), now, now,
+            )
+            for p in posts
+        ]
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        # A browser scrape stores new-Reddit posts without a body; a later JSON
+        # fetch of the same ID fills it in. Empty incoming text never overwrites
+        # stored text, and unchanged text leaves the FTS index alone.
+        updates = ", ".join(
+            f"{column} = excluded.{column}" for column in _COLUMNS
+            if column not in ("post_id", "title", "body", "first_seen")
+        ) + "".join(
+            f", {column} = CASE WHEN excluded.{column} <> '' THEN excluded.{column} ELSE posts.{column} END"
+            for column in ("title", "body")
+        )
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT INTO posts ({', '.join(_COLUMNS)}) VALUES ({placeholders}) "
+                f"ON CONFLICT(post_id) DO UPDATE SET {updates}",
+                rows
+            )
+            self._conn.executemany("DELETE FROM post_intents WHERE post_id = ?", [(p["post_id"],) for p in posts])
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO post_intents (post_id, intent) VALUES (?, ?)",
+                [(p["post_id"], intent) for p in posts for intent in p.get("intents", [])]
+            )
+        self.written += len(rows)
+
+    def _filters(
+        self,
+        subreddits: Optional[list[str]],
+        intents: Optional[list[str]],
+        since: Optional[float],
+        min_score: Optional[float]
+    ) -> tuple[str, list]:
+        clauses, params = [], []
+        if subreddits:
+            clauses.append(f"p.subreddit COLLATE NOCASE IN ({', '.join('?' for _ in subreddits)})")
+            params += subreddits
+        if intents:
+            clauses.append(
+                f"p.post_id IN (SELECT post_id FROM post_intents WHERE intent IN ({', '.join('?' for _ in intents)}))"
+            )
+            params += intents
+        if since is not None:
+            clauses.append("p.created_utc >= ?")
+            params.append(since)
+        if min_score is not None:
+            clauses.append("p.validation_score >= ?")
+            params.append(min_score)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def posts(
+        self,
+        subreddits: Optional[list[str]] = None,
+        intents: Optional[list[str]] = None,
+        since: Optional[float] = None,
+        min_score: Optional[float] = None,
+        limit: Optional[int] = None
+    ) -> list[dict]:
+        """
+        Stored post dicts, best score first, filtered by subreddit
+        (case-insensitive), any of `intents`, posted at or after `since`
+        (epoch seconds) and minimum validation score.
+        """
+        where, params = self._filters(subreddits, intents, since, min_score)
+        sql = (
+            "SELECT p.post_id, p.subreddit, p.title, p.body, p.author, p.url, p.timestamp, p.upvotes, p.comments, "
+            f"p.validation_score, p.intents, p.payment_signals, p.pain_signals FROM posts p{where} "
+            "ORDER BY p.validation_score DESC"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [self._row_to_post(row) for row in self._conn.execute(sql, params)]
+
+    def search(
+        self,
+        text: str,
+        subreddits: Optional[list[str]] = None,
+        intents: Optional[list[str]] = None,
+        since: Optional[float] = None,
+        min_score: Optional[float] = None,
+        limit: int = 50
+    ) -> list[tuple[dict, float]]:
+        """
+        Full-text search: (post dict, relevance) pairs, most relevant first.
+        `text` is FTS5 query syntax (`invoic* AND "would pay"`); if it doesn't
+        parse, its words are matched as plain terms instead. Without FTS5,
+        posts containing every word are returned best score first.
+        """
+        where, params = self._filters(subreddits, intents, since, min_score)
+        columns = (
+            "p.post_id, p.subreddit, p.title, p.body, p.author, p.url, p.timestamp, p.upvotes, p.comments, "
+            "p.validation_score, p.intents, p.payment_signals, p.pain_signals"
+        )
+
+        if not FTS5_AVAILABLE:
+            words = _QUERY_TOKEN.findall(text)
+            if not words:
+                return []
+            for word in words:
+                where += (" AND " if where else " WHERE ") + "(p.title LIKE ? OR p.body LIKE ?)"
+                params += [f"%{word}%", f"%{word}%"]
+            rows = self._conn.execute(
+                f"SELECT {columns}, p.validation_score FROM posts p{where} "
+                "ORDER BY p.validation_score DESC LIMIT ?",
+                params + [limit]
+            )
+            return [(self._row_to_post(row[:-1]), row[-1]) for row in rows]
+
+        # bm25() is lower for better matches; negate it so higher means more relevant
+        sql = (
+            f"SELECT {columns}, -bm25(posts_fts, {_BM25_WEIGHTS[0]}, {_BM25_WEIGHTS[1]}) AS relevance "
+            "FROM posts_fts JOIN posts p ON p.rowid = posts_fts.rowid "
+            "WHERE posts_fts MATCH ?" + where.replace(" WHERE ", " AND ", 1) +
+            " ORDER BY relevance DESC LIMIT ?"
+        )
+        try:
+            rows = self._conn.execute(sql, [text] + params + [limit]).fetchall()
+        except sqlite3.OperationalError:
+            plain = " ".join(f'"{word}"' for word in _QUERY_TOKEN.findall(text))
+            if not plain:
+                return []
+            rows = self._conn.execute(sql, [plain] + params + [limit]).fetchall()
+        return [(self._row_to_post(row[:-1]), row[-1]) for row in rows]
+
+    @staticmethod
+    def _row_to_post(row: tuple) -> dict:
+        (post_id, subreddit, title, body, author, url, timestamp, upvotes, comments,
+         score, intents, payment_signals, pain_signals) = row
+        return {
+            "title": title,
+            "body": body,
+            "subreddit": subreddit,
+            "author": author,
+            "upvotes": upvotes,
+            "comments": comments,
+            "url": url,
+            "timestamp": timestamp,
+            "intents": intents.split(),
+            "validation_score": score,
+            "payment_signals": json.loads(payment_signals),
+            "pain_signals": json.loads(pain_signals),
+            "post_id": post_id,
+        }
+
+    def stats(self) -> dict:
+        """Posts written this process, total stored posts and subreddits."""
+        entries, subreddits = self._conn.execute(
+            "SELECT COUNT(*), COUNT(DISTINCT subreddit COLLATE NOCASE) FROM posts"
+        ).fetchone()
+        return {"written": self.written, "entries": entries, "subreddits": subreddits}
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
@@ -0,0 +1,200 @@
+"""
+Fetch backends for RedditSaaSFinder search results.
+
+Rendering full Reddit search pages and scraping the DOM is slow and only
+yields titles on new Reddit. The JSON backend pulls the `.json` listing
+endpoints over a pooled async HTTP client instead:
+1. Paginates with `after` until `max_posts` posts are collected, or until
+   a `stop_when` post is reached (e.g. one an incremental refresh has
+   already seen)
+2. Returns bodies (selftext), timestamps and permalinks
+3. Raises RedditFetchError on bad responses (RedditBlockedError when rate
+   limited/blocked) so callers can back off or fall back to the browser
+
+`base_url` can point at a local fixture server for testing.
+
+Usage:
+    from reddit_backends import RedditJsonBackend
+
+    backend = RedditJsonBackend()
+    raw_posts = await backend.search("SaaS", "looking for tool", max_posts=50)
+    await backend.close()
+"""
+
+from datetime import datetime, timezone
+from typing import AsyncIterator, Callable, Optional
+
+from search_scheduler import BlockedError
+
+# Try to import httpx (pulled in by browser-use/gradio)
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+REDDIT_BASE_URL = "https://www.reddit.com"
+DEFAULT_USER_AGENT = "python:reddit-saas-finder:0.1.0"
+
+# Backend names accepted by RedditSaaSFinder(fetch_mode=...)
+FETCH_MODES = ("browser", "json", "auto")
+
+
+class RedditFetchError(Exception):
+    """Raised when a backend can't fetch results (blocked, bad status, bad payload)."""
+
+
+class RedditBlockedError(RedditFetchError, BlockedError):
+    """Raised when Reddit rate-limits or blocks the client (HTTP 429/403)."""
+
+
+def listing_to_raw_post(data: dict) -> dict:
+    """Convert a Reddit listing child's `data` into the raw post dict the DOM scraper returns."""
+    created = data.get("created_utc")
+    timestamp = (
+        datetime.fromtimestamp(created, tz=timezone.utc).isoformat() if created else ""
+    )
+    return {
+        "title": (data.get("title") or "")[:300],
+        "body": (data.get("selftext") or "")[:1000],
+        "upvotes": int(data.get("score") or 0),
+        "comments": int(data.get("num_comments") or 0),
+        "author": data.get("author") or "",
+        "timestamp": timestamp,
+        "url": data.get("permalink") or "",
+    }
+
+
+class RedditJsonBackend:
+    """
+    Fetches subreddit search results from Reddit's JSON listing endpoints.
+    One pooled HTTP client is shared by all searches.
+    """
+
+    name = "json"
+
+    def __init__(
+        self,
+        base_url: str = REDDIT_BASE_URL,
+        page_size: int = 100,
+        timeout: float = 15.0,
+        max_connections: int = 8,
+        user_agent: str = DEFAULT_USER_AGENT
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.page_size = min(page_size, 100)  # Reddit caps listings at 100 per page
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.user_agent = user_agent
+        self._client = None
+
+    def _get_client(self):
+        if not HTTPX_AVAILABLE:
+            raise RedditFetchError("httpx not installed")
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={"User-Agent": self.user_agent},
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                ),
+            )
+        return self._client
+
+    async def _get_listing(self, path: str, params: dict) -> dict:
+        client = self._get_client()
+        try:
+            response = await client.get(path, params=params)
+        except httpx.HTTPError as e:
+            raise RedditFetchError(f"request failed: {e}") from e
+
+        if response.status_code in (403, 429):
+            retry_after = response.headers.get("Retry-After", "")
+            raise RedditBlockedError(
+                f"HTTP {response.status_code} for {path}",
+                retry_after=float(retry_after) if retry_after.isdigit() else None
+            )
+        if response.status_code != 200:
+            raise RedditFetchError(f"HTTP {response.status_code} for {path}")
+
+        try:
+            payload = response.json()
+        except ValueError as e:
+            raise RedditFetchError(f"non-JSON response for {path}") from e
+
+        if not isinstance(payload, dict) or payload.get("kind") != "Listing":
+            raise RedditFetchError(f"unexpected payload for {path}")
+        return payload["data"]
+
+    async def iter_pages(
+        self,
+        subreddit: str,
+        query: str,
+        sort: str = "relevance",
+        time_filter: str = "year",
+        max_posts: int = 25,
+        stop_when: Optional[Callable[[dict], bool]] = None
+    ) -> AsyncIterator[list[dict]]:
+        """Yield each page of search results as soon as it arrives (same stopping rules as `search`)."""
+        collected = 0
+        after = None
+
+        while collected < max_posts:
+            params = {
+                "q": query,
+                "restrict_sr": 1,
+                "sort": sort,
+                "t": time_filter,
+                "limit": min(self.page_size, max_posts - collected),
+                "raw_json": 1,
+            }
+            if after:
+                params["after"] = after
+
+            listing = await self._get_listing(f"/r/{subreddit}/search.json", params)
+
+            page = []
+            stopped = False
+            for child in listing.get("children", []):
+                raw = listing_to_raw_post(child.get("data", {}))
+                if stop_when and stop_when(raw):
+                    stopped = True
+                    break
+                if len(raw["title"]) > 10:
+                    page.append(raw)
+
+            page = page[:max_posts - collected]
+            if page:
+                collected += len(page)
+                yield page
+
+            after = listing.get("after")
+            if stopped or not after or not listing.get("children"):
+                break
+
+    async def search(
+        self,
+        subreddit: str,
+        query: str,
+        sort: str = "relevance",
+        time_filter: str = "year",
+        max_posts: int = 25,
+        stop_when: Optional[Callable[[dict], bool]] = None
+    ) -> list[dict]:
+        """
+        Search a subreddit, following pagination until `max_posts` posts are
+        collected or `stop_when(raw_post)` is true (that post is not returned).
+        """
+        results = []
+        async for page in self.iter_pages(subreddit, query, sort, time_filter, max_posts, stop_when):
+            results.extend(page)
+        return results
+
+    async def close(self):
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
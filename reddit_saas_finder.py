@@ -19,22 +19,66 @@ THEMES (like GummySearch):
 Usage:
     python reddit_saas_finder.py --subreddits "SaaS,Entrepreneur" --themes "solution,pain"
     python reddit_saas_finder.py --audience "airbnb_hosts" --full-analysis
+    python reddit_saas_finder.py --audience "airbnb_hosts" --offline --since-days 90
+    python reddit_saas_finder.py query 'invoic* "would pay"' --intent willingness_to_pay --since-days 180
 """
 
 import asyncio
+import bisect
 import json
 import re
-from dataclasses import dataclass, field
-from datetime import datetime
+import time
+from array import array
+from collections import OrderedDict
+from contextlib import suppress
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Callable, Optional
 
 from browser_use import Browser
 from dotenv import load_dotenv
 
+from browser_pool import BrowserPool
+from browser_profiles import block_resources, scraping_browser
+from crawl_journal import CrawlJournal, journal_path
+from extraction_status import (
+    EXTRACTION_OK,
+    RETRYABLE_STATUSES,
+    classify_empty_page,
+    format_extraction_stats,
+    record_extraction,
+)
+from llm_cache import LLMCache
+from near_duplicates import NearDuplicateIndex
+from page_snapshots import SnapshotStore
+from page_waits import REDDIT_POST_SELECTORS, format_wait_stats, goto_and_wait
+from post_index import PostIndex, canonical_post_id
+from post_warehouse import DEFAULT_WAREHOUSE_PATH, PostWarehouse
+from reddit_backends import FETCH_MODES, REDDIT_BASE_URL, RedditFetchError, RedditJsonBackend
+from scoring_profile import DEFAULT_PROFILE, ScoringProfile, load_scoring_profile
+from script_registry import install_scripts
+from search_cache import SearchCache
+from scroll_paginator import ScrollPaginator, ScrollResult
+from search_scheduler import REDDIT_HOST, BlockedError, SearchScheduler, SearchTask
+
 load_dotenv()
 
+# Try to import NumPy for batch scoring
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Try to import pyahocorasick (C Aho-Corasick automaton) for keyword matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # Try to import AI pattern extractor
 try:
     from ai_pattern_extractor import AIPatternExtractor, format_opportunities_report
@@ -55,7 +99,7 @@ class PostIntent(Enum):
     GENERAL = "general"
 
 
-@dataclass
+@dataclass(slots=True)
 class RedditPost:
     """Structured Reddit post with SaaS validation metadata."""
     title: str
@@ -70,6 +114,8 @@ class RedditPost:
     validation_score: float = 0.0
     payment_signals: list = field(default_factory=list)
     pain_signals: list = field(default_factory=list)
+    post_id: str = ""  # Canonical ID, see post_index.canonical_post_id
+    cluster_size: int = 1  # Near-duplicate copies (cross-posts) this post stands for
 
 
 @dataclass
@@ -142,53 +188,532 @@ PAIN_KEYWORDS = [
 ]
 
 
-def classify_intents(text: str) -> list[PostIntent]:
-    """Classify post intent based on keywords (like GummySearch's AI tagging)."""
-    text_lower = text.lower()
-    detected = []
+def _trie_regex(words: list[str]) -> str:
+    """Build a regex alternation shaped like a prefix trie, preferring the longest match."""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    
+    def build(node: dict) -> str:
+        terminal = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Greedy optional continuation: try the longer keyword first
+        if terminal:
+            return "(?:" + body + ")?"
+        return body
+    
+    return build(trie)
+
+
+@dataclass
+class KeywordMatches:
+    """Intent, payment and pain keyword hits for one text."""
+    intents: list
+    payment_signals: list
+    pain_signals: list
+    offsets: list  # (offset in lowercased text, keyword), in text order
+
+
+class KeywordMatcher:
+    """
+    Single-pass matcher over all intent/payment/pain keywords.
     
-    for intent, keywords in INTENT_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in text_lower:
-                detected.append(intent)
-                break
+    Uses a pyahocorasick automaton when installed. Otherwise all keywords are
+    compiled into one trie-shaped regex inside a zero-width lookahead, so a
+    single scan finds the longest keyword starting at each position; shorter
+    keywords that are prefixes of that match are added from a precomputed
+    table. Both give exactly the same hits as `keyword in text` per keyword.
+    """
     
+    def __init__(self, intent_keywords: dict, payment_keywords: list, pain_keywords: list):
+        keywords = {kw for kws in intent_keywords.values() for kw in kws}
+        keywords.update(payment_keywords, pain_keywords)
+        ordered = sorted(keywords, key=len, reverse=True)
+        
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for kw in ordered:
+                self._automaton.add_word(kw, kw)
+            self._automaton.make_automaton()
+        
+        self._pattern = re.compile("(?=(" + _trie_regex(ordered) + "))")
+        self._prefixes = {kw: [other for other in ordered if kw.startswith(other)] for kw in ordered}
+        
+        self._intents_for = {}
+        for intent, kws in intent_keywords.items():
+            for kw in kws:
+                self._intents_for.setdefault(kw, []).append(intent)
+        self._intent_rank = {intent: i for i, intent in enumerate(intent_keywords)}
+        self._payment_rank = {kw: i for i, kw in enumerate(payment_keywords)}
+        self._pain_rank = {kw: i for i, kw in enumerate(pain_keywords)}
+    
+    def match(self, text: str) -> KeywordMatches:
+        """Scan `text` once and return every keyword hit."""
+        text_lower = text.lower()
+        offsets = []
+        if self._automaton is not None:
+            for end, kw in self._automaton.iter(text_lower):
+                offsets.append((end - len(kw) + 1, kw))
+            offsets.sort(key=lambda hit: (hit[0], -len(hit[1])))
+        else:
+            for m in self._pattern.finditer(text_lower):
+                for kw in self._prefixes[m.group(1)]:
+                    offsets.append((m.start(), kw))
+        found = {kw for _, kw in offsets}
+        
+        intents = {intent for kw in found for intent in self._intents_for.get(kw, ())}
+        return KeywordMatches(
+            intents=sorted(intents, key=self._intent_rank.__getitem__),
+            payment_signals=sorted((kw for kw in found if kw in self._payment_rank), key=self._payment_rank.__getitem__),
+            pain_signals=sorted((kw for kw in found if kw in self._pain_rank), key=self._pain_rank.__getitem__),
+            offsets=offsets,
+        )
+
+
+# Built once at import
+KEYWORD_MATCHER = KeywordMatcher(INTENT_KEYWORDS, PAYMENT_KEYWORDS, PAIN_KEYWORDS)
+
+
+def match_keywords(text: str) -> KeywordMatches:
+    """Find intents, payment and pain signals (with offsets) in a single scan."""
+    return KEYWORD_MATCHER.match(text)
+
+
+def classify_intents(text: str) -> list[PostIntent]:
+    """Classify post intent based on keywords (like GummySearch's AI tagging)."""
+    detected = match_keywords(text).intents
     return detected if detected else [PostIntent.GENERAL]
 
 
 def extract_signals(text: str) -> tuple[list[str], list[str]]:
     """Extract payment and pain signals from text."""
-    text_lower = text.lower()
+    matches = match_keywords(text)
+    return matches.payment_signals, matches.pain_signals
+
+
+def raw_post_id(raw: dict, subreddit: str = "") -> str:
+    """Canonical ID of a raw scraped/fetched post dict."""
+    return canonical_post_id(
+        raw.get("url") or "",
+        raw["title"],
+        raw.get("body") or "",
+        subreddit or raw.get("subreddit", "")
+    )
+
+
+def post_identity(post: RedditPost) -> str:
+    """Canonical ID of a post (computed for posts saved before IDs existed)."""
+    return post.post_id or canonical_post_id(post.url, post.title, post.body, post.subreddit)
+
+
+def dedupe_posts(posts: list[RedditPost]) -> list[RedditPost]:
+    """Drop posts whose canonical ID was already seen, keeping the first occurrence."""
+    seen = set()
+    unique_posts = []
+    for post in posts:
+        post_id = post_identity(post)
+        if post_id not in seen:
+            seen.add(post_id)
+            unique_posts.append(post)
+    return unique_posts
+
+
+def parse_timestamp(value: str) -> Optional[datetime]:
+    """Parse an ISO post timestamp (naive ones are taken as UTC), or None."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def high_water_stop(mark: Optional[tuple[str, str]], subreddit: str) -> Optional[Callable[[dict], bool]]:
+    """
+    Stop predicate for a `sort=new` fetch: true once a raw post is the
+    high-water post itself or not newer than it.
+    """
+    if mark is None:
+        return None
+    mark_id, mark_timestamp = mark
+    mark_time = parse_timestamp(mark_timestamp)
     
-    payment_found = [kw for kw in PAYMENT_KEYWORDS if kw in text_lower]
-    pain_found = [kw for kw in PAIN_KEYWORDS if kw in text_lower]
+    def stop(raw: dict) -> bool:
+        if raw_post_id(raw, subreddit) == mark_id:
+            return True
+        posted = parse_timestamp(raw.get("timestamp"))
+        return bool(mark_time and posted and posted <= mark_time)
     
-    return payment_found, pain_found
+    return stop
 
 
-def calculate_validation_score(post: RedditPost) -> float:
+def newest_post(posts: list[RedditPost]) -> Optional[RedditPost]:
+    """Newest post by timestamp (the first one if none have timestamps)."""
+    if not posts:
+        return None
+    dated = [(parse_timestamp(p.timestamp), p) for p in posts]
+    dated = [(posted, p) for posted, p in dated if posted]
+    return max(dated, key=lambda item: item[0])[1] if dated else posts[0]
+
+
+def collapse_near_duplicates(posts: list[RedditPost], threshold: float = 0.5) -> list[RedditPost]:
+    """
+    Cluster near-duplicate posts (cross-posts, reposts with edited titles) and
+    keep the highest-engagement post of each cluster, in first-seen cluster
+    order. The kept post's `cluster_size` counts the posts it stands for.
+    """
+    index = NearDuplicateIndex(threshold=threshold)
+    for i, post in enumerate(posts):
+        index.add(i, post.title + " " + post.body)
+    
+    representatives = []
+    for members in index.clusters().values():
+        best = max(members, key=lambda i: posts[i].upvotes + posts[i].comments)
+        post = replace(posts[best], cluster_size=sum(posts[i].cluster_size for i in members))
+        representatives.append((members[0], post))
+    representatives.sort(key=lambda item: item[0])
+    return [post for _, post in representatives]
+
+
+def calculate_validation_score(post: RedditPost, profile: ScoringProfile = None) -> float:
     """Calculate SaaS validation score (0-10) based on multiple signals."""
+    profile = profile or DEFAULT_PROFILE
     score = 0.0
     
     # Intent scoring
-    if PostIntent.SOLUTION_REQUEST in post.intents:
-        score += 3.0
-    if PostIntent.PAIN_POINT in post.intents:
-        score += 2.0
-    if PostIntent.WILLINGNESS_TO_PAY in post.intents:
-        score += 4.0
-    if PostIntent.ADVICE_REQUEST in post.intents:
-        score += 1.0
+    for intent_value, weight in profile.intent_weights.items():
+        if PostIntent(intent_value) in post.intents:
+            score += weight
     
     # Engagement scoring (capped)
-    score += min(post.upvotes / 50, 2.0)
-    score += min(post.comments / 25, 2.0)
+    score += min(post.upvotes / profile.upvotes_per_point, profile.upvotes_cap)
+    score += min(post.comments / profile.comments_per_point, profile.comments_cap)
     
     # Signal scoring
-    score += min(len(post.payment_signals) * 0.5, 2.0)
-    score += min(len(post.pain_signals) * 0.3, 1.5)
+    score += min(len(post.payment_signals) * profile.payment_signal_weight, profile.payment_signal_cap)
+    score += min(len(post.pain_signals) * profile.pain_signal_weight, profile.pain_signal_cap)
+    
+    return min(round(score, 1), profile.max_score)
+
+
+def build_post(raw: dict, subreddit: str = "", profile: ScoringProfile = None) -> RedditPost:
+    """Turn a raw scraped/fetched post dict into a classified, scored RedditPost."""
+    full_text = raw["title"] + " " + (raw.get("body") or "")
+    matches = match_keywords(full_text)
     
-    return min(round(score, 1), 10.0)
+    post = RedditPost(
+        title=raw["title"],
+        body=raw.get("body") or "",
+        subreddit=subreddit or raw.get("subreddit", ""),
+        author=raw.get("author") or "",
+        upvotes=int(raw.get("upvotes") or 0),
+        comments=int(raw.get("comments") or 0),
+        url=raw.get("url") or "",
+        timestamp=raw.get("timestamp") or "",
+        intents=matches.intents or [PostIntent.GENERAL],
+        payment_signals=matches.payment_signals,
+        pain_signals=matches.pain_signals,
+        post_id=raw_post_id(raw, subreddit),
+    )
+    post.validation_score = calculate_validation_score(post, profile)
+    return post
+
+
+def post_to_dict(post: RedditPost) -> dict:
+    """Serialize a RedditPost to a JSON-friendly dict."""
+    data = asdict(post)
+    data["intents"] = [intent.value for intent in post.intents]
+    return data
+
+
+def post_from_dict(data: dict) -> RedditPost:
+    """Rebuild a RedditPost from post_to_dict output."""
+    data = dict(data)
+    data["intents"] = [PostIntent(value) for value in data.get("intents", [])]
+    return RedditPost(**data)
+
+
+def save_posts(posts: list[RedditPost], path: str):
+    """Write posts to a JSON file."""
+    Path(path).write_text(json.dumps([post_to_dict(p) for p in posts], indent=2), encoding="utf-8")
+
+
+def load_posts(path: str) -> list[RedditPost]:
+    """Read posts written by save_posts."""
+    return [post_from_dict(d) for d in json.loads(Path(path).read_text(encoding="utf-8"))]
+
+
+# Recently built posts kept in memory so repeats within a run skip the post index
+KNOWN_POSTS_CACHE_SIZE = 2000
+
+# One bit per intent, for columnar/bitmask storage of post intents
+INTENT_BITS = {intent: 1 << i for i, intent in enumerate(PostIntent)}
+
+
+def intent_mask(intents: list[PostIntent]) -> int:
+    """Pack a list of intents into a bitmask."""
+    mask = 0
+    for intent in intents:
+        mask |= INTENT_BITS[intent]
+    return mask
+
+
+def calculate_validation_scores(
+    upvotes,
+    comments,
+    intent_masks,
+    payment_counts,
+    pain_counts,
+    profile: ScoringProfile = None
+):
+    """
+    Vectorized calculate_validation_score over a columnar batch of posts.
+    Takes equal-length arrays and returns a float64 array of scores identical
+    to the scalar version.
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("NumPy is required for batch scoring")
+    
+    profile = profile or DEFAULT_PROFILE
+    
+    upvotes = np.asarray(upvotes, dtype=np.float64)
+    comments = np.asarray(comments, dtype=np.float64)
+    intent_masks = np.asarray(intent_masks, dtype=np.int64)
+    payment_counts = np.asarray(payment_counts, dtype=np.float64)
+    pain_counts = np.asarray(pain_counts, dtype=np.float64)
+    
+    # Same terms, added in the same order as the scalar version, so float results match
+    score = np.zeros(len(upvotes), dtype=np.float64)
+    for intent_value, weight in profile.intent_weights.items():
+        score += np.where(intent_masks & INTENT_BITS[PostIntent(intent_value)], weight, 0.0)
+    score += np.minimum(upvotes / profile.upvotes_per_point, profile.upvotes_cap)
+    score += np.minimum(comments / profile.comments_per_point, profile.comments_cap)
+    score += np.minimum(payment_counts * profile.payment_signal_weight, profile.payment_signal_cap)
+    score += np.minimum(pain_counts * profile.pain_signal_weight, profile.pain_signal_cap)
+    
+    rounded = np.round(score, 1)
+    # np.round and round() can disagree right at .x5; redo those few with round()
+    tenths = score * 10
+    near_half = np.abs(tenths - np.floor(tenths) - 0.5) < 1e-6
+    for i in np.flatnonzero(near_half):
+        rounded[i] = round(float(score[i]), 1)
+    
+    return np.minimum(rounded, profile.max_score)
+
+
+def rescore_posts(posts: list[RedditPost], profile: ScoringProfile = None) -> list[RedditPost]:
+    """Recompute validation_score for many posts at once (falls back to the scalar loop without NumPy)."""
+    if not posts:
+        return posts
+    
+    if not NUMPY_AVAILABLE:
+        for post in posts:
+            post.validation_score = calculate_validation_score(post, profile)
+        return posts
+    
+    scores = calculate_validation_scores(
+        [p.upvotes for p in posts],
+        [p.comments for p in posts],
+        [intent_mask(p.intents) for p in posts],
+        [len(p.payment_signals) for p in posts],
+        [len(p.pain_signals) for p in posts],
+        profile,
+    )
+    for post, score in zip(posts, scores.tolist()):
+        post.validation_score = score
+    return posts
+
+
+@dataclass
+class IntentTotals:
+    """Running per-intent aggregates behind find_patterns."""
+    post_count: int = 0
+    total_upvotes: int = 0
+    total_comments: int = 0
+    score_sum: float = 0.0
+    top: list = field(default_factory=list)  # Best (-score, index) pairs, at most 5
+
+
+class _StringTable:
+    """Interns repeated strings (subreddits, authors, signals) as small integer ids."""
+    __slots__ = ("values", "_ids")
+    
+    def __init__(self):
+        self.values: list[str] = []
+        self._ids: dict[str, int] = {}
+    
+    def id_for(self, value: str) -> int:
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = self._ids[value] = len(self.values)
+            self.values.append(value)
+        return string_id
+
+
+class PostStore:
+    """
+    Columnar storage for large RedditPost collections.
+    
+    Numbers live in typed arrays, intents in one bitmask per post, and
+    subreddits/authors/signals as ids into a shared string table (signals
+    use offset arrays, one slice per post). RedditPost objects are only
+    built on access, so indexing, slicing and iteration still hand out
+    posts like a list does.
+    """
+    
+    def __init__(self, posts=None):
+        self._strings = _StringTable()
+        self.titles: list[str] = []
+        self.bodies: list[str] = []
+        self.urls: list[str] = []
+        self.timestamps: list[str] = []
+        self.post_ids: list[str] = []
+        self.subreddit_ids = array("I")
+        self.author_ids = array("I")
+        self.upvotes = array("q")
+        self.comments = array("q")
+        self.intent_masks = array("H")
+        self.scores = array("d")
+        self.cluster_sizes = array("I")
+        self.payment_ids = array("I")
+        self.payment_offsets = array("I", [0])
+        self.pain_ids = array("I")
+        self.pain_offsets = array("I", [0])
+        self._positions: dict[str, int] = {}
+        # Bumped whenever existing posts are reordered or rescored
+        self.revision = 0
+        if posts:
+            self.extend(posts)
+    
+    def append(self, post: RedditPost):
+        """Add one post."""
+        strings = self._strings
+        self.titles.append(post.title)
+        self.bodies.append(post.body)
+        self.urls.append(post.url)
+        self.timestamps.append(post.timestamp)
+        post_id = post_identity(post)
+        self._positions.setdefault(post_id, len(self.post_ids))
+        self.post_ids.append(post_id)
+        self.subreddit_ids.append(strings.id_for(post.subreddit))
+        self.author_ids.append(strings.id_for(post.author))
+        self.upvotes.append(post.upvotes)
+        self.comments.append(post.comments)
+        self.intent_masks.append(intent_mask(post.intents))
+        self.scores.append(post.validation_score)
+        self.cluster_sizes.append(post.cluster_size)
+        self.payment_ids.extend(strings.id_for(s) for s in post.payment_signals)
+        self.payment_offsets.append(len(self.payment_ids))
+        self.pain_ids.extend(strings.id_for(s) for s in post.pain_signals)
+        self.pain_offsets.append(len(self.pain_ids))
+    
+    def extend(self, posts):
+        """Add many posts."""
+        for post in posts:
+            self.append(post)
+    
+    def __len__(self) -> int:
+        return len(self.titles)
+    
+    def __contains__(self, post_id: str) -> bool:
+        return post_id in self._positions
+    
+    def intents(self, i: int) -> list[PostIntent]:
+        """Intents of post `i`, decoded from its bitmask."""
+        mask = self.intent_masks[i]
+        return [intent for intent, bit in INTENT_BITS.items() if mask & bit]
+    
+    def subreddit(self, i: int) -> str:
+        return self._strings.values[self.subreddit_ids[i]]
+    
+    def payment_count(self, i: int) -> int:
+        return self.payment_offsets[i + 1] - self.payment_offsets[i]
+    
+    def pain_count(self, i: int) -> int:
+        return self.pain_offsets[i + 1] - self.pain_offsets[i]
+    
+    def post(self, i: int) -> RedditPost:
+        """Materialize post `i` as a RedditPost."""
+        values = self._strings.values
+        return RedditPost(
+            title=self.titles[i],
+            body=self.bodies[i],
+            subreddit=values[self.subreddit_ids[i]],
+            author=values[self.author_ids[i]],
+            upvotes=self.upvotes[i],
+            comments=self.comments[i],
+            url=self.urls[i],
+            timestamp=self.timestamps[i],
+            intents=self.intents(i),
+            validation_score=self.scores[i],
+            payment_signals=[values[j] for j in self.payment_ids[self.payment_offsets[i]:self.payment_offsets[i + 1]]],
+            pain_signals=[values[j] for j in self.pain_ids[self.pain_offsets[i]:self.pain_offsets[i + 1]]],
+            post_id=self.post_ids[i],
+            cluster_size=self.cluster_sizes[i],
+        )
+    
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self.post(i) for i in range(*key.indices(len(self)))]
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("PostStore index out of range")
+        return self.post(key)
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.post(i)
+    
+    def take(self, indices) -> "PostStore":
+        """New store holding the posts at `indices`, in that order."""
+        return PostStore(self.post(i) for i in indices)
+    
+    def sort_by_score(self, reverse: bool = True) -> "PostStore":
+        """Stable sort by validation score (highest first by default), in place."""
+        order = sorted(range(len(self)), key=self.scores.__getitem__, reverse=reverse)
+        if order != list(range(len(self))):
+            revision = self.revision + 1
+            self.__dict__.update(self.take(order).__dict__)
+            self.revision = revision
+        return self
+    
+    def rescore(self, profile: ScoringProfile = None) -> "PostStore":
+        """Recompute every score straight from the columns."""
+        if not len(self):
+            return self
+        
+        self.revision += 1
+        if NUMPY_AVAILABLE:
+            scores = calculate_validation_scores(
+                self.upvotes,
+                self.comments,
+                self.intent_masks,
+                [self.payment_count(i) for i in range(len(self))],
+                [self.pain_count(i) for i in range(len(self))],
+                profile,
+            )
+            self.scores = array("d", scores.tolist())
+        else:
+            self.scores = array("d", (calculate_validation_score(self.post(i), profile) for i in range(len(self))))
+        return self
+    
+    def indices_by_intent(self) -> dict[PostIntent, list[int]]:
+        """Post indices grouped by intent, intents in first-seen order."""
+        groups: dict[PostIntent, list[int]] = {}
+        for i, mask in enumerate(self.intent_masks):
+            for intent, bit in INTENT_BITS.items():
+                if mask & bit:
+                    groups.setdefault(intent, []).append(i)
+        return groups
 
 
 class RedditSaaSFinder:
@@ -275,21 +800,92 @@ class RedditSaaSFinder:
         ]
     }
     
-    def __init__(self, headless: bool = False):
+    def __init__(
+        self,
+        headless: bool = True,
+        concurrency: int = 4,
+        min_request_interval: float = 1.0,
+        fetch_mode: str = "browser",
+        json_base_url: str = REDDIT_BASE_URL,
+        cache: Optional[SearchCache] = None,
+        scoring_profile: ScoringProfile = None,
+        post_index: Optional[PostIndex] = None,
+        collapse_near_duplicates: bool = True,
+        scroll_time_budget: float = 30.0,
+        journal: Optional[CrawlJournal] = None,
+        max_retries: int = 3,
+        snapshots: Optional[SnapshotStore] = None,
+        block_resources: bool = False,
+        warehouse: Optional[PostWarehouse] = None,
+        llm_cache: Optional[LLMCache] = None
+    ):
+        if fetch_mode not in FETCH_MODES:
+            raise ValueError(f"Unknown fetch mode: {fetch_mode} (expected one of {FETCH_MODES})")
+        
         self.browser: Optional[Browser] = None
+        self.pool: Optional[BrowserPool] = None
         self.headless = headless
-        self.posts: list[RedditPost] = []
+        self.posts = PostStore()
         self.patterns: list[SaaSPattern] = []
+        self.scheduler = SearchScheduler(concurrency, min_request_interval, max_retries)
+        # "browser" scrapes rendered pages, "json" uses the listing API only,
+        # "auto" tries the listing API first and falls back to the browser
+        self.fetch_mode = fetch_mode
+        self.json_backend = RedditJsonBackend(json_base_url, max_connections=concurrency)
+        self.cache = cache
+        self.scoring_profile = scoring_profile or DEFAULT_PROFILE
+        # Every post seen by canonical ID (persistent), fronted by a small LRU
+        # of recently built posts that is cleared at the start of each audience run
+        self.post_index = post_index
+        self._known_posts: OrderedDict[str, RedditPost] = OrderedDict()
+        # Keep one representative per cluster of cross-posts/reposts
+        self.collapse_near_duplicates = collapse_near_duplicates
+        # Max seconds a browser scrape keeps scrolling for more posts
+        self.scroll_time_budget = scroll_time_budget
+        # Completed search units, so an interrupted crawl can resume
+        self.journal = journal
+        # Searches that failed after retries (a journal is only completed if none did)
+        self.failed_searches = 0
+        # Saves each rendered search page for offline replay (snapshot_replay)
+        self.snapshots = snapshots
+        # Scraping profile: skip images/media/fonts/trackers the scrape never reads.
+        # Opt-in until browser_profiles has a recorded comparison against extraction
+        self.block_resources = block_resources
+        # Every scored post across runs, for offline analysis (load_warehouse)
+        self.warehouse = warehouse
+        # Gemini responses reused when AI analysis re-sends an identical prompt
+        self.llm_cache = llm_cache
+        # find_patterns aggregates, updated incrementally as posts are appended
+        self._intent_totals: dict[PostIntent, IntentTotals] = {}
+        self._patterns_upto = 0
+        self._patterns_key = None
+        self._start_lock = asyncio.Lock()
     
     async def start(self):
         """Start the browser instance."""
-        self.browser = Browser(headless=self.headless)
-        print("🌐 Browser started")
+        if self.block_resources:
+            browser = scraping_browser(headless=self.headless)
+        else:
+            browser = Browser(headless=self.headless)
+        await browser.start()
+        self.browser = browser
+        # One warm page per concurrent search slot
+        self.pool = BrowserPool(self.browser, size=self.scheduler.concurrency, setup=self._setup_page)
+        print("🌐 Browser started" + (" (headless)" if self.headless else ""))
+    
+    async def _setup_page(self, page):
+        """Prepare a new pooled page: extraction scripts, then resource blocking."""
+        await install_scripts(page)
+        if self.block_resources:
+            await block_resources(page)
     
     async def stop(self):
         """Stop the browser instance."""
+        await self.json_backend.close()
+        if self.pool:
+            await self.pool.close()
         if self.browser:
-            await self.browser.close()
+            await self.browser.kill()
             print("🛑 Browser stopped")
     
     async def search_subreddit(
@@ -298,124 +894,181 @@ class RedditSaaSFinder:
         query: str,
         sort: str = "relevance",
         time_filter: str = "year",
-        max_posts: int = 25
+        max_posts: int = 25,
+        stop_when: Optional[Callable[[dict], bool]] = None
     ) -> list[RedditPost]:
-        """Search a subreddit and extract posts with metadata."""
-        if not self.browser:
-            await self.start()
-        
-        context = await self.browser.new_context()
-        page = await context.get_current_page()
+        """
+        Search a subreddit and extract posts with metadata. With `stop_when`,
+        results end at the first post it matches and bypass the search cache.
+        """
+        posts = [
+            post async for post in
+            self.iter_subreddit(subreddit, query, sort, time_filter, max_posts, stop_when)
+        ]
         
-        # Build search URL
-        search_url = f"https://www.reddit.com/r/{subreddit}/search/?q={query}&sort={sort}&restrict_sr=1&t={time_filter}"
+        print(f"   ✅ Found {len(posts)} posts")
+        return posts
+    
+    async def iter_subreddit(
+        self,
+        subreddit: str,
+        query: str,
+        sort: str = "relevance",
+        time_filter: str = "year",
+        max_posts: int = 25,
+        stop_when: Optional[Callable[[dict], bool]] = None
+    ) -> AsyncIterator[RedditPost]:
+        """
+        Streaming search_subreddit: yields each scored post as soon as its
+        listing page (JSON) or scroll round (browser) has been extracted.
+        Results are only written to the search cache once fully consumed,
+        keyed by the backend that fetched them.
+        """
+        use_cache = self.cache is not None and stop_when is None
+        # Auto mode reads JSON results; it only writes browser ones when it falls back
+        backend = "browser" if self.fetch_mode == "browser" else "json"
+        if use_cache:
+            cached = self.cache.get(subreddit, query, sort, time_filter, max_posts, backend=backend)
+            if cached is not None:
+                print(f"💾 Cached r/{subreddit} for: {query}")
+                for post in self._build_posts(cached, subreddit):
+                    yield post
+                return
         
         print(f"🔍 Searching r/{subreddit} for: {query}")
-        await page.goto(search_url, wait_until="networkidle")
-        await page.wait_for_timeout(3000)
-        
-        # Scroll to load more posts
-        for _ in range(3):
-            await page.keyboard.press("PageDown")
-            await page.wait_for_timeout(1000)
-        
-        # Extract posts using JavaScript
-        raw_posts = await page.evaluate(
-            """
-            (maxPosts) => {
-                const results = [];
-                
-                // Try multiple selectors for different Reddit layouts
-                const postSelectors = [
-                    'shreddit-post',
-                    '[data-testid="post-container"]',
-                    'article',
-                    '.Post',
-                    '.thing.link'
-                ];
-                
-                let posts = [];
-                for (const selector of postSelectors) {
-                    posts = document.querySelectorAll(selector);
-                    if (posts.length > 0) break;
-                }
-
-                posts.forEach((post, idx) => {
-                    if (idx >= maxPosts) return;
-                    
-                    let title = '';
-                    let body = '';
-                    let upvotes = '0';
-                    let comments = '0';
-                    let author = '';
-                    let timestamp = '';
-                    let url = '';
-                    
-                    // shreddit-post (new Reddit)
-                    if (post.tagName === 'SHREDDIT-POST') {
-                        title = post.getAttribute('post-title') || '';
-                        author = post.getAttribute('author') || '';
-                        upvotes = post.getAttribute('score') || '0';
-                        comments = post.getAttribute('comment-count') || '0';
-                        url = post.getAttribute('permalink') || '';
-                    } else {
-                        title = post.querySelector('h3, h2, [slot="title"], a.title')?.textContent?.trim() || '';
-                        body = post.querySelector('[slot="text-body"], .md, .usertext-body')?.textContent?.trim() || '';
-                        upvotes = post.querySelector('[data-testid="post-vote-score"], .score')?.textContent || '0';
-                        const commentLink = post.querySelector('a[href*="comments"]');
-                        comments = commentLink?.textContent?.match(/\\d+/)?.[0] || '0';
-                        author = post.querySelector('a[href*="/user/"]')?.textContent || '';
-                        const timeEl = post.querySelector('time, [datetime]');
-                        timestamp = timeEl?.getAttribute('datetime') || timeEl?.textContent || '';
-                    }
-                    
-                    if (title && title.length > 10) {
-                        results.push({
-                            title: title.substring(0, 300),
-                            body: body.substring(0, 1000),
-                            upvotes: parseInt(upvotes.replace(/[^0-9-]/g, '')) || 0,
-                            comments: parseInt(comments.replace(/[^0-9]/g, '')) || 0,
-                            author,
-                            timestamp,
-                            url
-                        });
-                    }
-                });
-                
-                return results;
-            }
-            """,
-            max_posts
-        )
-        
-        await context.close()
+        raw_posts = []
+        seen = set()
+        async for backend, batch in self._iter_raw_batches(subreddit, query, sort, time_filter, max_posts, stop_when):
+            if use_cache:
+                raw_posts.extend(batch)
+            for post in self._build_posts(batch, subreddit):
+                if post.post_id not in seen:
+                    seen.add(post.post_id)
+                    yield post
         
-        # Process posts
+        if use_cache:
+            self.cache.put(subreddit, query, sort, time_filter, max_posts, raw_posts, backend=backend)
+    
+    def _build_posts(self, raw_posts: list[dict], subreddit: str) -> list[RedditPost]:
+        """
+        Turn raw posts into RedditPosts, classifying each canonical post only
+        once. Posts already seen (recently in this run or, via the post index,
+        an earlier one) are reused with refreshed upvote/comment counts, unless
+        the new fetch has a longer body (e.g. the JSON API after a title-only
+        browser scrape): then the post is re-classified from the fuller text.
+        """
         posts = []
+        changed_posts = []
         for raw in raw_posts:
-            full_text = raw["title"] + " " + raw.get("body", "")
-            intents = classify_intents(full_text)
-            payment_signals, pain_signals = extract_signals(full_text)
+            post_id = raw_post_id(raw, subreddit)
+            post = self._known_posts.get(post_id)
+            if post is not None:
+                self._known_posts.move_to_end(post_id)
+            from_index = False
+            if post is None and self.post_index:
+                stored = self.post_index.get(post_id)
+                if stored is not None:
+                    post = post_from_dict(stored)
+                    from_index = True
             
-            post = RedditPost(
-                title=raw["title"],
-                body=raw.get("body", ""),
-                subreddit=subreddit,
-                author=raw.get("author", ""),
-                upvotes=raw.get("upvotes", 0),
-                comments=raw.get("comments", 0),
-                url=raw.get("url", ""),
-                timestamp=raw.get("timestamp", ""),
-                intents=intents,
-                payment_signals=payment_signals,
-                pain_signals=pain_signals,
-            )
-            post.validation_score = calculate_validation_score(post)
+            if post is None or len(raw.get("body") or "") > len(post.body):
+                if post is not None and len(post.title) > len(raw["title"]):
+                    raw = {**raw, "title": post.title}
+                post = build_post(raw, subreddit, self.scoring_profile)
+                post.post_id = post_id
+                changed_posts.append(post)
+            elif from_index:
+                post.upvotes = int(raw.get("upvotes") or 0)
+                post.comments = int(raw.get("comments") or 0)
+                post.validation_score = calculate_validation_score(post, self.scoring_profile)
+                changed_posts.append(post)
+            else:
+                posts.append(post)
+                continue
+            
+            self._known_posts[post_id] = post
+            if len(self._known_posts) > KNOWN_POSTS_CACHE_SIZE:
+                self._known_posts.popitem(last=False)
             posts.append(post)
         
-        print(f"   ✅ Found {len(posts)} posts")
+        if self.post_index and changed_posts:
+            self.post_index.put_many([post_to_dict(p) for p in changed_posts])
+        posts = dedupe_posts(posts)
+        if self.warehouse is not None:
+            self.warehouse.put_posts([post_to_dict(p) for p in posts])
         return posts
     
+    async def _ensure_browser(self):
+        """Start the browser once, even when many searches need it at the same time."""
+        async with self._start_lock:
+            if not self.browser:
+                await self.start()
+    
+    async def _iter_raw_batches(
+        self,
+        subreddit: str,
+        query: str,
+        sort: str,
+        time_filter: str,
+        max_posts: int,
+        stop_when: Optional[Callable[[dict], bool]] = None
+    ) -> AsyncIterator[tuple[str, list[dict]]]:
+        """
+        Yield (backend, raw post dicts) batch by batch with the configured
+        backend ("json" or "browser"), falling back to the browser in auto
+        mode (if the JSON backend fails before returning anything).
+        """
+        if self.fetch_mode in ("json", "auto"):
+            fetched = False
+            try:
+                async for page in self.json_backend.iter_pages(
+                    subreddit, query, sort, time_filter, max_posts, stop_when
+                ):
+                    fetched = True
+                    yield "json", page
+                return
+            except RedditFetchError as e:
+                if self.fetch_mode == "json" or fetched:
+                    raise
+                if isinstance(e, BlockedError):
+                    self.scheduler.rate_limiter.report_block(REDDIT_HOST)
+                print(f"   ↩️ JSON fetch failed for r/{subreddit} ({e}), falling back to browser")
+        
+        # Render the search page in the browser and scrape posts from the DOM
+        await self._ensure_browser()
+        
+        # Build search URL
+        search_url = f"https://www.reddit.com/r/{subreddit}/search/?q={query}&sort={sort}&restrict_sr=1&t={time_filter}"
+        
+        async with self.pool.page() as page:
+            await goto_and_wait(page, search_url, REDDIT_POST_SELECTORS, label="reddit_search")
+            
+            # Scroll until enough posts have loaded (or the results run out)
+            paginator = ScrollPaginator(page, time_budget=self.scroll_time_budget)
+            scroll = ScrollResult()
+            found = 0
+            async for batch in paginator.iter_batches(max_posts, stop_when, result=scroll):
+                found += len(batch)
+                yield "browser", batch
+            
+            # Zero posts may be a block/captcha page or an unknown layout rather
+            # than no results; those raise so the scheduler backs off and retries
+            status, reason = EXTRACTION_OK, ""
+            if not found and scroll.stop_reason != "stop_when":
+                status, reason = await classify_empty_page(page, scroll.layout, REDDIT_POST_SELECTORS)
+            record_extraction("reddit_search", status, scroll.layout, found)
+            if self.snapshots is not None:
+                await self.snapshots.capture(
+                    page,
+                    "reddit_search",
+                    "reddit_posts",
+                    [REDDIT_POST_SELECTORS, max_posts, paginator.title_chars, paginator.body_chars],
+                    scroll.layout,
+                    found
+                )
+            if status in RETRYABLE_STATUSES:
+                raise BlockedError(f"r/{subreddit} search page {status}" + (f" ({reason})" if reason else ""))
+    
     async def search_by_intent(
         self,
         subreddit: str,
@@ -424,70 +1077,319 @@ class RedditSaaSFinder:
     ) -> list[RedditPost]:
         """Search subreddit using pre-built intent queries."""
         queries = self.INTENT_QUERIES.get(intent, self.INTENT_QUERIES["solution_request"])
+        tasks = [
+            SearchTask(subreddit, query, max_posts=max_posts // 3)
+            for query in queries[:3]  # Use top 3 queries per intent
+        ]
         
-        all_posts = []
-        for query in queries[:3]:  # Use top 3 queries per intent
-            posts = await self.search_subreddit(subreddit, query, max_posts=max_posts // 3)
-            all_posts.extend(posts)
+        # Queries run concurrently through the shared scheduler; results come back in query order
+        results = await self.scheduler.run(tasks, lambda t: self._search_unit(t, intent))
         
-        # Dedupe by title
-        seen = set()
-        unique_posts = []
-        for post in all_posts:
-            if post.title not in seen:
-                seen.add(post.title)
-                unique_posts.append(post)
+        all_posts = []
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            all_posts.extend(result)
         
+        unique_posts = dedupe_posts(all_posts)
         return sorted(unique_posts, key=lambda p: p.validation_score, reverse=True)
     
+    async def _search_unit(self, task: SearchTask, intent: str) -> list[RedditPost]:
+        """
+        Run one (subreddit, intent, query) search unit, or replay it from the
+        crawl journal if an interrupted run already completed it.
+        """
+        if self.journal is None:
+            return await self.search_subreddit(task.subreddit, task.query, task.sort, task.time_filter, task.max_posts)
+        
+        key = CrawlJournal.unit_key(task.subreddit, intent, task.query, task.sort, task.time_filter, task.max_posts)
+        journaled = self.journal.posts(key)
+        if journaled is not None:
+            print(f"⏭️ Journaled r/{task.subreddit} for: {task.query}")
+            posts = [post_from_dict(d) for d in journaled]
+            for post in posts:
+                post.validation_score = calculate_validation_score(post, self.scoring_profile)
+            return posts
+        
+        posts = await self.search_subreddit(task.subreddit, task.query, task.sort, task.time_filter, task.max_posts)
+        self.journal.record(key, [post_to_dict(p) for p in posts])
+        return posts
+    
     async def analyze_audience(
         self,
         audience_key: str,
         intents: list[str] = None,
         max_posts_per_sub: int = 20
-    ) -> list[RedditPost]:
+    ) -> PostStore:
         """
         Analyze a curated audience (like GummySearch audiences).
-        Searches all subreddits in the audience with intent-based queries.
+        Searches all subreddits in the audience with intent-based queries and
+        returns the deduped posts (also kept in self.posts), best first. An
+        unknown audience returns an empty store.
         """
         if audience_key not in self.CURATED_AUDIENCES:
             print(f"❌ Unknown audience: {audience_key}")
             print(f"   Available: {list(self.CURATED_AUDIENCES.keys())}")
-            return []
+            return PostStore()
         
         audience = self.CURATED_AUDIENCES[audience_key]
         print(f"\n📊 Analyzing audience: {audience['name']}")
         print(f"   Subreddits: {', '.join(audience['subreddits'])}")
+        self._known_posts.clear()
         
         intents = intents or ["solution_request", "pain_point", "willingness_to_pay"]
         
+        # Fan out every subreddit × intent at once; the scheduler bounds how many run in parallel
+        groups = [(subreddit, intent) for subreddit in audience["subreddits"] for intent in intents]
+        results = await asyncio.gather(
+            *(
+                self.search_by_intent(subreddit, intent, max_posts=max_posts_per_sub // len(intents))
+                for subreddit, intent in groups
+            ),
+            return_exceptions=True
+        )
+        
         all_posts = []
-        for subreddit in audience["subreddits"]:
-            for intent in intents:
-                try:
-                    posts = await self.search_by_intent(
-                        subreddit, intent, max_posts=max_posts_per_sub // len(intents)
-                    )
-                    all_posts.extend(posts)
-                except Exception as e:
-                    print(f"   ⚠️ Error searching r/{subreddit}: {e}")
+        for (subreddit, _), result in zip(groups, results):
+            if isinstance(result, BaseException):
+                print(f"   ⚠️ Error searching r/{subreddit}: {result}")
+                self.failed_searches += 1
+                continue
+            all_posts.extend(result)
         
         # Dedupe and sort
-        seen = set()
-        unique_posts = []
-        for post in all_posts:
-            if post.title not in seen:
-                seen.add(post.title)
-                unique_posts.append(post)
+        unique_posts = self.unique_posts(all_posts)
         
-        self.posts = sorted(unique_posts, key=lambda p: p.validation_score, reverse=True)
+        self.posts = PostStore(sorted(unique_posts, key=lambda p: p.validation_score, reverse=True))
         print(f"\n✅ Total unique posts: {len(self.posts)}")
         return self.posts
     
-    def find_patterns(self, min_posts: int = 2) -> list[SaaSPattern]:
+    async def iter_audience(
+        self,
+        audience_key: str,
+        intents: list[str] = None,
+        max_posts_per_sub: int = 20,
+        buffer_size: int = 100
+    ) -> AsyncIterator[RedditPost]:
+        """
+        Streaming analyze_audience: runs every subreddit × intent query
+        through the scheduler and yields each scored post (deduped by
+        canonical ID) as soon as its page has been extracted. Searches pause
+        while `buffer_size` posts are waiting, so a slow consumer applies
+        backpressure instead of posts piling up in memory. Unlike
+        analyze_audience, results are neither sorted nor collapsed into
+        near-duplicate clusters, and self.posts is left alone.
+        """
+        if audience_key not in self.CURATED_AUDIENCES:
+            print(f"❌ Unknown audience: {audience_key}")
+            print(f"   Available: {list(self.CURATED_AUDIENCES.keys())}")
+            return
+        
+        audience = self.CURATED_AUDIENCES[audience_key]
+        print(f"\n📊 Streaming audience: {audience['name']}")
+        self._known_posts.clear()
+        
+        intents = intents or ["solution_request", "pain_point", "willingness_to_pay"]
+        # At least one post per query, or small budgets would fetch nothing
+        max_posts_per_query = max(1, max_posts_per_sub // len(intents) // 3)
+        tasks = [
+            SearchTask(subreddit, query, max_posts=max_posts_per_query)
+            for subreddit in audience["subreddits"]
+            for intent in intents
+            for query in self.INTENT_QUERIES.get(intent, self.INTENT_QUERIES["solution_request"])[:3]
+        ]
+        
+        queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+        done = object()
+        
+        async def pump(task: SearchTask):
+            async for post in self.iter_subreddit(
+                task.subreddit, task.query, task.sort, task.time_filter, task.max_posts
+            ):
+                await queue.put(post)
+        
+        async def produce():
+            # Failed searches come back as exceptions, so this always reaches `done`
+            results = await self.scheduler.run(tasks, pump)
+            for task, result in zip(tasks, results):
+                if isinstance(result, BaseException):
+                    print(f"   ⚠️ Error searching r/{task.subreddit}: {result}")
+                    self.failed_searches += 1
+            await queue.put(done)
+        
+        producer = asyncio.create_task(produce())
+        seen = set()
+        try:
+            while (post := await queue.get()) is not done:
+                post_id = post_identity(post)
+                if post_id not in seen:
+                    seen.add(post_id)
+                    yield post
+        finally:
+            # Stop searching if the consumer stopped early
+            producer.cancel()
+            with suppress(asyncio.CancelledError):
+                await producer
+    
+    async def refresh_audience(
+        self,
+        audience_key: str,
+        intents: list[str] = None,
+        max_posts_per_query: int = 25
+    ) -> PostStore:
+        """
+        Incrementally refresh a curated audience. Its stored posts are loaded
+        from the post index, then each (subreddit, intent query) is fetched
+        with sort=new only back to its high-water mark from the last run. New
+        posts are appended to self.posts and patterns are updated in place.
+        A mark only moves once a fetch has reached it: a fetch cut off by
+        `max_posts_per_query` keeps the old mark, so the posts between the
+        cap and the mark are fetched again next time instead of skipped.
+        """
+        if not self.post_index:
+            raise ValueError("refresh_audience needs a post index")
+        if audience_key not in self.CURATED_AUDIENCES:
+            print(f"❌ Unknown audience: {audience_key}")
+            print(f"   Available: {list(self.CURATED_AUDIENCES.keys())}")
+            return self.posts
+        
+        audience = self.CURATED_AUDIENCES[audience_key]
+        print(f"\n🔄 Refreshing audience: {audience['name']}")
+        self._known_posts.clear()
+        intents = intents or ["solution_request", "pain_point", "willingness_to_pay"]
+        
+        # Start from the stored corpus, scored under the current profile
+        stored = [post_from_dict(d) for d in self.post_index.posts_in(audience["subreddits"])]
+        for post in stored:
+            post.validation_score = calculate_validation_score(post, self.scoring_profile)
+        loaded = self._merge_posts(stored)
+        
+        tasks = [
+            SearchTask(subreddit, query, sort="new", time_filter="all", max_posts=max_posts_per_query)
+            for subreddit in audience["subreddits"]
+            for intent in intents
+            for query in self.INTENT_QUERIES.get(intent, self.INTENT_QUERIES["solution_request"])[:3]
+        ]
+        marks = {(t.subreddit, t.query): self.post_index.get_high_water(t.subreddit, t.query) for t in tasks}
+        reached = set()
+        
+        def stop_at_mark(task: SearchTask) -> Optional[Callable[[dict], bool]]:
+            """high_water_stop for the task, noting when the old mark is reached."""
+            key = (task.subreddit, task.query)
+            stop = high_water_stop(marks[key], task.subreddit)
+            if stop is None:
+                return None
+            
+            def check(raw: dict) -> bool:
+                if stop(raw):
+                    reached.add(key)
+                    return True
+                return False
+            
+            return check
+        
+        results = await self.scheduler.run(
+            tasks,
+            lambda t: self.search_subreddit(
+                t.subreddit, t.query, t.sort, t.time_filter, t.max_posts, stop_when=stop_at_mark(t)
+            )
+        )
+        
+        fetched = []
+        capped = 0
+        for task, result in zip(tasks, results):
+            if isinstance(result, BaseException):
+                print(f"   ⚠️ Error searching r/{task.subreddit}: {result}")
+                continue
+            fetched.extend(result)
+            key = (task.subreddit, task.query)
+            if marks[key] is not None and key not in reached:
+                capped += 1
+                continue
+            newest = newest_post(result)
+            if newest:
+                self.post_index.set_high_water(task.subreddit, task.query, post_identity(newest), newest.timestamp)
+        
+        added = self._merge_posts(fetched)
+        print(f"\n✅ {added} new posts ({loaded} loaded from the index, {len(self.posts)} total)")
+        if capped:
+            print(f"   ℹ️ {capped} queries hit {max_posts_per_query} posts before their high-water mark; "
+                  "their marks were kept (raise the per-query limit to catch up)")
+        self.find_patterns(incremental=True)
+        return self.posts
+    
+    def _merge_posts(self, posts: list[RedditPost]) -> int:
+        """Append posts not already in self.posts (best first). Returns how many were added."""
+        fresh = [p for p in self.unique_posts(posts) if post_identity(p) not in self.posts]
+        self.posts.extend(sorted(fresh, key=lambda p: p.validation_score, reverse=True))
+        return len(fresh)
+    
+    def load_warehouse(
+        self,
+        subreddits: Optional[list[str]] = None,
+        intents: Optional[list[str]] = None,
+        since_days: Optional[float] = None
+    ) -> int:
+        """
+        Load stored posts (all subreddits by default) into self.posts without
+        scraping, re-scored under the current profile. Returns how many were added.
+        """
+        since = time.time() - since_days * 86400 if since_days else None
+        stored = self.warehouse.posts(subreddits, intents, since)
+        posts = rescore_posts([post_from_dict(d) for d in stored], self.scoring_profile)
+        added = self._merge_posts(posts)
+        print(f"🏛️ Loaded {added} posts from the warehouse ({len(stored)} stored matches)")
+        return added
+    
+    def query_warehouse(
+        self,
+        text: str,
+        subreddits: Optional[list[str]] = None,
+        intents: Optional[list[str]] = None,
+        min_score: Optional[float] = None,
+        since_days: Optional[float] = None,
+        limit: int = 200
+    ) -> list[tuple[RedditPost, float]]:
+        """
+        Ranked (BM25) full-text search over the warehouse. Matches are
+        returned with their relevance, most relevant first, and appended to
+        self.posts in that order (skipping posts already loaded) for
+        find_patterns/generate_report.
+        """
+        since = time.time() - since_days * 86400 if since_days else None
+        started = time.perf_counter()
+        matches = self.warehouse.search(text, subreddits, intents, since, min_score, limit)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        
+        results = [(post_from_dict(data), relevance) for data, relevance in matches]
+        # No near-duplicate collapse or score sort here: that would lose the BM25 order
+        self.posts.extend(post for post, _ in results if post_identity(post) not in self.posts)
+        print(f"🔎 {len(results)} matches for {text!r} in {elapsed_ms:.0f}ms")
+        for i, (post, relevance) in enumerate(results[:10], 1):
+            print(f"  {i}. ({relevance:.3g}) [{post.validation_score}/10] r/{post.subreddit}: {post.title[:70]}")
+        return results
+    
+    def unique_posts(self, posts: list[RedditPost]) -> list[RedditPost]:
+        """Drop exact duplicates and, unless disabled, collapse near-duplicates."""
+        posts = dedupe_posts(posts)
+        if self.collapse_near_duplicates:
+            posts = collapse_near_duplicates(posts)
+        return posts
+    
+    def rescore(self, profile: ScoringProfile = None) -> PostStore:
+        """Re-score all loaded posts under a (new) scoring profile without re-scraping."""
+        if profile is not None:
+            self.scoring_profile = profile
+        return self.posts.rescore(self.scoring_profile).sort_by_score()
+    
+    def find_patterns(self, min_posts: int = 2, incremental: bool = False) -> list[SaaSPattern]:
         """
         Find common patterns in posts (like GummySearch Patterns).
         Groups similar posts and identifies common themes.
+        
+        With `incremental=True`, only posts appended since the last call are
+        folded into the running per-intent aggregates (unless the store was
+        replaced, reordered or rescored in between).
         """
         if not self.posts:
             print("⚠️ No posts to analyze. Run search first.")
@@ -495,37 +1397,46 @@ class RedditSaaSFinder:
         
         print("\n🔍 Finding patterns...")
         
-        # Group by intent
-        intent_groups = {}
-        for post in self.posts:
-            for intent in post.intents:
-                if intent not in intent_groups:
-                    intent_groups[intent] = []
-                intent_groups[intent].append(post)
+        store = self.posts
+        key = (id(store), store.revision)
+        if not incremental or key != self._patterns_key:
+            self._intent_totals = {}
+            self._patterns_upto = 0
+            self._patterns_key = key
+        
+        # Group by intent, folding in posts not yet counted
+        for i in range(self._patterns_upto, len(store)):
+            mask = store.intent_masks[i]
+            score = store.scores[i]
+            for intent, bit in INTENT_BITS.items():
+                if not mask & bit:
+                    continue
+                totals = self._intent_totals.setdefault(intent, IntentTotals())
+                totals.post_count += 1
+                totals.total_upvotes += store.upvotes[i]
+                totals.total_comments += store.comments[i]
+                totals.score_sum += score
+                entry = (-score, i)
+                if len(totals.top) < 5 or entry < totals.top[-1]:
+                    bisect.insort(totals.top, entry)
+                    del totals.top[5:]
+        self._patterns_upto = len(store)
         
         patterns = []
         
         # Create patterns from intent groups
-        for intent, posts in intent_groups.items():
-            if len(posts) < min_posts or intent == PostIntent.GENERAL:
+        for intent, totals in self._intent_totals.items():
+            if totals.post_count < min_posts or intent == PostIntent.GENERAL:
                 continue
             
-            # Calculate aggregates
-            total_upvotes = sum(p.upvotes for p in posts)
-            total_comments = sum(p.comments for p in posts)
-            avg_score = sum(p.validation_score for p in posts) / len(posts)
-            
-            # Get top examples
-            top_posts = sorted(posts, key=lambda p: p.validation_score, reverse=True)[:5]
-            
             pattern = SaaSPattern(
                 name=f"{intent.value.replace('_', ' ').title()}s",
                 description=f"Posts expressing {intent.value.replace('_', ' ')}",
-                post_count=len(posts),
-                total_upvotes=total_upvotes,
-                total_comments=total_comments,
-                example_posts=[p.title for p in top_posts],
-                validation_score=round(avg_score, 1),
+                post_count=totals.post_count,
+                total_upvotes=totals.total_upvotes,
+                total_comments=totals.total_comments,
+                example_posts=[store.titles[i] for _, i in totals.top],
+                validation_score=round(totals.score_sum / totals.post_count, 1),
                 category=intent.value
             )
             patterns.append(pattern)
@@ -543,16 +1454,18 @@ class RedditSaaSFinder:
         
         summary = {intent.value: 0 for intent in PostIntent}
         
-        for post in self.posts:
-            for intent in post.intents:
-                summary[intent.value] += 1
+        for intent, indices in self.posts.indices_by_intent().items():
+            summary[intent.value] += len(indices)
         
         # Remove zero counts
         return {k: v for k, v in summary.items() if v > 0}
     
     def get_top_validated_ideas(self, min_score: float = 5.0, limit: int = 10) -> list[RedditPost]:
         """Get top validated SaaS ideas based on validation score."""
-        return [p for p in self.posts if p.validation_score >= min_score][:limit]
+        store = self.posts
+        indices = [i for i, score in enumerate(store.scores) if score >= min_score]
+        indices.sort(key=store.scores.__getitem__, reverse=True)
+        return [store.post(i) for i in indices[:limit]]
     
     async def analyze_with_ai(self, audience_context: str = "") -> tuple:
         """
@@ -568,7 +1481,7 @@ class RedditSaaSFinder:
             return [], []
         
         print("\n🤖 Running AI analysis...")
-        extractor = AIPatternExtractor()
+        extractor = AIPatternExtractor(cache=self.llm_cache)
         
         # Extract patterns
         ai_patterns = await extractor.extract_patterns(
@@ -620,13 +1533,14 @@ class RedditSaaSFinder:
             intents_str = ", ".join([i.value for i in post.intents])
             payment_str = ", ".join(post.payment_signals[:3]) if post.payment_signals else "None"
             pain_str = ", ".join(post.pain_signals[:3]) if post.pain_signals else "None"
+            crosspost_str = f"- **Cross-posted:** {post.cluster_size} copies\n" if post.cluster_size > 1 else ""
             
             report += f"""### {i}. {post.title[:80]}{'...' if len(post.title) > 80 else ''}
 
 - **Validation Score:** {post.validation_score}/10
 - **Subreddit:** r/{post.subreddit}
 - **Engagement:** ↑{post.upvotes} | 💬{post.comments}
-- **Intents:** {intents_str}
+{crosspost_str}- **Intents:** {intents_str}
 - **Payment Signals:** {payment_str}
 - **Pain Signals:** {pain_str}
 - **URL:** https://reddit.com{post.url}
@@ -742,13 +1656,114 @@ async def main():
                         help="Comma-separated intents to search")
     parser.add_argument("--max-posts", type=int, default=20, help="Max posts per subreddit")
     parser.add_argument("--output", type=str, help="Output report path")
-    parser.add_argument("--headless", action="store_true", help="Run browser in headless mode")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window (headless by default)")
+    parser.add_argument("--headless", action="store_true", help=argparse.SUPPRESS)  # Default now; kept for old scripts
+    parser.add_argument("--block-resources", action="store_true",
+                        help="Use the scraping profile: skip images, media, fonts and trackers (not yet validated)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Max searches running in parallel")
+    parser.add_argument("--rate-limit", type=float, default=1.0,
+                        help="Min seconds between requests to the same host (raised automatically while blocked)")
+    parser.add_argument("--max-retries", type=int, default=3,
+                        help="Retries, with backoff, for searches that hit block/captcha/empty pages")
+    parser.add_argument("--fetch", choices=FETCH_MODES, default="browser",
+                        help="Fetch backend: render pages in the browser, use Reddit's JSON API, "
+                             "or try JSON first and fall back to the browser (auto)")
+    parser.add_argument("--cache-ttl", type=float, default=24.0,
+                        help="Reuse cached search results younger than this many hours (default: 24)")
+    parser.add_argument("--no-cache", action="store_true", help="Always re-fetch; don't read or write the search cache")
+    parser.add_argument("--no-post-index", action="store_true",
+                        help="Don't reuse or record posts in the persistent post index")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Incrementally refresh --audience (or every curated audience with --audience all) "
+                             "from the post index, fetching only posts newer than the last run")
+    parser.add_argument("--journal", type=str,
+                        help="Checkpoint journal of completed searches "
+                             "(default: .cache/crawl_journals/<audience or subreddits>.jsonl)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Resume an interrupted crawl: skip searches already completed in --journal")
+    parser.add_argument("--fresh-journal", action="store_true",
+                        help="Discard the crawl's existing journal and start over")
+    parser.add_argument("--keep-near-duplicates", action="store_true",
+                        help="Keep every copy of cross-posted/reposted threads instead of one per cluster")
+    parser.add_argument("--scoring-profile", type=str, help="JSON file with scoring weights (see scoring_profile.py)")
+    parser.add_argument("--save-posts", type=str, help="Also save all scored posts to this JSON file")
+    parser.add_argument("--rescore", type=str, metavar="POSTS_JSON",
+                        help="Re-score a saved posts file under --scoring-profile (no scraping), "
+                             "write it back and regenerate the report")
+    parser.add_argument("--warehouse", type=str, default=str(DEFAULT_WAREHOUSE_PATH),
+                        help="SQLite warehouse every scored post is stored in (default: .cache/post_warehouse.sqlite3)")
+    parser.add_argument("--no-warehouse", action="store_true", help="Don't record posts in the warehouse")
+    parser.add_argument("--offline", action="store_true",
+                        help="Analyze posts already in the warehouse (for --audience/--subreddits, else all) "
+                             "instead of scraping")
+    parser.add_argument("--since-days", type=float, help="With --offline, only posts from the last N days")
+    parser.add_argument("--snapshot-dir", type=str,
+                        help="Save every browser-rendered search page here for offline replay (snapshot_replay.py)")
     parser.add_argument("--list-audiences", action="store_true", help="List available audiences")
     parser.add_argument("--ai-analysis", action="store_true", help="Run AI pattern extraction")
+    parser.add_argument("--llm-cache-ttl", type=float, default=30.0,
+                        help="Reuse cached Gemini responses younger than this many days (default: 30)")
+    parser.add_argument("--no-llm-cache", action="store_true",
+                        help="Always call Gemini; don't read or write the LLM response cache")
+    
+    commands = parser.add_subparsers(dest="command")
+    query_parser = commands.add_parser(
+        "query", help="Ranked full-text search over the post warehouse (no scraping), then report on the matches"
+    )
+    query_parser.add_argument("text", help='FTS5 query, e.g. \'invoic* AND "would pay"\' (plain words also work)')
+    query_parser.add_argument("--subreddits", dest="query_subreddits", type=str, help="Comma-separated subreddits")
+    query_parser.add_argument("--audience", dest="query_audience", type=str,
+                              help="Only the curated audience's subreddits")
+    query_parser.add_argument("--intent", dest="query_intents", action="append",
+                              choices=[intent.value for intent in PostIntent], help="Post intent (repeatable)")
+    query_parser.add_argument("--min-score", dest="query_min_score", type=float, help="Minimum validation score")
+    query_parser.add_argument("--since-days", dest="query_since_days", type=float,
+                              help="Only posts from the last N days")
+    query_parser.add_argument("--limit", dest="query_limit", type=int, default=200, help="Max matches (default: 200)")
     
     args = parser.parse_args()
+    querying = args.command == "query"
+    # Each crawl target keeps its own journal, so crawling one audience never touches another's
+    if args.audience:
+        crawl_target = args.audience
+    elif args.subreddits:
+        crawl_target = "r_" + "+".join(s.strip() for s in args.subreddits.split(","))
+    else:
+        crawl_target = "saas_founders"
+    journal_file = args.journal or journal_path(crawl_target)
+    
+    finder = RedditSaaSFinder(
+        headless=not args.headed,
+        concurrency=args.concurrency,
+        min_request_interval=args.rate_limit,
+        max_retries=args.max_retries,
+        fetch_mode=args.fetch,
+        cache=None if args.no_cache or querying else SearchCache(ttl_seconds=args.cache_ttl * 3600),
+        scoring_profile=load_scoring_profile(args.scoring_profile),
+        post_index=None if args.no_post_index or args.rescore or querying else PostIndex(),
+        collapse_near_duplicates=not args.keep_near_duplicates,
+        journal=(
+            None if args.rescore or args.refresh or args.offline or querying or args.list_audiences
+            else CrawlJournal(journal_file, resume=args.resume, fresh=args.fresh_journal)
+        ),
+        snapshots=SnapshotStore(args.snapshot_dir) if args.snapshot_dir else None,
+        block_resources=args.block_resources,
+        warehouse=(
+            None if args.no_warehouse or args.rescore or args.list_audiences
+            else PostWarehouse(args.warehouse)
+        ),
+        llm_cache=(
+            LLMCache(ttl_seconds=args.llm_cache_ttl * 86400)
+            if args.ai_analysis and not args.no_llm_cache else None
+        )
+    )
+    
+    if (args.offline or querying) and finder.warehouse is None:
+        print("❌ --offline and query need the warehouse (drop --no-warehouse)")
+        return
     
-    finder = RedditSaaSFinder(headless=args.headless)
+    if finder.journal is not None and args.resume:
+        print(f"📓 Resuming: {len(finder.journal)} completed searches in {journal_file}")
     
     if args.list_audiences:
         print("\n📚 Available Curated Audiences:\n")
@@ -760,9 +1775,56 @@ async def main():
         return
     
     try:
-        await finder.start()
+        if args.fetch == "browser" and not args.rescore and not args.offline and not querying:
+            await finder.start()
         
-        if args.audience:
+        if querying:
+            # Ranked search over stored posts; the matches feed the report
+            if args.query_audience in finder.CURATED_AUDIENCES:
+                subreddits = finder.CURATED_AUDIENCES[args.query_audience]["subreddits"]
+            elif args.query_subreddits:
+                subreddits = [s.strip() for s in args.query_subreddits.split(",")]
+            else:
+                subreddits = None
+            finder.query_warehouse(
+                args.text,
+                subreddits,
+                args.query_intents,
+                args.query_min_score,
+                args.query_since_days,
+                args.query_limit
+            )
+        
+        elif args.offline:
+            # Analyze stored posts only; nothing is fetched
+            if args.audience in finder.CURATED_AUDIENCES:
+                subreddits = finder.CURATED_AUDIENCES[args.audience]["subreddits"]
+            elif args.subreddits:
+                subreddits = [s.strip() for s in args.subreddits.split(",")]
+            else:
+                subreddits = None
+            finder.load_warehouse(subreddits, since_days=args.since_days)
+        
+        elif args.rescore:
+            # Bulk re-score a saved corpus under the current profile
+            finder.posts = PostStore(load_posts(args.rescore))
+            finder.rescore()
+            save_posts(finder.posts, args.rescore)
+            print(f"♻️ Re-scored {len(finder.posts)} posts in {args.rescore}")
+        
+        elif args.refresh:
+            # Incremental refresh on top of the stored corpus
+            if not finder.post_index:
+                print("❌ --refresh needs the post index (drop --no-post-index)")
+                return
+            audience_keys = (
+                list(finder.CURATED_AUDIENCES) if args.audience in (None, "all") else [args.audience]
+            )
+            intents = args.themes.split(",") if args.themes else None
+            for audience_key in audience_keys:
+                await finder.refresh_audience(audience_key, intents, args.max_posts)
+        
+        elif args.audience:
             # Analyze curated audience
             intents = args.themes.split(",") if args.themes else None
             await finder.analyze_audience(args.audience, intents, args.max_posts)
@@ -772,23 +1834,42 @@ async def main():
             subreddits = [s.strip() for s in args.subreddits.split(",")]
             intents = args.themes.split(",") if args.themes else ["solution_request"]
             
-            for subreddit in subreddits:
-                for intent in intents:
-                    posts = await finder.search_by_intent(subreddit, intent, args.max_posts)
-                    finder.posts.extend(posts)
+            groups = [(subreddit, intent) for subreddit in subreddits for intent in intents]
+            results = await asyncio.gather(
+                *(finder.search_by_intent(subreddit, intent, args.max_posts) for subreddit, intent in groups),
+                return_exceptions=True
+            )
+            all_posts = []
+            for (subreddit, _), result in zip(groups, results):
+                if isinstance(result, BaseException):
+                    print(f"   ⚠️ Error searching r/{subreddit}: {result}")
+                    finder.failed_searches += 1
+                    continue
+                all_posts.extend(result)
             
             # Dedupe
-            seen = set()
-            finder.posts = [p for p in finder.posts if not (p.title in seen or seen.add(p.title))]
-            finder.posts.sort(key=lambda p: p.validation_score, reverse=True)
+            unique_posts = finder.unique_posts(all_posts)
+            finder.posts = PostStore(sorted(unique_posts, key=lambda p: p.validation_score, reverse=True))
         
         else:
             # Default: analyze SaaS founders audience
             print("No audience or subreddits specified. Using default: saas_founders")
             await finder.analyze_audience("saas_founders", max_posts_per_sub=15)
         
-        # Find patterns (keyword-based)
-        finder.find_patterns()
+        if finder.journal is not None:
+            if finder.failed_searches:
+                print(f"📓 {finder.failed_searches} searches failed; rerun with --resume to retry only those "
+                      f"(journal: {journal_file})")
+            else:
+                # Crawl finished cleanly: nothing left to resume
+                finder.journal.complete()
+        
+        if args.save_posts:
+            save_posts(finder.posts, args.save_posts)
+            print(f"💾 Saved {len(finder.posts)} posts to {args.save_posts}")
+        
+        # Find patterns (keyword-based; a refresh has already folded in its new posts)
+        finder.find_patterns(incremental=True)
         
         # AI analysis (optional)
         ai_patterns = None
@@ -819,10 +1900,55 @@ async def main():
         for i, post in enumerate(finder.get_top_validated_ideas(limit=5), 1):
             print(f"  {i}. [{post.validation_score}/10] {post.title[:60]}...")
         
+        if finder.cache:
+            cache_stats = finder.cache.stats()
+            print(f"\n💾 Search cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+                  f"({cache_stats['entries']} entries, {cache_stats['bytes'] / 1024:.0f} KB)")
+        
+        if finder.llm_cache is not None:
+            llm_stats = finder.llm_cache.stats()
+            print(f"🧠 LLM cache: {llm_stats['hits']} hits, {llm_stats['misses']} misses "
+                  f"({llm_stats['hit_rate']:.0%} hit rate, {llm_stats['entries']} entries, "
+                  f"{llm_stats['bytes'] / 1024:.0f} KB)")
+        
+        if finder.post_index:
+            index_stats = finder.post_index.stats()
+            print(f"🆔 Post index: {index_stats['added']} new, {index_stats['known']} seen before "
+                  f"({index_stats['entries']} indexed)")
+        
+        if finder.warehouse is not None:
+            warehouse_stats = finder.warehouse.stats()
+            print(f"🏛️ Warehouse: {warehouse_stats['written']} posts written "
+                  f"({warehouse_stats['entries']} stored across {warehouse_stats['subreddits']} subreddits)")
+        
+        rate_stats = finder.scheduler.rate_limiter.format_stats()
+        if rate_stats:
+            print(f"\n🚦 Request pacing:\n{rate_stats}")
+        
+        wait_stats = format_wait_stats()
+        if wait_stats:
+            print(f"\n⏱️ Page wait timings:\n{wait_stats}")
+        
+        extraction_stats = format_extraction_stats()
+        if extraction_stats:
+            print(f"\n🧩 Extraction yield:\n{extraction_stats}")
+        if finder.snapshots is not None:
+            print(f"🎞️ Saved {finder.snapshots.captured} page snapshots to {finder.snapshots.directory}")
+        
         print(f"\n📄 Full report: {output_path}")
         
     finally:
         await finder.stop()
+        if finder.cache:
+            finder.cache.close()
+        if finder.post_index:
+            finder.post_index.close()
+        if finder.journal is not None:
+            finder.journal.close()
+        if finder.warehouse is not None:
+            finder.warehouse.close()
+        if finder.llm_cache is not None:
+            finder.llm_cache.close()
 
 
 if __name__ == "__main__":
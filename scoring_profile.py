@@ -0,0 +1,80 @@
+"""
+Scoring profiles for SaaS validation scores.
+
+All weights and caps used by calculate_validation_score (and its batch
+version) live in one ScoringProfile, so the CLI, the web UI tools and bulk
+re-scoring all rank posts the same way. Profiles load from JSON; any key left
+out keeps its default.
+
+Example profile (JSON):
+    {
+        "intent_weights": {"solution_request": 3.0, "willingness_to_pay": 5.0},
+        "upvotes_per_point": 100,
+        "pain_signal_cap": 2.0
+    }
+
+Usage:
+    from scoring_profile import load_scoring_profile
+
+    profile = load_scoring_profile("profiles/payment_heavy.json")
+"""
+
+import json
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from typing import Optional
+
+
+def _default_intent_weights() -> dict[str, float]:
+    # Order matters: scores are summed in this order
+    return {
+        "solution_request": 3.0,
+        "pain_point": 2.0,
+        "willingness_to_pay": 4.0,
+        "advice_request": 1.0,
+    }
+
+
+@dataclass
+class ScoringProfile:
+    """Weights and caps for the 0-10 SaaS validation score."""
+    intent_weights: dict = field(default_factory=_default_intent_weights)
+    upvotes_per_point: float = 50.0
+    upvotes_cap: float = 2.0
+    comments_per_point: float = 25.0
+    comments_cap: float = 2.0
+    payment_signal_weight: float = 0.5
+    payment_signal_cap: float = 2.0
+    pain_signal_weight: float = 0.3
+    pain_signal_cap: float = 1.5
+    max_score: float = 10.0
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ScoringProfile":
+        """Build a profile from a dict, keeping defaults for missing keys."""
+        known = {f.name for f in fields(cls)}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"Unknown scoring profile keys: {', '.join(sorted(unknown))}")
+
+        profile = cls(**{k: v for k, v in data.items() if k != "intent_weights"})
+        if "intent_weights" in data:
+            profile.intent_weights = {**profile.intent_weights, **data["intent_weights"]}
+        return profile
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def save(self, path: str):
+        """Write the profile as JSON."""
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+
+
+DEFAULT_PROFILE = ScoringProfile()
+
+
+def load_scoring_profile(path: Optional[str] = None) -> ScoringProfile:
+    """Load a profile from a JSON file, or return the default profile if no path is given."""
+    if not path:
+        return DEFAULT_PROFILE
+    return ScoringProfile.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
@@ -0,0 +1,127 @@
+"""
+Shared, versioned registry of in-page extraction scripts.
+
+Extraction JavaScript used to be pasted inline wherever it was needed, so
+copies drifted apart and every call shipped the full script text to the
+page. Scripts now live in one place and are invoked by name:
+1. Each `extraction_scripts/<name>.js` file holds one function expression;
+   files starting with `_` hold helpers shared by every script
+2. All scripts are bundled into one init script that defines
+   `window.__extractors`, versioned by a hash of the script sources
+3. `install_scripts()` registers the bundle on a page before it navigates,
+   so every document it loads already has the scripts; `run_script()` then
+   sends only the script name and its arguments
+4. Documents without the current bundle (pages that don't support init
+   scripts, or a stale version) get it evaluated on the first call
+
+Usage:
+    from script_registry import install_scripts, run_script
+
+    await install_scripts(page)
+    await goto_and_wait(page, url, REDDIT_POST_SELECTORS)
+    output = await run_script(page, "reddit_posts", [REDDIT_POST_SELECTORS, 20, 200, 500])
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).parent / "extraction_scripts"
+
+# Invokes a registered script, or reports that this document lacks the bundle version
+CALL_SCRIPT_JS = """
+([version, name, arg]) => {
+    const registry = window.__extractors;
+    if (!registry || registry.version !== version) return {missing: true};
+    return {value: registry.run(name, arg)};
+}
+"""
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+
+@dataclass(frozen=True)
+class ExtractionScript:
+    """One named extraction script and the hash of its source."""
+    name: str
+    source: str
+    version: str
+
+
+class ScriptRegistry:
+    """Extraction scripts loaded once from a directory and bundled for injection."""
+
+    def __init__(self, directory: Path | str = SCRIPTS_DIR):
+        self.directory = Path(directory)
+        self.helpers: list[str] = []
+        self.scripts: dict[str, ExtractionScript] = {}
+        self.stats = {"calls": 0, "init_installs": 0, "lazy_installs": 0}
+
+        for path in sorted(self.directory.glob("*.js")):
+            source = path.read_text(encoding="utf-8").strip()
+            if path.stem.startswith("_"):
+                self.helpers.append(source)
+            else:
+                self.scripts[path.stem] = ExtractionScript(path.stem, source, _digest(source))
+
+        self.version = _digest("\n".join(
+            self.helpers + [f"{s.name}:{s.version}" for s in self.scripts.values()]
+        ))
+        self.bundle = self._build_bundle()
+        # Same bundle as a function expression, for page.evaluate
+        self.install_js = "() => {\n" + self.bundle + "\nreturn window.__extractors.version;\n}"
+
+    def _build_bundle(self) -> str:
+        entries = ",\n".join(f"{json.dumps(s.name)}: (\n{s.source}\n)" for s in self.scripts.values())
+        return (
+            "(() => {\n"
+            f"if (window.__extractors && window.__extractors.version === {json.dumps(self.version)}) return;\n"
+            + "\n".join(self.helpers)
+            + f"\nconst scripts = {{\n{entries}\n}};\n"
+            f"window.__extractors = {{version: {json.dumps(self.version)}, run: (name, arg) => scripts[name](arg)}};\n"
+            "})();"
+        )
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.scripts
+
+    def manifest(self) -> dict:
+        """Bundle version plus each script's version."""
+        return {"version": self.version, "scripts": {s.name: s.version for s in self.scripts.values()}}
+
+
+REGISTRY = ScriptRegistry()
+
+
+async def install_scripts(page, registry: ScriptRegistry = REGISTRY) -> bool:
+    """
+    Register the script bundle as an init script so every document the page
+    loads has it. Returns False if the page has no init-script support (the
+    bundle is then evaluated on first use instead).
+    """
+    add_init_script = getattr(page, "add_init_script", None)
+    if add_init_script is None:
+        return False
+    try:
+        await add_init_script(registry.bundle)
+    except Exception:
+        return False
+    registry.stats["init_installs"] += 1
+    return True
+
+
+async def run_script(page, name: str, arg=None, registry: ScriptRegistry = REGISTRY):
+    """Run a registered extraction script by name and return its result."""
+    if name not in registry:
+        raise KeyError(f"Unknown extraction script: {name}")
+
+    registry.stats["calls"] += 1
+    output = await page.evaluate(CALL_SCRIPT_JS, [registry.version, name, arg]) or {}
+    if output.get("missing"):
+        registry.stats["lazy_installs"] += 1
+        await page.evaluate(registry.install_js)
+        output = await page.evaluate(CALL_SCRIPT_JS, [registry.version, name, arg]) or {}
+    return output.get("value")
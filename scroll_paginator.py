@@ -0,0 +1,143 @@
+"""
+Infinite-scroll pagination for Reddit listing/search pages.
+
+Reddit renders about one screen of posts and loads more as you scroll, so a
+fixed number of PageDown presses caps how many posts a scrape can return.
+ScrollPaginator keeps scrolling until it has what it needs:
+1. Stops once `max_posts` distinct posts are collected, no new posts appear
+   for `max_idle_rounds` scrolls, `stop_when` matches, or the time budget
+   runs out
+2. A MutationObserver queues post nodes as they are added, so each round
+   extracts only the new nodes instead of re-querying the whole DOM
+   (`reddit_scroll_observe`/`reddit_scroll_drain` in script_registry)
+3. Posts are deduplicated by permalink (title when there is none)
+
+Usage:
+    from scroll_paginator import ScrollPaginator
+
+    await goto_and_wait(page, url, REDDIT_POST_SELECTORS, label="reddit_search")
+    result = await ScrollPaginator(page).collect(max_posts=200)
+    print(result.rounds, result.stop_reason, len(result.posts))
+
+    # Or stream each round's new posts as it is extracted
+    async for batch in ScrollPaginator(page).iter_batches(max_posts=200):
+        ...
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Optional
+
+from page_waits import REDDIT_POST_SELECTORS, wait_for_quiet
+from script_registry import run_script
+
+SCROLL_TO_BOTTOM_JS = "() => window.scrollTo(0, document.documentElement.scrollHeight)"
+
+
+def post_key(raw: dict) -> str:
+    """Dedupe key for a scraped post: its permalink, or its title if it has none."""
+    return raw.get("url") or raw["title"]
+
+
+@dataclass
+class ScrollResult:
+    """Posts collected by one paginated scrape and why it stopped."""
+    posts: list = field(default_factory=list)
+    rounds: int = 0
+    stop_reason: str = ""  # "max_posts", "exhausted", "stop_when" or "time_budget"
+    layout: str = ""  # Post selector that matched when scrolling started, "" if none
+
+
+class ScrollPaginator:
+    """Scrolls a rendered listing page until enough distinct posts are loaded."""
+
+    def __init__(
+        self,
+        page,
+        selectors: list[str] = None,
+        max_idle_rounds: int = 2,
+        time_budget: float = 30.0,
+        quiet_ms: int = 300,
+        round_timeout_ms: int = 2000,
+        title_chars: int = 300,
+        body_chars: int = 1000
+    ):
+        self.page = page
+        self.selectors = selectors or REDDIT_POST_SELECTORS
+        self.max_idle_rounds = max_idle_rounds
+        self.time_budget = time_budget
+        self.quiet_ms = quiet_ms
+        self.round_timeout_ms = round_timeout_ms
+        self.title_chars = title_chars
+        self.body_chars = body_chars
+
+    async def iter_batches(
+        self,
+        max_posts: int,
+        stop_when: Optional[Callable[[dict], bool]] = None,
+        label: str = "reddit_scroll",
+        result: Optional[ScrollResult] = None
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Yield the new distinct raw posts of each scroll round as soon as they
+        are extracted, until `max_posts` in total. Posts from `stop_when`'s
+        match onwards are not returned. Pass a ScrollResult to have the
+        round count, stop reason and matched layout recorded in it.
+        """
+        result = result if result is not None else ScrollResult()
+        deadline = time.monotonic() + self.time_budget
+        seen = set()
+        collected = 0
+        idle_rounds = 0
+
+        result.layout = await run_script(self.page, "reddit_scroll_observe", self.selectors) or ""
+
+        while True:
+            result.rounds += 1
+            batch = await run_script(self.page, "reddit_scroll_drain", [self.title_chars, self.body_chars]) or []
+
+            new_posts = []
+            for raw in batch:
+                key = post_key(raw)
+                if key in seen:
+                    continue
+                seen.add(key)
+                if stop_when and stop_when(raw):
+                    result.stop_reason = "stop_when"
+                    break
+                new_posts.append(raw)
+                if collected + len(new_posts) >= max_posts:
+                    result.stop_reason = "max_posts"
+                    break
+
+            if new_posts:
+                collected += len(new_posts)
+                yield new_posts
+            if result.stop_reason:
+                return
+
+            idle_rounds = 0 if new_posts else idle_rounds + 1
+            if idle_rounds >= self.max_idle_rounds:
+                result.stop_reason = "exhausted"
+                return
+            if time.monotonic() >= deadline:
+                result.stop_reason = "time_budget"
+                return
+
+            await self.page.evaluate(SCROLL_TO_BOTTOM_JS)
+            await wait_for_quiet(self.page, label, quiet_ms=self.quiet_ms, timeout_ms=self.round_timeout_ms)
+
+    async def collect(
+        self,
+        max_posts: int,
+        stop_when: Optional[Callable[[dict], bool]] = None,
+        label: str = "reddit_scroll"
+    ) -> ScrollResult:
+        """
+        Collect up to `max_posts` distinct raw posts, scrolling for more as
+        needed. Posts from `stop_when`'s match onwards are not returned.
+        """
+        result = ScrollResult()
+        async for batch in self.iter_batches(max_posts, stop_when, label, result):
+            result.posts.extend(batch)
+        return result
@@ -0,0 +1,172 @@
+"""
+Persistent on-disk cache of Reddit search results.
+
+Sits in front of RedditSaaSFinder.search_subreddit so repeated and
+overlapping research runs don't re-scrape the same subreddit/query pairs:
+1. Keyed by (subreddit, query, sort, time_filter, max_posts, backend); the
+   JSON API fills in full bodies, scores and timestamps that a browser scrape
+   may miss, so one backend's results never answer the other's searches
+2. Entries expire after a TTL
+3. Least-recently-used entries are evicted once the cache exceeds `max_bytes`
+4. Hit/miss counters for the current process
+
+Raw post dicts are cached (before intent classification and scoring), so
+scoring changes apply to cached results too.
+
+Usage:
+    from search_cache import SearchCache
+
+    cache = SearchCache(ttl_seconds=6 * 3600)
+    raw_posts = cache.get("SaaS", "looking for tool", "relevance", "year", 25, backend="json")
+    if raw_posts is None:
+        raw_posts = await fetch(...)
+        cache.put("SaaS", "looking for tool", "relevance", "year", 25, raw_posts, backend="json")
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_CACHE_PATH = Path(__file__).parent / ".cache" / "reddit_search_cache.sqlite3"
+
+
+class SearchCache:
+    """SQLite-backed TTL cache of raw search results."""
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_CACHE_PATH,
+        ttl_seconds: float = 24 * 3600,
+        max_bytes: int = 50 * 1024 * 1024
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS search_cache (
+                key TEXT PRIMARY KEY,
+                subreddit TEXT NOT NULL,
+                query TEXT NOT NULL,
+                sort TEXT NOT NULL,
+                time_filter TEXT NOT NULL,
+                max_posts INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                size INTEGER NOT NULL,
+                payload TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_search_cache_last_used ON search_cache(last_used)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(
+        subreddit: str,
+        query: str,
+        sort: str,
+        time_filter: str,
+        max_posts: int,
+        backend: str = "browser"
+    ) -> str:
+        """Build the cache key for a search run with `backend` ("browser" or "json")."""
+        return json.dumps([subreddit.lower(), query, sort, time_filter, max_posts, backend])
+
+    def get(
+        self,
+        subreddit: str,
+        query: str,
+        sort: str,
+        time_filter: str,
+        max_posts: int,
+        backend: str = "browser"
+    ) -> Optional[list[dict]]:
+        """Return cached raw posts fetched by `backend`, or None if missing or expired."""
+        key = self.make_key(subreddit, query, sort, time_filter, max_posts, backend)
+        row = self._conn.execute(
+            "SELECT created_at, payload FROM search_cache WHERE key = ?", (key,)
+        ).fetchone()
+
+        now = time.time()
+        if row is None or now - row[0] > self.ttl_seconds:
+            if row is not None:
+                self._conn.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+                self._conn.commit()
+            self.misses += 1
+            return None
+
+        self._conn.execute("UPDATE search_cache SET last_used = ? WHERE key = ?", (now, key))
+        self._conn.commit()
+        self.hits += 1
+        return json.loads(row[1])
+
+    def put(
+        self,
+        subreddit: str,
+        query: str,
+        sort: str,
+        time_filter: str,
+        max_posts: int,
+        raw_posts: list[dict],
+        backend: str = "browser"
+    ):
+        """Store raw posts fetched by `backend`, evicting old entries if over the size limit."""
+        key = self.make_key(subreddit, query, sort, time_filter, max_posts, backend)
+        payload = json.dumps(raw_posts)
+        now = time.time()
+        self._conn.execute(
+            """
+            INSERT OR REPLACE INTO search_cache
+                (key, subreddit, query, sort, time_filter, max_posts, created_at, last_used, size, payload)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (key, subreddit, query, sort, time_filter, max_posts, now, now, len(payload), payload)
+        )
+        self._evict()
+        self._conn.commit()
+
+    def _evict(self):
+        """Drop least-recently-used entries until the cache fits in `max_bytes`."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM search_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        excess = total - self.max_bytes
+        doomed = []
+        for key, size in self._conn.execute("SELECT key, size FROM search_cache ORDER BY last_used ASC"):
+            doomed.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM search_cache WHERE key = ?", doomed)
+
+    def clear(self):
+        """Remove every cached entry."""
+        self._conn.execute("DELETE FROM search_cache")
+        self._conn.commit()
+
+    def stats(self) -> dict:
+        """Hit/miss counters for this process plus current cache size."""
+        entries, size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM search_cache"
+        ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": entries,
+            "bytes": size,
+        }
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
@@ -0,0 +1,212 @@
+"""
+Bounded-concurrency search scheduler for RedditSaaSFinder.
+
+Fans subreddit × intent × query searches out across a shared browser instead
+of walking them one by one:
+1. Caps the number of searches in flight (parallel contexts/tabs)
+2. Paces requests per host with a token bucket whose rate adapts: it slows
+   down when a host serves block/captcha/empty pages and speeds back up
+   while requests succeed
+3. Retries blocked searches with jittered exponential backoff
+4. Returns results in task order, whatever order they finish in
+5. Keeps per-host request/block/retry metrics
+
+Usage:
+    from search_scheduler import SearchScheduler, SearchTask
+
+    scheduler = SearchScheduler(concurrency=4, min_interval=1.0)
+    tasks = [SearchTask("SaaS", "looking for tool"), SearchTask("startups", "tired of")]
+    results = await scheduler.run(tasks, search_fn)
+    print(scheduler.rate_limiter.format_stats())
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+REDDIT_HOST = "www.reddit.com"
+
+
+@dataclass(frozen=True)
+class SearchTask:
+    """A single subreddit search unit."""
+    subreddit: str
+    query: str
+    sort: str = "relevance"
+    time_filter: str = "year"
+    max_posts: int = 25
+    host: str = REDDIT_HOST
+
+
+class BlockedError(Exception):
+    """
+    Raised by a search or navigation that hit a block, captcha or
+    suspiciously empty page. The scheduler backs off and retries it.
+    """
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass
+class HostMetrics:
+    """Token bucket state and metrics for one host."""
+    interval: float
+    tokens: float = 1.0
+    updated: float = 0.0
+    requests: int = 0
+    successes: int = 0
+    blocks: int = 0
+    retries: int = 0
+    waited: float = 0.0
+
+
+class HostRateLimiter:
+    """
+    Per-host token bucket with adaptive pacing.
+    Each host refills one token every `interval` seconds (up to `burst`
+    tokens). A block doubles the host's interval, up to `max_interval`;
+    every success shrinks it by 10% back towards `min_interval`.
+    """
+
+    def __init__(self, min_interval: float = 1.0, burst: int = 1, max_interval: float = 60.0):
+        self.min_interval = min_interval
+        self.burst = max(1, burst)
+        self.max_interval = max(max_interval, min_interval)
+        self.hosts: dict[str, HostMetrics] = {}
+        self._lock = asyncio.Lock()
+
+    def _host(self, host: str) -> HostMetrics:
+        metrics = self.hosts.get(host)
+        if metrics is None:
+            metrics = self.hosts[host] = HostMetrics(
+                interval=self.min_interval, tokens=self.burst, updated=time.monotonic()
+            )
+        return metrics
+
+    async def acquire(self, host: str):
+        """Wait until a token for `host` is available."""
+        async with self._lock:
+            metrics = self._host(host)
+            now = time.monotonic()
+            if metrics.interval > 0:
+                refill = (now - metrics.updated) / metrics.interval
+                metrics.tokens = min(self.burst, metrics.tokens + refill)
+            else:
+                metrics.tokens = self.burst
+            metrics.updated = now
+            # Negative tokens are reservations queued behind earlier callers
+            metrics.tokens -= 1
+            delay = -metrics.tokens * metrics.interval if metrics.tokens < 0 else 0.0
+            metrics.requests += 1
+            metrics.waited += delay
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def report_success(self, host: str):
+        """Record a good response; speeds the host back up."""
+        metrics = self._host(host)
+        metrics.successes += 1
+        metrics.interval = max(self.min_interval, metrics.interval * 0.9)
+
+    def report_block(self, host: str):
+        """Record a block/captcha/empty page; slows the host down."""
+        metrics = self._host(host)
+        metrics.blocks += 1
+        metrics.interval = min(self.max_interval, max(metrics.interval, 0.5) * 2)
+        metrics.tokens = min(metrics.tokens, 0.0)
+
+    def backoff_delay(self, host: str, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Jittered exponential backoff before retry number `attempt` (0-based)."""
+        metrics = self._host(host)
+        metrics.retries += 1
+        ceiling = min(self.max_interval, max(metrics.interval, 1.0) * 2 ** attempt)
+        delay = random.uniform(ceiling / 2, ceiling)
+        return max(delay, retry_after or 0.0)
+
+    def stats(self) -> dict[str, dict]:
+        """Per-host metrics."""
+        return {
+            host: {
+                "requests": m.requests,
+                "successes": m.successes,
+                "blocks": m.blocks,
+                "retries": m.retries,
+                "interval": round(m.interval, 2),
+                "waited": round(m.waited, 1),
+            }
+            for host, m in self.hosts.items()
+        }
+
+    def format_stats(self) -> str:
+        """Format per-host metrics as a markdown table."""
+        if not self.hosts:
+            return ""
+
+        lines = [
+            "| Host | Requests | Blocks | Retries | Interval s | Waited s |",
+            "|------|----------|--------|---------|------------|----------|",
+        ]
+        for host, stats in sorted(self.stats().items()):
+            lines.append(
+                f"| {host} | {stats['requests']} | {stats['blocks']} | {stats['retries']} "
+                f"| {stats['interval']:.2f} | {stats['waited']:.1f} |"
+            )
+        return "\n".join(lines)
+
+
+class SearchScheduler:
+    """
+    Runs search tasks with bounded concurrency and adaptive per-host rate
+    limiting, retrying searches that raise BlockedError.
+    Every call to `run` shares the same concurrency budget, so nested fan-outs
+    (audience → intent → query) never exceed `concurrency` searches in flight.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 4,
+        min_interval: float = 1.0,
+        max_retries: int = 3,
+        burst: int = 1
+    ):
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max_retries
+        self.rate_limiter = HostRateLimiter(min_interval, burst)
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+
+    async def _run_one(self, task: SearchTask, search_fn: Callable[[SearchTask], Awaitable]):
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                await self.rate_limiter.acquire(task.host)
+                try:
+                    result = await search_fn(task)
+                except BlockedError as e:
+                    self.rate_limiter.report_block(task.host)
+                    if attempt == self.max_retries:
+                        raise
+                    delay = self.rate_limiter.backoff_delay(task.host, attempt, e.retry_after)
+                    print(f"   🚦 Blocked on r/{task.subreddit} ({e}), retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+                    continue
+                self.rate_limiter.report_success(task.host)
+                return result
+
+    async def run(
+        self,
+        tasks: list[SearchTask],
+        search_fn: Callable[[SearchTask], Awaitable]
+    ) -> list:
+        """
+        Run `search_fn` over all tasks.
+        Returns one result per task, in task order. A task that raised
+        yields its exception in place of a result.
+        """
+        return await asyncio.gather(
+            *(self._run_one(task, search_fn) for task in tasks),
+            return_exceptions=True
+        )
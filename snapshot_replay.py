@@ -0,0 +1,194 @@
+"""
+Offline replay benchmark for the extraction scripts.
+
+Runs the current script_registry scripts against a page_snapshots corpus
+instead of live Reddit/GummySearch, so extraction changes can be measured
+and regression-checked offline:
+1. Serves the snapshot directory from a local HTTP server
+2. Loads each snapshot in a headless browser (pooled page with the script
+   registry installed) and runs its recorded script `--repeat` times
+3. Reports per (label, layout): extraction time, items/second, field
+   completeness (share of items with each field non-empty) and how the
+   replayed item count compares with what the live scrape returned
+
+Usage:
+    python snapshot_replay.py --dir snapshots --repeat 5
+    python snapshot_replay.py --label reddit_search --json results/replay.json
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import quote
+
+from browser_use import Browser
+
+from browser_pool import BrowserPool
+from page_snapshots import DEFAULT_SNAPSHOT_DIR, Snapshot, SnapshotStore
+from page_waits import goto_and_wait
+from script_registry import REGISTRY, install_scripts, run_script
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@dataclass
+class ReplayStats:
+    """Replay totals for one (label, layout) pair."""
+    snapshots: int = 0
+    runs: int = 0
+    seconds: float = 0.0
+    items: int = 0  # Items per run, summed over snapshots
+    live_items: int = 0
+    field_filled: dict = field(default_factory=dict)
+
+    @property
+    def avg_ms(self) -> float:
+        return self.seconds / self.runs * 1000 if self.runs else 0.0
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items * (self.runs / self.snapshots) / self.seconds if self.seconds else 0.0
+
+    def completeness(self) -> dict[str, float]:
+        """Share of extracted items with each field non-empty."""
+        return {name: filled / self.items for name, filled in self.field_filled.items()} if self.items else {}
+
+
+def count_filled_fields(items: list, filled: dict):
+    """Add each item's non-empty fields to `filled` (plain strings count as a `text` field)."""
+    for item in items:
+        fields = item if isinstance(item, dict) else {"text": item}
+        for name, value in fields.items():
+            filled[name] = filled.get(name, 0) + (1 if value not in ("", None, [], 0) else 0)
+
+
+def serve_directory(directory: Path) -> ThreadingHTTPServer:
+    """Serve `directory` on a free localhost port from a background thread."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(_QuietHandler, directory=str(directory)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def replay_snapshot(page, base_url: str, snapshot: Snapshot, repeat: int) -> tuple[str, list, float]:
+    """Load one snapshot and time `repeat` runs of its script: (layout, items, seconds)."""
+    await goto_and_wait(page, f"{base_url}/{quote(snapshot.html_file)}", label="snapshot_replay")
+    # Untimed warm-up run so lazy script installation isn't measured
+    await run_script(page, snapshot.script, snapshot.arg)
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        output = await run_script(page, snapshot.script, snapshot.arg)
+    elapsed = time.perf_counter() - started
+
+    if isinstance(output, dict):
+        return output.get("layout") or "", output.get("items") or [], elapsed
+    return "", output or [], elapsed
+
+
+async def replay_corpus(
+    store: SnapshotStore,
+    labels: list[str] = None,
+    repeat: int = 3
+) -> dict[tuple[str, str], ReplayStats]:
+    """Replay every snapshot in `store` and aggregate stats per (label, layout)."""
+    snapshots = [s for s in store.snapshots(labels) if s.script in REGISTRY]
+    stats: dict[tuple[str, str], ReplayStats] = {}
+    if not snapshots:
+        return stats
+
+    server = serve_directory(store.directory)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    browser = Browser(headless=True)
+    await browser.start()
+    pool = BrowserPool(browser, size=1, setup=install_scripts)
+    try:
+        for i, snapshot in enumerate(snapshots, 1):
+            async with pool.page() as page:
+                layout, items, elapsed = await replay_snapshot(page, base_url, snapshot, repeat)
+
+            entry = stats.setdefault((snapshot.label, layout or "none"), ReplayStats())
+            entry.snapshots += 1
+            entry.runs += repeat
+            entry.seconds += elapsed
+            entry.items += len(items)
+            entry.live_items += snapshot.item_count
+            count_filled_fields(items, entry.field_filled)
+
+            drift = "" if len(items) == snapshot.item_count else f" (live: {snapshot.item_count})"
+            print(f"  [{i}/{len(snapshots)}] {snapshot.label}: {len(items)} items{drift}, {elapsed / repeat * 1000:.1f}ms")
+    finally:
+        await pool.close()
+        await browser.kill()
+        server.shutdown()
+    return stats
+
+
+def format_replay_stats(stats: dict[tuple[str, str], ReplayStats]) -> str:
+    """Format replay results as markdown tables."""
+    if not stats:
+        return ""
+
+    lines = [
+        "| Extraction | Layout | Snapshots | Avg ms | Items/s | Items (live) |",
+        "|------------|--------|-----------|--------|---------|--------------|",
+    ]
+    for (label, layout), entry in sorted(stats.items()):
+        lines.append(
+            f"| {label} | `{layout}` | {entry.snapshots} | {entry.avg_ms:.1f} | "
+            f"{entry.items_per_second:.0f} | {entry.items} ({entry.live_items}) |"
+        )
+
+    lines += ["", "| Extraction | Layout | Field completeness |", "|------------|--------|--------------------|"]
+    for (label, layout), entry in sorted(stats.items()):
+        fields = ", ".join(f"{name} {share:.0%}" for name, share in sorted(entry.completeness().items()))
+        lines.append(f"| {label} | `{layout}` | {fields or '-'} |")
+    return "\n".join(lines)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark extraction scripts against saved page snapshots")
+    parser.add_argument("--dir", default=str(DEFAULT_SNAPSHOT_DIR), help="Snapshot directory")
+    parser.add_argument("--label", action="append", help="Only replay this label (repeatable)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed extraction runs per snapshot")
+    parser.add_argument("--json", help="Also write the stats to this JSON file")
+    args = parser.parse_args()
+
+    store = SnapshotStore(args.dir)
+    print(f"🎞️ Replaying snapshots from {store.directory} (scripts {REGISTRY.version})")
+    stats = await replay_corpus(store, args.label, max(1, args.repeat))
+    if not stats:
+        print("⚠️ No snapshots found")
+        return
+
+    print(f"\n📊 Replay results:\n{format_replay_stats(stats)}")
+
+    if args.json:
+        rows = [
+            {
+                "label": label,
+                "layout": layout,
+                "snapshots": entry.snapshots,
+                "avg_ms": entry.avg_ms,
+                "items_per_second": entry.items_per_second,
+                "items": entry.items,
+                "live_items": entry.live_items,
+                "completeness": entry.completeness(),
+            }
+            for (label, layout), entry in sorted(stats.items())
+        ]
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.json).write_text(json.dumps({"scripts": REGISTRY.manifest(), "results": rows}, indent=2))
+        print(f"💾 Stats saved to {args.json}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
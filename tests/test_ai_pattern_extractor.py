@@ -0,0 +1,118 @@
+"""AIPatternExtractor prompting logic with a fake model in place of Gemini."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import ai_pattern_extractor
+from ai_pattern_extractor import AIPatternExtractor, merge_patterns, pattern_from_dict
+
+
+class FakeModel:
+    """Answers pattern prompts by the markers found in the posts text."""
+
+    def __init__(self):
+        self.prompts = []
+
+    async def generate_content_async(self, prompt):
+        self.prompts.append(prompt)
+        if "<<fail>>" in prompt:
+            raise RuntimeError("quota exceeded")
+        if "<<empty>>" in prompt:
+            return SimpleNamespace(text='{"patterns": []}')
+        name, count, score = prompt.split("<<pattern ")[1].split(">>")[0].split("|")
+        pattern = {"name": name, "post_count": int(count), "opportunity_score": float(score)}
+        return SimpleNamespace(text="```json\n" + json.dumps({"patterns": [pattern]}) + "\n```")
+
+
+def _extractor() -> AIPatternExtractor:
+    extractor = AIPatternExtractor()
+    extractor.model = FakeModel()
+    return extractor
+
+
+def test_merge_patterns_adds_counts_and_weights_scores():
+    patterns = [
+        pattern_from_dict({"name": "Invoice chasing", "post_count": 3, "opportunity_score": 8.0, "example_quotes": ["a"]}),
+        pattern_from_dict({"name": "Chasing invoice!", "post_count": 1, "opportunity_score": 4.0, "example_quotes": ["b", "a"]}),
+        pattern_from_dict({"name": "Payroll", "post_count": 2, "opportunity_score": 9.0}),
+    ]
+
+    merged = merge_patterns(patterns)
+
+    assert [(p.name, p.post_count, p.opportunity_score) for p in merged] == [
+        ("Payroll", 2, 9.0),
+        ("Invoice chasing", 4, 7.0),
+    ]
+    assert merged[1].example_quotes == ["a", "b"]
+
+
+def test_map_reduce_counts_only_errored_chunks_as_failed(capsys):
+    extractor = _extractor()
+    chunks = ["<<pattern Invoice chasing|2|8>>", "<<fail>>", "<<empty>>", "<<pattern chasing invoice|2|6>>"]
+
+    patterns = asyncio.run(extractor._map_reduce_patterns(chunks, "", 10))
+
+    assert [(p.name, p.post_count, p.opportunity_score) for p in patterns] == [("Invoice chasing", 4, 7.0)]
+    out = capsys.readouterr().out
+    assert "Chunk 2/4 failed" in out
+    assert "from 3 chunks" in out
+
+
+def test_map_reduce_with_no_patterns_anywhere_is_not_a_failure():
+    patterns = asyncio.run(_extractor()._map_reduce_patterns(["<<empty>>", "<<empty>>"], "", 10))
+
+    assert patterns == []
+
+
+def test_map_reduce_raises_when_every_chunk_fails():
+    with pytest.raises(RuntimeError, match="every chunk failed"):
+        asyncio.run(_extractor()._map_reduce_patterns(["<<fail>>", "<<fail>>"], "", 10))
+
+
+def _post(number: int, score: float, body_words: int = 5) -> dict:
+    return {
+        "title": f"Post {number}",
+        "body": " ".join(f"word{number}x{i}" for i in range(body_words)),
+        "subreddit": "SaaS",
+        "upvotes": 1,
+        "comments": 0,
+        "intents": ["solution_request"],
+        "validation_score": score,
+    }
+
+
+def test_packing_never_goes_below_the_minimum_budget():
+    extractor = AIPatternExtractor(chunk_token_budget=500)  # Less than the prompt overhead
+    posts = [_post(i, score=5.0, body_words=40) for i in range(200)]
+
+    packed = extractor._prepare_posts_for_analysis(posts)
+
+    assert 0 < packed.included < packed.total
+    assert ai_pattern_extractor.MIN_POSTS_TOKENS - 200 < packed.tokens <= ai_pattern_extractor.MIN_POSTS_TOKENS
+
+
+def test_packing_ranks_by_signal_and_skips_posts_that_do_not_fit(monkeypatch):
+    monkeypatch.setattr(ai_pattern_extractor, "MIN_POSTS_TOKENS", 1)
+    extractor = AIPatternExtractor()
+    posts = [_post(1, score=2.0), _post(2, score=9.0, body_words=60), _post(3, score=6.0), _post(4, score=4.0)]
+    short = ai_pattern_extractor.estimate_tokens(extractor._format_post(ai_pattern_extractor.post_fields(posts[0]), 1))
+
+    packed = extractor._prepare_posts_for_analysis(posts, token_budget=2 * short + 1)
+
+    # Post 2 ranks first but is too long; the next two short posts fill the budget
+    assert packed.included == 2
+    assert packed.text.index("Post 3") < packed.text.index("Post 4")
+    assert "Post 2" not in packed.text and "Post 1" not in packed.text
+
+
+def test_packing_warns_when_no_post_fits(monkeypatch, capsys):
+    monkeypatch.setattr(ai_pattern_extractor, "MIN_POSTS_TOKENS", 10)
+    extractor = AIPatternExtractor(chunk_token_budget=500)
+
+    packed = extractor._prepare_posts_for_analysis([_post(1, score=5.0, body_words=40)])
+
+    assert packed.included == 0 and packed.text == ""
+    assert "No post fits in 10 tokens" in capsys.readouterr().out
@@ -0,0 +1,145 @@
+"""BrowserPool against fake Playwright objects standing in for a CDP-connected browser."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("playwright")
+
+import browser_pool  # noqa: E402
+from browser_pool import BrowserPool  # noqa: E402
+
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+        self.healthy = True
+
+    async def evaluate(self, script):
+        if not self.healthy:
+            raise RuntimeError("Target closed")
+        return "complete"
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+
+    async def new_page(self):
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.context = FakeContext()
+        self.connected_to = None
+        self.disconnected = False
+        self.stopped = False
+        self.chromium = SimpleNamespace(connect_over_cdp=self._connect)
+
+    async def _connect(self, cdp_url):
+        self.connected_to = cdp_url
+
+        async def close():
+            self.disconnected = True
+
+        return SimpleNamespace(contexts=[self.context], close=close)
+
+    async def start(self):
+        return self
+
+    async def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture
+def playwright(monkeypatch):
+    fake = FakePlaywright()
+    monkeypatch.setattr(browser_pool, "async_playwright", lambda: fake)
+    return fake
+
+
+def _session(cdp_url="http://127.0.0.1:9222"):
+    # Only the part of a started BrowserSession the pool reads
+    return SimpleNamespace(cdp_url=cdp_url)
+
+
+def test_unstarted_session_is_an_error(playwright):
+    async def run():
+        async with BrowserPool(_session(cdp_url=None)).page():
+            pass
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run())
+
+
+def test_reuses_pages_and_recycles_after_max_uses(playwright):
+    set_up = []
+
+    async def setup(page):
+        set_up.append(page)
+
+    async def run():
+        pool = BrowserPool(_session(), size=2, max_uses=2, setup=setup)
+        seen = []
+        for _ in range(3):
+            async with pool.page() as page:
+                seen.append(page)
+        await pool.close()
+        return pool, seen
+
+    pool, seen = asyncio.run(run())
+    assert playwright.connected_to == "http://127.0.0.1:9222"
+    assert seen[0] is seen[1] and seen[2] is not seen[0]
+    assert seen[0].closed
+    assert set_up == [seen[0], seen[2]]
+    assert pool.stats == {"created": 2, "reused": 1, "recycled": 1, "unhealthy": 0}
+
+
+def test_unhealthy_idle_page_is_replaced(playwright):
+    async def run():
+        pool = BrowserPool(_session())
+        async with pool.page() as first:
+            pass
+        first.healthy = False
+        async with pool.page() as second:
+            pass
+        await pool.close()
+        return pool, first, second
+
+    pool, first, second = asyncio.run(run())
+    assert second is not first and first.closed
+    assert pool.stats["unhealthy"] == 1
+
+
+def test_size_bounds_checked_out_pages(playwright):
+    async def run():
+        pool = BrowserPool(_session(), size=1)
+        entry = await pool.acquire()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(pool.acquire(), timeout=0.05)
+        await pool.release(entry)
+        await pool.release(await asyncio.wait_for(pool.acquire(), timeout=1))
+        await pool.close()
+
+    asyncio.run(run())
+
+
+def test_close_disconnects_without_stopping_the_session(playwright):
+    async def run():
+        pool = BrowserPool(_session())
+        async with pool.page():
+            pass
+        await pool.close()
+        with pytest.raises(RuntimeError):
+            await pool.acquire()
+
+    asyncio.run(run())
+    assert all(page.closed for page in playwright.context.pages)
+    assert playwright.disconnected and playwright.stopped
@@ -0,0 +1,58 @@
+from crawl_journal import CrawlJournal, journal_path
+
+
+def _key(query="looking for tool"):
+    return CrawlJournal.unit_key("SaaS", "solution_request", query, "relevance", "year", 8)
+
+
+def test_plain_run_keeps_previous_checkpoint(tmp_path):
+    path = tmp_path / "crawl.jsonl"
+    crashed = CrawlJournal(path)
+    crashed.record(_key(), [{"title": "a"}])
+    crashed.close()
+
+    # A run without --resume doesn't replay old units, but doesn't erase them either
+    plain = CrawlJournal(path)
+    assert _key() not in plain
+    plain.record(_key("alternative to"), [{"title": "b"}])
+    plain.close()
+
+    resumed = CrawlJournal(path, resume=True)
+    assert resumed.posts(_key()) == [{"title": "a"}]
+    assert resumed.posts(_key("alternative to")) == [{"title": "b"}]
+    resumed.close()
+
+
+def test_complete_and_fresh_drop_units(tmp_path):
+    path = tmp_path / "crawl.jsonl"
+    journal = CrawlJournal(path)
+    journal.record(_key(), [])
+    journal.complete()
+    assert not path.exists()
+
+    journal = CrawlJournal(path)
+    journal.record(_key(), [])
+    journal.close()
+    fresh = CrawlJournal(path, resume=True, fresh=True)
+    assert len(fresh) == 0
+    fresh.close()
+    assert len(CrawlJournal(path, resume=True)) == 0
+
+
+def test_torn_last_line_is_dropped(tmp_path):
+    path = tmp_path / "crawl.jsonl"
+    journal = CrawlJournal(path)
+    journal.record(_key(), [{"title": "a"}])
+    journal.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"unit": "half')
+
+    resumed = CrawlJournal(path, resume=True)
+    resumed.record(_key("alternative to"), [])
+    resumed.close()
+    assert len(CrawlJournal(path, resume=True)) == 2
+
+
+def test_journal_path_per_target(tmp_path):
+    assert journal_path("saas_founders", tmp_path) != journal_path("airbnb_hosts", tmp_path)
+    assert journal_path("r_SaaS+Entrepreneur", tmp_path).name == "r_saas_entrepreneur.jsonl"
@@ -0,0 +1,195 @@
+"""
+Registry extraction scripts run by name against saved pages in
+tests/fixtures/snapshots (new/old Reddit layouts, a rate-limit page, an
+empty search, an unrecognized layout, a thread and GummySearch pages).
+Needs Playwright with Chromium installed; skipped otherwise.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+
+from extraction_status import (
+    EXTRACTION_BLOCKED,
+    EXTRACTION_EMPTY,
+    EXTRACTION_LAYOUT_UNKNOWN,
+    EXTRACTION_OK,
+    extract_with_retry,
+)
+from page_waits import GUMMY_POST_SELECTORS, GUMMY_TOPIC_SELECTORS, REDDIT_COMMENT_SELECTORS, REDDIT_POST_SELECTORS
+from script_registry import REGISTRY, install_scripts, run_script
+
+async_api = pytest.importorskip("playwright.async_api")
+
+FIXTURES = Path(__file__).parent / "fixtures" / "snapshots"
+REDDIT_POSTS_ARG = [REDDIT_POST_SELECTORS, 20, 200, 500]
+
+# Scripts exercised below; a new registry script needs a fixture test too
+COVERED_SCRIPTS = {
+    "reddit_posts", "reddit_scroll_observe", "reddit_scroll_drain",
+    "reddit_comments", "gummy_theme_posts", "gummy_topics",
+}
+
+
+@pytest.fixture(scope="module")
+def chromium():
+    async def probe():
+        async with async_api.async_playwright() as playwright:
+            browser = await playwright.chromium.launch()
+            await browser.close()
+
+    try:
+        asyncio.run(probe())
+    except Exception as e:
+        pytest.skip(f"Chromium not available: {e}")
+
+
+@asynccontextmanager
+async def open_fixture(name: str):
+    """Headless page with the script bundle installed, showing a saved page."""
+    async with async_api.async_playwright() as playwright:
+        browser = await playwright.chromium.launch()
+        try:
+            page = await browser.new_page()
+            await install_scripts(page)
+            await page.goto((FIXTURES / name).as_uri())
+            yield page
+        finally:
+            await browser.close()
+
+
+def extract(name: str, script: str, arg, selectors: list[str]):
+    async def run():
+        async with open_fixture(name) as page:
+            return await extract_with_retry(page, script, arg, selectors, label="fixture", retries=0)
+
+    return asyncio.run(run())
+
+
+def test_every_registry_script_is_covered():
+    assert set(REGISTRY.scripts) == COVERED_SCRIPTS
+
+
+def test_reddit_posts_new_layout(chromium):
+    result = extract("reddit_new_layout.html", "reddit_posts", REDDIT_POSTS_ARG, REDDIT_POST_SELECTORS)
+
+    assert result.status == EXTRACTION_OK
+    assert result.layout == "shreddit-post"
+    # "Help" is too short to be a post title
+    assert result.items == [
+        {
+            "title": "Looking for a CRM that doesn't cost $300/month for a 3 person team",
+            "body": "",
+            "upvotes": 57,
+            "comments": 23,
+            "author": "solo_founder",
+            "timestamp": "2026-01-04T12:30:00.000000+0000",
+            "subreddit": "SaaS",
+            "url": "/r/SaaS/comments/1abcde/looking_for_a_crm/",
+        },
+        {
+            "title": "Is there a tool that turns client emails into invoices automatically?",
+            "body": "",
+            "upvotes": 1200,
+            "comments": 340,
+            "author": "freelance_dev",
+            "timestamp": "2026-01-02T18:45:00.000000+0000",
+            "subreddit": "SaaS",
+            "url": "/r/SaaS/comments/1klmno/tool_emails_to_invoices/",
+        },
+    ]
+
+
+def test_reddit_posts_old_layout(chromium):
+    result = extract("reddit_old_layout.html", "reddit_posts", REDDIT_POSTS_ARG, REDDIT_POST_SELECTORS)
+
+    assert result.status == EXTRACTION_OK
+    assert result.layout == ".thing.link"
+    first, second = result.items
+    assert first == {
+        "title": "Looking for an invoicing tool for 10 recurring clients",
+        "body": "I would happily pay for something simpler than QuickBooks.",
+        "upvotes": 42,
+        "comments": 17,
+        "author": "founder1",
+        "timestamp": "2026-01-05T10:00:00+00:00",
+        "subreddit": "",
+        "url": "https://old.reddit.com/r/SaaS/comments/abc123/invoicing_for_10_clients/",
+    }
+    # No self text: the body must not fall back to the title or tagline paragraphs
+    assert second["title"] == "Cheaper alternative to Zapier for 2024 workflows?"
+    assert second["body"] == ""
+    assert (second["upvotes"], second["comments"]) == (5, 0)
+
+
+@pytest.mark.parametrize(
+    ("fixture", "status", "reason"),
+    [
+        ("reddit_blocked.html", EXTRACTION_BLOCKED, "rate_limited"),
+        ("reddit_empty_results.html", EXTRACTION_EMPTY, ""),
+        ("reddit_unknown_layout.html", EXTRACTION_LAYOUT_UNKNOWN, ""),
+    ],
+)
+def test_reddit_posts_empty_pages(chromium, fixture, status, reason):
+    result = extract(fixture, "reddit_posts", REDDIT_POSTS_ARG, REDDIT_POST_SELECTORS)
+
+    assert (result.status, result.reason, result.items) == (status, reason, [])
+    assert result.layout == ""
+
+
+def test_reddit_scroll_observe_and_drain(chromium):
+    async def run():
+        async with open_fixture("reddit_new_layout.html") as page:
+            layout = await run_script(page, "reddit_scroll_observe", REDDIT_POST_SELECTORS)
+            first = await run_script(page, "reddit_scroll_drain", [200, 500])
+            second = await run_script(page, "reddit_scroll_drain", [200, 500])
+            return layout, first, second
+
+    layout, first, second = asyncio.run(run())
+    assert layout == "shreddit-post"
+    assert [post["upvotes"] for post in first] == [57, 1200]
+    assert second == []
+
+
+def test_reddit_comments(chromium):
+    result = extract("reddit_thread.html", "reddit_comments", [REDDIT_COMMENT_SELECTORS, 20], REDDIT_COMMENT_SELECTORS)
+
+    assert result.status == EXTRACTION_OK
+    assert result.layout == "shreddit-comment"
+    # "Same." is too short to count as a comment
+    assert result.items == [
+        "We switched to a spreadsheet plus Zapier and honestly it is painful every single month.",
+        "I would pay $20/month for something that just syncs contacts from Gmail without setup.",
+    ]
+
+
+def test_gummy_theme_posts(chromium):
+    result = extract("gummy_theme.html", "gummy_theme_posts", [GUMMY_POST_SELECTORS, 50], GUMMY_POST_SELECTORS)
+
+    assert result.status == EXTRACTION_OK
+    assert result.layout == 'li[role="listitem"]'
+    assert result.items == [
+        {
+            "title": "Any app to track which clients still owe me money?",
+            "body": "I keep a spreadsheet but it gets out of date every single week",
+            "subreddit": "r/freelance",
+            "category": "Software Tool",
+            "upvotes": "48",
+            "comments": "19",
+            "date": "Mon 1/5/2026",
+            "author": "u/designer_kay",
+        },
+    ]
+
+
+def test_gummy_topics(chromium):
+    result = extract("gummy_topics.html", "gummy_topics", GUMMY_TOPIC_SELECTORS, GUMMY_TOPIC_SELECTORS)
+
+    assert result.status == EXTRACTION_OK
+    # Topics are deduped by name
+    assert result.items == [
+        {"topic": "Invoicing", "growth": "24%", "subreddits": ["r/freelance", "r/smallbusiness"]},
+        {"topic": "Pricing", "growth": "-3%", "subreddits": ["r/freelance"]},
+    ]
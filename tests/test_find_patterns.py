@@ -0,0 +1,62 @@
+"""Incremental find_patterns against a full pass over the same posts."""
+
+import random
+
+import pytest
+
+pytest.importorskip("browser_use")
+
+from reddit_saas_finder import PostIntent, PostStore, RedditPost, RedditSaaSFinder  # noqa: E402
+
+
+def _posts(rng: random.Random, count: int, start: int = 0) -> list[RedditPost]:
+    return [
+        RedditPost(
+            title=f"Post {i}",
+            body="",
+            subreddit="SaaS",
+            author="",
+            upvotes=rng.randint(0, 300),
+            comments=rng.randint(0, 40),
+            url=f"/r/SaaS/comments/p{i}/x/",
+            timestamp="",
+            intents=rng.sample(list(PostIntent), rng.randint(1, 3)),
+            validation_score=rng.randint(0, 100) / 10,  # Plenty of ties for the top-5 examples
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def _full_pass(store: PostStore) -> list:
+    finder = RedditSaaSFinder()
+    finder.posts = PostStore(store)
+    return finder.find_patterns()
+
+
+def test_incremental_patterns_match_a_full_pass():
+    rng = random.Random(99)
+    finder = RedditSaaSFinder()
+    finder.posts = PostStore(_posts(rng, 30))
+    assert finder.find_patterns(incremental=True) == _full_pass(finder.posts)
+
+    start = 30
+    for count in (1, 7, 0, 25):
+        finder.posts.extend(_posts(rng, count, start))
+        start += count
+        assert finder.find_patterns(incremental=True) == _full_pass(finder.posts)
+
+
+def test_reordered_rescored_or_replaced_stores_are_counted_again():
+    rng = random.Random(100)
+    finder = RedditSaaSFinder()
+    finder.posts = PostStore(_posts(rng, 40))
+    finder.find_patterns(incremental=True)
+
+    finder.posts.sort_by_score()
+    assert finder.find_patterns(incremental=True) == _full_pass(finder.posts)
+
+    finder.posts.rescore()
+    assert finder.find_patterns(incremental=True) == _full_pass(finder.posts)
+
+    finder.posts = PostStore(_posts(rng, 10))
+    assert finder.find_patterns(incremental=True) == _full_pass(finder.posts)
@@ -0,0 +1,92 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import llm_cache
+from llm_cache import LLMCache
+
+MODEL = "gemini-3-flash-preview"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_767_225_600.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(llm_cache.time, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    cache = LLMCache(tmp_path / "llm.sqlite3", ttl_seconds=3600, max_bytes=100)
+    yield cache
+    cache.close()
+
+
+def test_hits_only_for_the_same_model_and_prompt(cache):
+    assert cache.get(MODEL, "prompt") is None
+    cache.put(MODEL, "prompt", "answer")
+
+    assert cache.get(MODEL, "prompt") == "answer"
+    assert cache.get(MODEL, "prompt ") is None
+    assert cache.get("gemini-other", "prompt") is None
+    assert cache.stats() == {"hits": 1, "misses": 3, "hit_rate": 0.25, "entries": 1, "bytes": 6}
+
+
+def test_entries_expire_after_the_ttl(cache, clock):
+    cache.put(MODEL, "prompt", "answer")
+    clock.now += 3599
+    assert cache.get(MODEL, "prompt") == "answer"
+
+    clock.now += 2
+    assert cache.get(MODEL, "prompt") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entries_are_evicted_first(cache, clock):
+    cache.put(MODEL, "a", "a" * 40)
+    clock.now += 1
+    cache.put(MODEL, "b", "b" * 40)
+    clock.now += 1
+    cache.get(MODEL, "a")
+    clock.now += 1
+    # 120 bytes: "b" is older than "a" by use, though "a" was stored first
+    cache.put(MODEL, "c", "c" * 40)
+
+    assert cache.get(MODEL, "b") is None
+    assert cache.get(MODEL, "a") == "a" * 40
+    assert cache.get(MODEL, "c") == "c" * 40
+    assert cache.stats()["bytes"] == 80
+
+
+def test_extractor_caches_only_responses_that_parse(tmp_path):
+    from ai_pattern_extractor import AIPatternExtractor
+
+    replies = ["not json", '{"patterns": []}']
+    calls = []
+
+    async def generate_content_async(prompt):
+        calls.append(prompt)
+        return SimpleNamespace(text=replies[len(calls) - 1])
+
+    cache = LLMCache(tmp_path / "llm.sqlite3")
+    extractor = AIPatternExtractor(cache=cache)
+    extractor.model = SimpleNamespace(generate_content_async=generate_content_async)
+
+    with pytest.raises(json.JSONDecodeError):
+        asyncio.run(extractor._generate("prompt", parse_json=True))
+    assert asyncio.run(extractor._generate("prompt", parse_json=True)) == {"patterns": []}
+    assert asyncio.run(extractor._generate("prompt", parse_json=True)) == {"patterns": []}
+
+    assert len(calls) == 2
+    assert cache.stats()["hits"] == 1
+    cache.close()
@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+import near_duplicates
+from near_duplicates import NearDuplicateIndex, shingles
+
+COMPLAINT = (
+    "I run a small cleaning business and spend every Sunday night copying jobs from "
+    "my booking form into a spreadsheet and then into QuickBooks. Is there any tool "
+    "that does this automatically? I would happily pay for it."
+)
+OTHER = (
+    "What is the best way to price a B2B analytics product for agencies that only "
+    "need a dashboard once a month? Per seat pricing feels wrong for them."
+)
+
+
+def _texts():
+    return [
+        "Any tool to sync bookings to QuickBooks? " + COMPLAINT,
+        OTHER,
+        "[x-post] Sync bookings to QuickBooks automatically? " + COMPLAINT,
+        "Looking for a tool: booking form -> QuickBooks " + COMPLAINT.replace("Sunday", "Monday"),
+        "Hiring a part-time VA for customer support, what should I pay?",
+    ]
+
+
+def test_cross_posts_cluster_and_unrelated_posts_do_not():
+    index = NearDuplicateIndex()
+    for i, text in enumerate(_texts()):
+        index.add(i, text)
+
+    assert sorted(sorted(members) for members in index.clusters().values()) == [[0, 2, 3], [1], [4]]
+    assert index.cluster_of(3) == index.cluster_of(0)
+
+
+def test_empty_texts_stay_on_their_own():
+    index = NearDuplicateIndex()
+    index.add("a", "")
+    index.add("b", "?!")
+
+    assert index.clusters() == {"a": ["a"], "b": ["b"]}
+
+
+def test_signature_estimates_jaccard_similarity():
+    rng = random.Random(7)
+    words = [f"w{i}" for i in range(60)]
+    index = NearDuplicateIndex(num_perm=256, bands=64)
+    for _ in range(20):
+        a = " ".join(rng.choice(words) for _ in range(40))
+        b = " ".join(w if rng.random() < 0.8 else rng.choice(words) for w in a.split())
+        sa, sb = shingles(a), shingles(b)
+        exact = len(sa & sb) / len(sa | sb)
+        assert abs(index.similarity(index.signature(a), index.signature(b)) - exact) < 0.15
+
+
+def test_pure_python_signatures_match_numpy(monkeypatch):
+    pytest.importorskip("numpy")
+    text = _texts()[0]
+    expected = NearDuplicateIndex().signature(text)
+    monkeypatch.setattr(near_duplicates, "NUMPY_AVAILABLE", False)
+
+    assert NearDuplicateIndex().signature(text) == expected
+
+
+def test_collapse_keeps_the_busiest_post_and_sums_cluster_sizes():
+    pytest.importorskip("browser_use")
+    from reddit_saas_finder import RedditPost, collapse_near_duplicates
+
+    engagement = [(5, 1), (50, 2), (40, 30), (3, 0), (8, 8)]
+    # Post 3 already stands for two collapsed copies from an earlier pass
+    posts = [
+        RedditPost(
+            title=text[:40], body=text[40:], subreddit=f"sub{i}", author="", upvotes=upvotes,
+            comments=comments, url=f"/r/sub{i}/comments/p{i}/x/", timestamp="", intents=[],
+            cluster_size=2 if i == 3 else 1,
+        )
+        for i, (text, (upvotes, comments)) in enumerate(zip(_texts(), engagement))
+    ]
+
+    collapsed = collapse_near_duplicates(posts)
+
+    # First-seen cluster order; post 2 has the most upvotes + comments in its cluster
+    assert [p.subreddit for p in collapsed] == ["sub2", "sub1", "sub4"]
+    assert [p.cluster_size for p in collapsed] == [4, 1, 1]
+    assert sum(p.cluster_size for p in collapsed) == sum(p.cluster_size for p in posts)
+    assert posts[2].cluster_size == 1
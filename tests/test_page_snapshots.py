@@ -0,0 +1,36 @@
+import asyncio
+
+from page_snapshots import SnapshotStore
+
+
+class FakePage:
+    def __init__(self, url, html):
+        self.output = {"url": url, "html": html}
+
+    async def evaluate(self, script):
+        return self.output
+
+
+def test_same_url_in_the_same_second_keeps_both(tmp_path, monkeypatch):
+    monkeypatch.setattr("page_snapshots.time.strftime", lambda fmt: "20260105-100000")
+    store = SnapshotStore(tmp_path / "snapshots")
+    url = "https://www.reddit.com/r/SaaS/search/?q=tool"
+
+    async def run():
+        first = await store.capture(FakePage(url, "<html>first</html>"), "reddit_search", "reddit_posts", None, "shreddit-post", 2)
+        second = await store.capture(FakePage(url, "<html>second</html>"), "reddit_search", "reddit_posts", None, "shreddit-post", 3)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first != second
+    assert first.read_text(encoding="utf-8") == "<html>first</html>"
+    assert second.read_text(encoding="utf-8") == "<html>second</html>"
+    assert second.name.endswith("-2.html")
+    assert sorted(s.item_count for s in store.snapshots()) == [2, 3]
+
+
+def test_replaying_a_missing_corpus_creates_nothing(tmp_path):
+    store = SnapshotStore(tmp_path / "snapshots")
+
+    assert store.snapshots() == []
+    assert not (tmp_path / "snapshots").exists()
@@ -0,0 +1,109 @@
+"""Readiness waits and blocked-page retries against a fake page."""
+
+import asyncio
+
+import pytest
+
+import page_waits
+from page_waits import (
+    BLOCK_CHECK_JS,
+    DOM_QUIET_JS,
+    SELECTOR_READY_JS,
+    format_wait_stats,
+    goto_with_backoff,
+    wait_for_content,
+)
+from search_scheduler import BlockedError, HostRateLimiter
+
+
+class FakePage:
+    """Answers each readiness/block script from a queue of canned results."""
+
+    def __init__(self, ready=(True,), blocks=(None,)):
+        self.ready = list(ready)
+        self.blocks = list(blocks)
+        self.calls = []
+
+    async def goto(self, url, wait_until=None):
+        self.calls.append(("goto", url, wait_until))
+
+    async def evaluate(self, script, arg=None):
+        self.calls.append((script, arg))
+        if script in (SELECTOR_READY_JS, DOM_QUIET_JS):
+            result = self.ready.pop(0) if len(self.ready) > 1 else self.ready[0]
+        else:
+            assert script == BLOCK_CHECK_JS
+            result = self.blocks.pop(0) if len(self.blocks) > 1 else self.blocks[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.fixture(autouse=True)
+def wait_stats(monkeypatch):
+    stats = {}
+    monkeypatch.setattr(page_waits, "WAIT_STATS", stats)
+    return stats
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay, *args):
+        delays.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(page_waits.asyncio, "sleep", sleep)
+    return delays
+
+
+def test_waits_for_selectors_or_quiet_and_records_timeouts(wait_stats):
+    page = FakePage(ready=[True, False, RuntimeError("Target closed"), True])
+
+    async def run():
+        return [
+            await wait_for_content(page, ["shreddit-post", "article"], "search", timeout_ms=3000),
+            await wait_for_content(page, ["shreddit-post"], "search"),
+            await wait_for_content(page, ["shreddit-post"], "search"),
+            await wait_for_content(page, None, "profile", quiet_ms=200),
+        ]
+
+    assert asyncio.run(run()) == [True, False, False, True]
+    assert page.calls[0] == (SELECTOR_READY_JS, ["shreddit-post, article", 3000])
+    assert page.calls[3] == (DOM_QUIET_JS, [200, 10000])
+    assert (wait_stats["search"].calls, wait_stats["search"].ready, wait_stats["search"].timeouts) == (3, 1, 2)
+    assert wait_stats["profile"].ready == 1
+    assert [line.split(" | ")[0] for line in format_wait_stats().splitlines()[2:]] == ["| profile", "| search"]
+
+
+def test_blocked_pages_are_retried_behind_the_limiter(sleeps):
+    limiter = HostRateLimiter(min_interval=0)
+    page = FakePage(ready=[False, False, True], blocks=["captcha", "rate_limited"])
+    url = "https://www.reddit.com/r/SaaS/search/?q=tool"
+
+    assert asyncio.run(goto_with_backoff(page, url, ["shreddit-post"], limiter=limiter)) is True
+    assert [call[0] for call in page.calls].count("goto") == 3
+    stats = limiter.stats()["www.reddit.com"]
+    assert stats["blocks"] == 2 and stats["retries"] == 2 and stats["successes"] == 1
+    # Retries wait out both the backoff and the slowed-down host's pacing
+    assert stats["waited"] > 0 and len(sleeps) == 4
+
+
+def test_empty_pages_are_not_retried(sleeps):
+    page = FakePage(ready=[False], blocks=[None])
+
+    assert asyncio.run(goto_with_backoff(page, "https://www.reddit.com/login", ["shreddit-post"])) is False
+    # The block check gets no selectors, so a page merely lacking them isn't "empty"
+    assert page.calls[-1] == (BLOCK_CHECK_JS, [])
+    assert [call[0] for call in page.calls].count("goto") == 1
+    assert sleeps == []
+
+
+def test_gives_up_with_blocked_error(sleeps):
+    page = FakePage(ready=[False], blocks=["captcha"])
+
+    with pytest.raises(BlockedError, match="www.reddit.com: captcha"):
+        asyncio.run(goto_with_backoff(page, "https://www.reddit.com/r/SaaS/", max_retries=2))
+    assert sleeps == [1.0, 2.0]
@@ -0,0 +1,80 @@
+import pytest
+
+from post_index import PostIndex, canonical_post_id
+
+
+def test_permalink_ids_ignore_the_rest_of_the_url():
+    assert canonical_post_id("https://www.reddit.com/r/SaaS/comments/1AbC9z/some_title/") == "t3_1abc9z"
+    assert canonical_post_id("/r/startups/comments/1abc9z/other/", "Different title") == "t3_1abc9z"
+
+
+def test_content_ids_ignore_case_punctuation_and_whitespace():
+    a = canonical_post_id("", "Looking for a CRM!", "Any  ideas?", "SaaS")
+    b = canonical_post_id("", "looking for a crm", "any ideas", "saas")
+
+    assert a == b and a.startswith("h_")
+    assert canonical_post_id("", "Looking for a CRM!", "Something else", "SaaS") != a
+    assert canonical_post_id("", "Looking for a CRM!", "Any ideas?", "startups") != a
+
+
+def test_posts_and_marks_survive_reopening(tmp_path):
+    path = tmp_path / "index.sqlite3"
+    index = PostIndex(path)
+    index.put_many([{"post_id": "t3_a", "subreddit": "SaaS", "title": "First"}])
+    index.put_many([{"post_id": "t3_a", "subreddit": "SaaS", "title": "First", "upvotes": 9}])
+    index.set_high_water("SaaS", "crm", "t3_a", "2026-01-02T03:04:05+00:00")
+    assert index.added == 1
+    index.close()
+
+    index = PostIndex(path)
+    assert "t3_a" in index and "t3_b" not in index
+    assert index.get("t3_a")["upvotes"] == 9
+    assert index.get("t3_b") is None
+    assert index.get_high_water("saas", "crm") == ("t3_a", "2026-01-02T03:04:05+00:00")
+    assert [p["post_id"] for p in index.posts_in(["saas"])] == ["t3_a"]
+    assert index.stats() == {"known": 1, "added": 0, "entries": 1}
+    index.close()
+
+
+def _raw(body="", upvotes=3):
+    return {
+        "title": "Looking for a tool to chase invoices",
+        "body": body,
+        "url": "/r/SaaS/comments/abc/x/",
+        "upvotes": upvotes,
+        "comments": 1,
+        "author": "someone",
+        "timestamp": "2026-01-02T03:04:05+00:00",
+    }
+
+
+def test_finders_reuse_indexed_posts_and_reclassify_fuller_bodies(tmp_path, monkeypatch):
+    pytest.importorskip("browser_use")
+    import reddit_saas_finder
+    from reddit_saas_finder import PostIntent, RedditSaaSFinder
+
+    built = []
+    build_post = reddit_saas_finder.build_post
+    monkeypatch.setattr(reddit_saas_finder, "build_post", lambda *args: built.append(args[0]) or build_post(*args))
+    index = PostIndex(tmp_path / "index.sqlite3")
+
+    # A title-only browser scrape, then the same post from another run
+    [first] = RedditSaaSFinder(post_index=index)._build_posts([_raw()], "SaaS")
+    [second] = RedditSaaSFinder(post_index=index)._build_posts([_raw(upvotes=40)], "SaaS")
+
+    assert len(built) == 1
+    assert second.post_id == first.post_id == "t3_abc"
+    assert second.intents == first.intents
+    assert second.upvotes == 40 and second.validation_score > first.validation_score
+    assert index.get("t3_abc")["upvotes"] == 40
+
+    # A later fetch with the full body is classified again
+    [third] = RedditSaaSFinder(post_index=index)._build_posts(
+        [_raw(body="I would pay for this, I hate doing it by hand")], "SaaS"
+    )
+    assert len(built) == 2
+    assert PostIntent.PAIN_POINT in third.intents
+    assert third.payment_signals and third.pain_signals
+    assert index.get("t3_abc")["body"].startswith("I would pay")
+    assert index.stats()["entries"] == 1
+    index.close()
@@ -0,0 +1,67 @@
+"""PostStore indexing and slicing against the list of posts it was built from."""
+
+import random
+
+import pytest
+
+pytest.importorskip("browser_use")
+
+from reddit_saas_finder import INTENT_BITS, PostIntent, PostStore, RedditPost  # noqa: E402
+
+
+def _posts(count: int) -> list[RedditPost]:
+    rng = random.Random(42)
+    posts = []
+    for i in range(count):
+        intents = sorted(rng.sample(list(PostIntent), rng.randint(1, 3)), key=INTENT_BITS.__getitem__)
+        posts.append(RedditPost(
+            title=f"Post {i}",
+            body=f"Body {i}" if i % 2 else "",
+            subreddit=rng.choice(["SaaS", "startups", "freelance"]),
+            author=rng.choice(["a", "b", ""]),
+            upvotes=rng.randint(0, 500),
+            comments=rng.randint(0, 50),
+            url=f"/r/SaaS/comments/p{i}/x/",
+            timestamp="2026-01-02T03:04:05+00:00",
+            intents=intents,
+            validation_score=float(rng.randint(0, 100)),
+            payment_signals=rng.sample(["pay for", "budget", "worth paying"], rng.randint(0, 2)),
+            pain_signals=rng.sample(["hate", "frustrated", "waste of time"], rng.randint(0, 3)),
+            post_id=f"t3_p{i}",
+            cluster_size=rng.randint(1, 4),
+        ))
+    return posts
+
+
+@pytest.fixture
+def posts():
+    return _posts(12)
+
+
+def test_indexing_matches_the_list(posts):
+    store = PostStore(posts)
+
+    assert len(store) == len(posts)
+    assert list(store) == posts
+    for i in range(-len(posts), len(posts)):
+        assert store[i] == posts[i]
+    for i in (len(posts), -len(posts) - 1):
+        with pytest.raises(IndexError):
+            store[i]
+
+
+@pytest.mark.parametrize("key", [
+    slice(None), slice(3), slice(-3, None), slice(2, 9, 3), slice(None, None, -1),
+    slice(-2, 1, -2), slice(5, 2), slice(20, 30),
+])
+def test_slicing_matches_the_list(posts, key):
+    assert PostStore(posts)[key] == posts[key]
+
+
+def test_sorting_and_take_keep_whole_posts_together(posts):
+    store = PostStore(posts).sort_by_score()
+
+    assert list(store) == sorted(posts, key=lambda p: p.validation_score, reverse=True)
+    assert store.revision == 1
+    assert list(store.take([3, 0])) == [store[3], store[0]]
+    assert all(post.post_id in store for post in posts)
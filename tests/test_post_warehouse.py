@@ -0,0 +1,59 @@
+import pytest
+
+from post_warehouse import FTS5_AVAILABLE, PostWarehouse
+
+
+def _post(post_id, body="", title="Looking for a tool to track invoices", score=5.0):
+    return {
+        "post_id": post_id,
+        "subreddit": "SaaS",
+        "title": title,
+        "body": body,
+        "author": "someone",
+        "url": f"/r/SaaS/comments/{post_id[3:]}/x/",
+        "timestamp": "2026-01-02T03:04:05+00:00",
+        "upvotes": 3,
+        "comments": 1,
+        "validation_score": score,
+        "intents": ["solution_request"],
+        "payment_signals": [],
+        "pain_signals": [],
+    }
+
+
+@pytest.fixture
+def warehouse(tmp_path):
+    warehouse = PostWarehouse(tmp_path / "warehouse.sqlite3")
+    yield warehouse
+    warehouse.close()
+
+
+def test_later_fetch_fills_in_empty_body(warehouse):
+    # Browser scrape of new Reddit: title only
+    warehouse.put_posts([_post("t3_abc")])
+    assert warehouse.search("excel") == []
+
+    # JSON fetch of the same post returns the body
+    warehouse.put_posts([_post("t3_abc", body="I still track everything in Excel spreadsheets")])
+    matches = warehouse.search("excel")
+    assert [post["post_id"] for post, _ in matches] == ["t3_abc"]
+    assert warehouse.posts()[0]["body"] == "I still track everything in Excel spreadsheets"
+
+
+def test_empty_body_never_overwrites_stored_body(warehouse):
+    warehouse.put_posts([_post("t3_abc", body="Excel is painful", score=4.0)])
+    warehouse.put_posts([_post("t3_abc", body="", score=6.0)])
+
+    [post] = warehouse.posts()
+    assert post["body"] == "Excel is painful"
+    assert post["validation_score"] == 6.0
+    assert [p["post_id"] for p, _ in warehouse.search("excel")] == ["t3_abc"]
+
+
+@pytest.mark.skipif(not FTS5_AVAILABLE, reason="SQLite built without FTS5")
+def test_changed_text_is_reindexed(warehouse):
+    warehouse.put_posts([_post("t3_abc", body="Notion for client onboarding")])
+    warehouse.put_posts([_post("t3_abc", body="Airtable for client onboarding")])
+
+    assert warehouse.search("notion") == []
+    assert [p["post_id"] for p, _ in warehouse.search("airtable")] == ["t3_abc"]
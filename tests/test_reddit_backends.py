@@ -0,0 +1,137 @@
+"""RedditJsonBackend against a local fixture server serving canned search.json pages."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from reddit_backends import RedditBlockedError, RedditFetchError, RedditJsonBackend  # noqa: E402
+
+
+def _child(post_id: str, title: str, created: float) -> dict:
+    return {
+        "kind": "t3",
+        "data": {
+            "id": post_id,
+            "title": title,
+            "selftext": f"Body of {post_id}",
+            "score": 10,
+            "num_comments": 2,
+            "author": "someone",
+            "created_utc": created,
+            "permalink": f"/r/SaaS/comments/{post_id}/x/",
+        },
+    }
+
+
+# Three pages chained by `after` cursors, newest first
+PAGES = {
+    None: ([_child("p1", "Looking for an invoicing tool", 1700000300),
+            _child("p2", "Too short", 1700000290),  # Titles of 10 chars or less are dropped
+            _child("p3", "Alternative to Zapier for small teams?", 1700000280)], "t3_p3"),
+    "t3_p3": ([_child("p4", "Any CRM that syncs with Gmail?", 1700000200),
+               _child("p5", "Frustrated with QuickBooks pricing", 1700000190)], "t3_p5"),
+    "t3_p5": ([_child("p6", "Would pay for a simple scheduling app", 1700000100)], None),
+}
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    requests: list = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, payload=None, headers: dict = None):
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {name: values[0] for name, values in parse_qs(url.query).items()}
+        type(self).requests.append((url.path, params))
+
+        if url.path == "/r/Limited/search.json":
+            self._send(429, {"message": "Too Many Requests"}, {"Retry-After": "7"})
+        elif url.path == "/r/SaaS/search.json":
+            children, after = PAGES[params.get("after")]
+            limit = int(params["limit"])
+            self._send(200, {"kind": "Listing", "data": {"children": children[:limit], "after": after}})
+        else:
+            self._send(404, {"message": "Not Found"})
+
+
+@pytest.fixture
+def backend():
+    _FixtureHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield RedditJsonBackend(f"http://127.0.0.1:{server.server_address[1]}", page_size=3)
+    server.shutdown()
+    server.server_close()
+
+
+def _search(backend: RedditJsonBackend, **kwargs):
+    async def run():
+        try:
+            return await backend.search(**kwargs)
+        finally:
+            await backend.close()
+
+    return asyncio.run(run())
+
+
+def test_follows_after_cursors_until_exhausted(backend):
+    posts = _search(backend, subreddit="SaaS", query="looking for tool", max_posts=50)
+
+    assert [p["url"] for p in posts] == [f"/r/SaaS/comments/p{i}/x/" for i in (1, 3, 4, 5, 6)]
+    assert posts[0]["body"] == "Body of p1"
+    assert posts[0]["timestamp"].startswith("2023-11-14T22:")
+    assert [params.get("after") for _, params in _FixtureHandler.requests] == [None, "t3_p3", "t3_p5"]
+    assert _FixtureHandler.requests[0][1]["restrict_sr"] == "1"
+
+
+def test_stops_at_max_posts(backend):
+    posts = _search(backend, subreddit="SaaS", query="looking for tool", max_posts=3)
+
+    assert [p["url"] for p in posts] == [f"/r/SaaS/comments/p{i}/x/" for i in (1, 3, 4)]
+    # The second page only asks for what is still missing
+    assert _FixtureHandler.requests[1][1]["limit"] == "1"
+
+
+def test_stop_when_ends_pagination(backend):
+    posts = _search(
+        backend,
+        subreddit="SaaS",
+        query="looking for tool",
+        max_posts=50,
+        stop_when=lambda raw: raw["url"] == "/r/SaaS/comments/p5/x/",
+    )
+
+    # The stop post itself is not returned and no further page is fetched
+    assert [p["url"] for p in posts] == [f"/r/SaaS/comments/p{i}/x/" for i in (1, 3, 4)]
+    assert len(_FixtureHandler.requests) == 2
+
+
+def test_rate_limit_sets_retry_after(backend):
+    with pytest.raises(RedditBlockedError) as excinfo:
+        _search(backend, subreddit="Limited", query="looking for tool")
+
+    assert excinfo.value.retry_after == 7.0
+
+
+def test_bad_status_is_a_fetch_error(backend):
+    with pytest.raises(RedditFetchError) as excinfo:
+        _search(backend, subreddit="Missing", query="looking for tool")
+
+    assert not isinstance(excinfo.value, RedditBlockedError)
@@ -0,0 +1,201 @@
+"""RedditSaaSFinder searches in JSON mode against a local fixture server."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+pytest.importorskip("browser_use")
+pytest.importorskip("httpx")
+
+from post_index import PostIndex  # noqa: E402
+from reddit_saas_finder import RedditSaaSFinder  # noqa: E402
+from search_cache import SearchCache  # noqa: E402
+
+TITLES = [
+    "Looking for a tool to chase unpaid invoices",
+    "Frustrated with how long payroll takes every month",
+    "Would pay for a simple client portal",
+    "Any app that syncs Stripe with my spreadsheet?",
+    "Hate when scheduling tools double book me",
+    "Recommend a CRM for a two person agency",
+    "Struggle with tracking contractor hours",
+    "Alternative to Calendly that is cheaper?",
+    "Budget for a better helpdesk this year",
+    "Waste of time copying orders into QuickBooks",
+]
+
+
+def _child(number: int, subreddit: str = "SaaS") -> dict:
+    return {
+        "kind": "t3",
+        "data": {
+            "id": f"{subreddit.lower()}{number}",
+            "title": TITLES[(number - 1) % len(TITLES)],
+            "selftext": f"Details for post {number}",
+            "score": number,
+            "num_comments": 1,
+            "author": "someone",
+            "created_utc": 1767225600 - number * 3600,  # Post 1 is the newest
+            "permalink": f"/r/{subreddit}/comments/{subreddit.lower()}{number}/x/",
+        },
+    }
+
+
+class _ListingHandler(BaseHTTPRequestHandler):
+    # Subreddit -> children, newest first; pages are cut with `after` cursors
+    listings: dict = {}
+    requests: list = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {name: values[0] for name, values in parse_qs(url.query).items()}
+        subreddit = url.path.split("/")[2]
+        type(self).requests.append((subreddit, params))
+
+        children = type(self).listings.get(subreddit, [])
+        ids = [f"t3_{child['data']['id']}" for child in children]
+        start = ids.index(params["after"]) + 1 if params.get("after") in ids else 0
+        page = children[start:start + int(params["limit"])]
+        after = ids[start + len(page) - 1] if page and start + len(page) < len(children) else None
+
+        body = json.dumps({"kind": "Listing", "data": {"children": page, "after": after}}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def reddit_url():
+    _ListingHandler.listings = {}
+    _ListingHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ListingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _finder(reddit_url: str, **kwargs) -> RedditSaaSFinder:
+    finder = RedditSaaSFinder(
+        fetch_mode="json", json_base_url=reddit_url, min_request_interval=0, concurrency=2, **kwargs
+    )
+    finder.CURATED_AUDIENCES = {"test": {"name": "Test", "subreddits": ["SaaS"], "keywords": []}}
+    return finder
+
+
+def _run(finder: RedditSaaSFinder, coro):
+    async def run():
+        try:
+            return await coro
+        finally:
+            await finder.json_backend.close()
+
+    return asyncio.run(run())
+
+
+def test_refresh_keeps_the_mark_when_the_cap_cuts_a_fetch_short(reddit_url, tmp_path):
+    index = PostIndex(tmp_path / "index.sqlite3")
+    queries = RedditSaaSFinder.INTENT_QUERIES["solution_request"][:3]
+
+    def refresh(max_posts_per_query: int) -> RedditSaaSFinder:
+        finder = _finder(reddit_url, post_index=index)
+        _run(finder, finder.refresh_audience("test", ["solution_request"], max_posts_per_query))
+        return finder
+
+    def marks() -> set:
+        return {index.get_high_water("SaaS", query)[0] for query in queries}
+
+    # First run: post 6 is the newest
+    _ListingHandler.listings["SaaS"] = [_child(n) for n in range(6, 11)]
+    refresh(10)
+    assert marks() == {"t3_saas6"}
+
+    # Five new posts arrive, but only three fit: the mark must stay at post 6
+    _ListingHandler.listings["SaaS"] = [_child(n) for n in range(1, 11)]
+    refresh(3)
+    assert marks() == {"t3_saas6"}
+
+    # A run that reaches the old mark fetches the gap and moves the mark
+    finder = refresh(10)
+    assert marks() == {"t3_saas1"}
+    assert {"t3_saas4", "t3_saas5"} <= {post.post_id for post in finder.posts}
+    index.close()
+
+
+def test_search_cache_is_keyed_by_backend(reddit_url, tmp_path):
+    cache = SearchCache(tmp_path / "cache.sqlite3")
+    _ListingHandler.listings["SaaS"] = [_child(n) for n in range(1, 6)]
+
+    finder = _finder(reddit_url, cache=cache)
+    first = _run(finder, finder.search_subreddit("SaaS", "looking for tool", max_posts=5))
+    fetched = len(_ListingHandler.requests)
+
+    # A later JSON run is served from the cache...
+    finder = _finder(reddit_url, cache=cache)
+    second = _run(finder, finder.search_subreddit("SaaS", "looking for tool", max_posts=5))
+    assert [p.post_id for p in second] == [p.post_id for p in first]
+    assert len(_ListingHandler.requests) == fetched
+
+    # ...but a browser run would not get full-text JSON results (or the reverse)
+    assert cache.get("SaaS", "looking for tool", "relevance", "year", 5, backend="json") is not None
+    assert cache.get("SaaS", "looking for tool", "relevance", "year", 5, backend="browser") is None
+    cache.close()
+
+
+def _streaming_finder(reddit_url: str) -> RedditSaaSFinder:
+    finder = _finder(reddit_url)
+    subreddits = [f"Sub{i}" for i in range(6)]
+    finder.CURATED_AUDIENCES = {"test": {"name": "Test", "subreddits": subreddits, "keywords": []}}
+    for subreddit in subreddits:
+        _ListingHandler.listings[subreddit] = [_child(n, subreddit) for n in range(1, 11)]
+    return finder
+
+
+def test_iter_audience_pauses_searches_while_the_buffer_is_full(reddit_url):
+    finder = _streaming_finder(reddit_url)
+
+    async def run():
+        posts = finder.iter_audience("test", ["solution_request"], max_posts_per_sub=30, buffer_size=2)
+        first = await posts.__anext__()
+        # A consumer that stops reading: the producer must block on the full buffer
+        await asyncio.sleep(0.5)
+        stalled = len(_ListingHandler.requests)
+        rest = [post async for post in posts]
+        return first, stalled, rest
+
+    first, stalled, rest = _run(finder, run())
+    # 18 searches (6 subreddits x 3 queries) of 10 posts; 2 run at a time
+    assert stalled <= 3
+    assert len(_ListingHandler.requests) == 18
+    # Every query returns the same 10 posts per subreddit; the stream dedupes them
+    assert len({first.post_id, *(post.post_id for post in rest)}) == 1 + len(rest) == 60
+
+
+def test_breaking_out_of_iter_audience_cancels_the_searches(reddit_url, caplog):
+    finder = _streaming_finder(reddit_url)
+
+    async def run():
+        async for _ in finder.iter_audience("test", ["solution_request"], max_posts_per_sub=30, buffer_size=2):
+            break
+        # The abandoned generator is closed by the event loop's finalizer hook,
+        # which must cancel the producer instead of leaving it blocked on the buffer
+        await asyncio.sleep(0)
+        others = asyncio.all_tasks() - {asyncio.current_task()}
+        if others:
+            await asyncio.wait(others, timeout=2)
+        return {task for task in others if not task.done()}
+
+    with caplog.at_level("ERROR", logger="asyncio"):
+        pending = _run(finder, run())
+    assert pending == set()
+    assert len(_ListingHandler.requests) < 18
+    assert "Task was destroyed" not in caplog.text
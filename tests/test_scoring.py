@@ -0,0 +1,113 @@
+"""
+Keyword matching and batch scoring against the scalar reference they
+replaced, on fixed-seed random inputs.
+"""
+
+import random
+
+import pytest
+
+pytest.importorskip("browser_use")
+
+import reddit_saas_finder  # noqa: E402
+from reddit_saas_finder import (  # noqa: E402
+    INTENT_KEYWORDS,
+    PAIN_KEYWORDS,
+    PAYMENT_KEYWORDS,
+    KeywordMatcher,
+    PostIntent,
+    RedditPost,
+    calculate_validation_score,
+    intent_mask,
+    rescore_posts,
+)
+from scoring_profile import DEFAULT_PROFILE, ScoringProfile  # noqa: E402
+
+ALL_KEYWORDS = sorted({kw for kws in INTENT_KEYWORDS.values() for kw in kws} | set(PAYMENT_KEYWORDS) | set(PAIN_KEYWORDS))
+FILLER = ["the", "a", "tool", "my", "client", "pay", "paid", "look", "for", "how", "wish", "cost", "x", "-", ".", "!"]
+
+# .x5 sums are where np.round and round() disagree
+HALF_STEP_PROFILE = ScoringProfile(upvotes_per_point=40, comments_per_point=20, pain_signal_weight=0.25)
+
+
+def reference_match(text: str):
+    """The per-keyword `keyword in text` scan KeywordMatcher replaced."""
+    text_lower = text.lower()
+    intents = [intent for intent, kws in INTENT_KEYWORDS.items() if any(kw in text_lower for kw in kws)]
+    offsets = sorted(
+        ((i, kw) for kw in ALL_KEYWORDS for i in range(len(text_lower)) if text_lower.startswith(kw, i)),
+        key=lambda hit: (hit[0], -len(hit[1]))
+    )
+    return (
+        intents,
+        [kw for kw in PAYMENT_KEYWORDS if kw in text_lower],
+        [kw for kw in PAIN_KEYWORDS if kw in text_lower],
+        offsets,
+    )
+
+
+def random_text(rng: random.Random) -> str:
+    words = []
+    for _ in range(rng.randint(0, 12)):
+        word = rng.choice(ALL_KEYWORDS) if rng.random() < 0.4 else rng.choice(FILLER)
+        if rng.random() < 0.2:
+            word = word[:rng.randint(1, len(word))]  # Keyword fragments and prefixes
+        words.append(word.upper() if rng.random() < 0.1 else word)
+    # Sometimes glue words together so keywords overlap
+    return "".join(w + rng.choice([" ", " ", "", "\n"]) for w in words)
+
+
+@pytest.fixture(params=["ahocorasick", "regex"])
+def matcher(request, monkeypatch):
+    if request.param == "ahocorasick":
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setattr(reddit_saas_finder, "AHOCORASICK_AVAILABLE", False)
+    return KeywordMatcher(INTENT_KEYWORDS, PAYMENT_KEYWORDS, PAIN_KEYWORDS)
+
+
+def test_keyword_matcher_matches_the_scalar_scan(matcher):
+    rng = random.Random(1234)
+    mismatches = []
+    for _ in range(1500):
+        text = random_text(rng)
+        m = matcher.match(text)
+        if (m.intents, m.payment_signals, m.pain_signals, m.offsets) != reference_match(text):
+            mismatches.append(text)
+    assert mismatches == []
+
+
+def random_post(rng: random.Random) -> RedditPost:
+    intents = rng.sample(list(PostIntent), rng.randint(0, 3))
+    return RedditPost(
+        title="x",
+        body="",
+        subreddit="SaaS",
+        author="",
+        upvotes=rng.choice([rng.randint(0, 200), rng.randint(0, 5000)]),
+        comments=rng.randint(0, 120),
+        url="",
+        timestamp="",
+        intents=intents or [PostIntent.GENERAL],
+        payment_signals=["pay for"] * rng.randint(0, 6),
+        pain_signals=["hate"] * rng.randint(0, 8),
+    )
+
+
+@pytest.mark.parametrize("profile", [DEFAULT_PROFILE, HALF_STEP_PROFILE], ids=["default", "half_steps"])
+def test_batch_scores_match_the_scalar_score(profile):
+    pytest.importorskip("numpy")
+    rng = random.Random(5678)
+    posts = [random_post(rng) for _ in range(20000)]
+    expected = [calculate_validation_score(post, profile) for post in posts]
+
+    scores = reddit_saas_finder.calculate_validation_scores(
+        [p.upvotes for p in posts],
+        [p.comments for p in posts],
+        [intent_mask(p.intents) for p in posts],
+        [len(p.payment_signals) for p in posts],
+        [len(p.pain_signals) for p in posts],
+        profile,
+    ).tolist()
+    assert [i for i, (a, b) in enumerate(zip(scores, expected)) if a != b] == []
+    assert [p.validation_score for p in rescore_posts(posts, profile)] == expected
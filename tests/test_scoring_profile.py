@@ -0,0 +1,10 @@
+from pathlib import Path
+
+from scoring_profile import DEFAULT_PROFILE, load_scoring_profile
+
+PROFILES = Path(__file__).parent.parent / "profiles"
+
+
+def test_shipped_default_profile_matches_the_code_default():
+    # .env.example points SCORING_PROFILE at this file
+    assert load_scoring_profile(str(PROFILES / "default.json")) == DEFAULT_PROFILE
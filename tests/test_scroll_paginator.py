@@ -0,0 +1,89 @@
+"""ScrollPaginator stop conditions against a fake page that loads posts per scroll."""
+
+import asyncio
+
+from page_waits import DOM_QUIET_JS
+from script_registry import CALL_SCRIPT_JS
+from scroll_paginator import SCROLL_TO_BOTTOM_JS, ScrollPaginator
+
+
+def _raw(number: int, url: bool = True) -> dict:
+    return {"title": f"Post {number}", "url": f"/r/SaaS/comments/p{number}/x/" if url else ""}
+
+
+class FakeListingPage:
+    """Each drain returns the next round's nodes; scrolling moves to the next round."""
+
+    def __init__(self, rounds: list[list[dict]]):
+        self.rounds = rounds
+        self.scrolls = 0
+
+    async def evaluate(self, script, arg=None):
+        if script == SCROLL_TO_BOTTOM_JS:
+            self.scrolls += 1
+            return None
+        if script == DOM_QUIET_JS:
+            return True
+        assert script == CALL_SCRIPT_JS
+        name = arg[1]
+        if name == "reddit_scroll_observe":
+            return {"value": "shreddit-post"}
+        assert name == "reddit_scroll_drain"
+        return {"value": self.rounds[self.scrolls] if self.scrolls < len(self.rounds) else []}
+
+
+def _collect(page, max_posts, **kwargs):
+    stop_when = kwargs.pop("stop_when", None)
+    return asyncio.run(ScrollPaginator(page, **kwargs).collect(max_posts, stop_when))
+
+
+def test_scrolls_until_max_posts_and_dedupes():
+    # Rounds repeat nodes already seen; post 3 has no permalink and is keyed by title
+    page = FakeListingPage([
+        [_raw(1), _raw(2), _raw(3, url=False)],
+        [_raw(2), _raw(3, url=False), _raw(4)],
+        [_raw(5), _raw(6), _raw(7)],
+    ])
+
+    result = _collect(page, max_posts=6)
+
+    assert [raw["title"] for raw in result.posts] == [f"Post {n}" for n in range(1, 7)]
+    assert (result.rounds, result.stop_reason, result.layout) == (3, "max_posts", "shreddit-post")
+    assert page.scrolls == 2
+
+
+def test_stops_after_idle_rounds_when_the_listing_runs_out():
+    page = FakeListingPage([[_raw(1), _raw(2)], [_raw(2)]])
+
+    result = _collect(page, max_posts=100, max_idle_rounds=2)
+
+    assert len(result.posts) == 2
+    assert (result.rounds, result.stop_reason) == (3, "exhausted")
+
+
+def test_stop_when_drops_the_match_and_everything_after_it():
+    page = FakeListingPage([[_raw(1), _raw(2)], [_raw(3), _raw(4), _raw(5)]])
+
+    result = _collect(page, max_posts=100, stop_when=lambda raw: raw["title"] == "Post 4")
+
+    assert [raw["title"] for raw in result.posts] == ["Post 1", "Post 2", "Post 3"]
+    assert result.stop_reason == "stop_when"
+
+
+def test_time_budget_ends_the_scroll():
+    page = FakeListingPage([[_raw(1)], [_raw(2)]])
+
+    result = _collect(page, max_posts=100, time_budget=0)
+
+    assert len(result.posts) == 1
+    assert (result.rounds, result.stop_reason) == (1, "time_budget")
+    assert page.scrolls == 0
+
+
+def test_iter_batches_yields_only_each_rounds_new_posts():
+    page = FakeListingPage([[_raw(1), _raw(2)], [_raw(2), _raw(3)], [_raw(3)]])
+
+    async def run():
+        return [[raw["title"] for raw in batch] async for batch in ScrollPaginator(page).iter_batches(max_posts=100)]
+
+    assert asyncio.run(run()) == [["Post 1", "Post 2"], ["Post 3"]]
@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+import search_scheduler
+from search_scheduler import BlockedError, HostRateLimiter, SearchScheduler, SearchTask
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record asyncio.sleep delays instead of waiting, on a frozen monotonic clock."""
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay, *args):
+        delays.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(search_scheduler.asyncio, "sleep", sleep)
+    monkeypatch.setattr(search_scheduler.time, "monotonic", lambda: 1000.0)
+    return delays
+
+
+def test_callers_queue_behind_one_token_per_interval(sleeps):
+    limiter = HostRateLimiter(min_interval=2.0, burst=2)
+
+    async def run():
+        await asyncio.gather(*(limiter.acquire("a") for _ in range(5)), limiter.acquire("b"))
+
+    asyncio.run(run())
+
+    # Two burst tokens, then one caller per 2s; other hosts have their own bucket
+    assert sorted(sleeps) == [2.0, 4.0, 6.0]
+    assert limiter.stats()["a"]["waited"] == 12.0
+    assert limiter.stats()["b"]["waited"] == 0.0
+
+
+def test_blocks_slow_a_host_down_and_successes_speed_it_back_up():
+    limiter = HostRateLimiter(min_interval=1.0, max_interval=10.0)
+
+    for _ in range(5):
+        limiter.report_block("a")
+    assert limiter.stats()["a"]["interval"] == 10.0
+    assert limiter.hosts["a"].tokens <= 0
+
+    for _ in range(100):
+        limiter.report_success("a")
+    assert limiter.stats()["a"]["interval"] == 1.0
+    assert "b" not in limiter.hosts
+
+
+def test_backoff_is_jittered_capped_and_honours_retry_after():
+    limiter = HostRateLimiter(min_interval=1.0, max_interval=8.0)
+
+    for attempt in range(6):
+        ceiling = min(8.0, 2.0 ** attempt)
+        assert ceiling / 2 <= limiter.backoff_delay("a", attempt) <= ceiling
+    assert limiter.backoff_delay("a", 0, retry_after=30.0) == 30.0
+    assert limiter.stats()["a"]["retries"] == 7
+
+
+def test_scheduler_retries_blocked_searches_and_keeps_task_order(sleeps):
+    scheduler = SearchScheduler(concurrency=2, min_interval=0, max_retries=2)
+    tasks = [SearchTask(f"sub{i}", "q") for i in range(6)]
+    attempts = {}
+    running = []
+
+    async def search(task):
+        attempts[task.subreddit] = attempts.get(task.subreddit, 0) + 1
+        running.append(task)
+        await asyncio.sleep(0)
+        assert len(running) <= 2
+        running.remove(task)
+        if task.subreddit == "sub1" and attempts["sub1"] == 1:
+            raise BlockedError("captcha", retry_after=5.0)
+        if task.subreddit == "sub4":
+            raise BlockedError("rate_limited")
+        return task.subreddit
+
+    results = asyncio.run(scheduler.run(tasks, search))
+
+    assert results[:4] == ["sub0", "sub1", "sub2", "sub3"] and results[5] == "sub5"
+    assert isinstance(results[4], BlockedError)
+    assert attempts["sub1"] == 2 and attempts["sub4"] == 3
+    assert 5.0 in sleeps
+    stats = scheduler.rate_limiter.stats()["www.reddit.com"]
+    assert stats["blocks"] == 4 and stats["retries"] == 3 and stats["requests"] == 9
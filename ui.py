@@ -19,6 +19,7 @@ For finding "super validated" SaaS ideas, the agent uses multiple validation sig
 """
 
 import asyncio
+import os
 import random
 from datetime import datetime
 from pathlib import Path
@@ -27,17 +28,108 @@ import gradio as gr
 from browser_use import Agent, Browser, ChatGoogle, Tools
 from dotenv import load_dotenv
 
+from browser_pool import BrowserPool
+from extraction_status import (
+    EXTRACTION_OK,
+    RETRYABLE_STATUSES,
+    ExtractionResult,
+    classify_empty_page,
+    extract_with_retry,
+    format_extraction_stats,
+    record_extraction,
+)
+from page_snapshots import SnapshotStore
+from page_waits import (
+    GUMMY_PATTERN_SELECTORS,
+    GUMMY_POST_SELECTORS,
+    GUMMY_THEME_SELECTORS,
+    GUMMY_TOPIC_SELECTORS,
+    REDDIT_COMMENT_SELECTORS,
+    REDDIT_POST_SELECTORS,
+    format_wait_stats,
+    goto_with_backoff,
+    wait_for_content,
+    wait_for_quiet,
+)
+from reddit_saas_finder import build_post, dedupe_posts, post_to_dict
+from scoring_profile import load_scoring_profile
+from script_registry import install_scripts
+from scroll_paginator import ScrollPaginator, ScrollResult
+from search_scheduler import HostRateLimiter
+
 load_dotenv()
 
 # Global state for browser session
 browser_instance: Browser | None = None
 
+# Warm background pages for Reddit searches, bound to browser_instance
+reddit_pool: BrowserPool | None = None
+
 # Persistent browser profile directory - saves cookies, localStorage, login sessions
 BROWSER_PROFILE_DIR = Path(__file__).parent / ".browser_profile"
 BROWSER_PROFILE_DIR.mkdir(exist_ok=True)
 
 RESULTS_DIR = Path("results")
 
+# Per-host pacing for reddit.com and go.gummysearch.com navigation; slows
+# down automatically when pages come back blocked
+RATE_LIMITER = HostRateLimiter(min_interval=float(os.getenv("MIN_REQUEST_INTERVAL", "1.0")))
+
+
+async def goto_page(page, url: str, selectors: list[str] = None, label: str = "page") -> bool:
+    """Navigate and wait for content, paced by RATE_LIMITER and retried with backoff when blocked."""
+    return await goto_with_backoff(page, url, selectors, label, limiter=RATE_LIMITER)
+
+
+# Scoring weights shared with reddit_saas_finder (optional JSON profile via SCORING_PROFILE)
+SCORING_PROFILE = load_scoring_profile(os.getenv("SCORING_PROFILE"))
+
+# Saved pages for offline extraction benchmarks (snapshot_replay), enabled via SNAPSHOT_DIR
+SNAPSHOTS = SnapshotStore(os.getenv("SNAPSHOT_DIR")) if os.getenv("SNAPSHOT_DIR") else None
+
+# Comment bodies scraped by extract_comments
+COMMENT_TEXT_SELECTORS = ['[data-testid="comment"]', '.comment', '.usertext-body']
+
+
+async def snapshot_page(page, label: str, script: str, arg, result: ExtractionResult):
+    """Save the page and the extraction that ran on it, when SNAPSHOT_DIR is set."""
+    if SNAPSHOTS is not None:
+        await SNAPSHOTS.capture(page, label, script, arg, result.layout, len(result.items))
+
+
+async def scroll_reddit_posts(page, url: str, max_posts: int, retries: int = 1) -> ExtractionResult:
+    """
+    Load `url` and scroll until `max_posts` raw posts have loaded (or it runs
+    out). Blocked or unrecognised pages are reloaded up to `retries` times.
+    """
+    for attempt in range(1, retries + 2):
+        await goto_page(page, url, REDDIT_POST_SELECTORS, label="reddit_search")
+        scroll = ScrollResult()
+        paginator = ScrollPaginator(page, time_budget=20.0, title_chars=200, body_chars=500)
+        async for batch in paginator.iter_batches(max_posts, result=scroll):
+            scroll.posts.extend(batch)
+
+        if scroll.posts:
+            result = ExtractionResult(EXTRACTION_OK, scroll.posts, scroll.layout, attempts=attempt)
+        else:
+            status, reason = await classify_empty_page(page, scroll.layout, REDDIT_POST_SELECTORS)
+            result = ExtractionResult(status, [], scroll.layout, reason, attempts=attempt)
+        record_extraction("reddit_search", result.status, scroll.layout, len(scroll.posts))
+        await snapshot_page(
+            page, "reddit_search", "reddit_posts", [REDDIT_POST_SELECTORS, max_posts, 200, 500], result
+        )
+
+        if result.status not in RETRYABLE_STATUSES or attempt > retries:
+            return result
+        await asyncio.sleep(2.0 * attempt)
+
+
+def score_reddit_posts(raw_posts: list[dict]) -> list[dict]:
+    """Classify and score raw extracted posts with the shared scoring profile, best first."""
+    posts = dedupe_posts([build_post(raw, profile=SCORING_PROFILE) for raw in raw_posts])
+    posts.sort(key=lambda p: p.validation_score, reverse=True)
+    return [post_to_dict(p) for p in posts]
+
 
 def extract_and_save_attachments(content: str, base_path: Path) -> list[str]:
     """Extract attachments from report content and save them as separate files.
@@ -178,6 +270,15 @@ async def start_browser_instance():
         return f"❌ Error starting browser: {str(e)}"
 
 
+def get_reddit_pool() -> BrowserPool:
+    """Get the Reddit page pool for the current browser, creating it on first use."""
+    global reddit_pool
+
+    if reddit_pool is None or reddit_pool.browser is not browser_instance:
+        reddit_pool = BrowserPool(browser_instance, size=2, setup=install_scripts)
+    return reddit_pool
+
+
 def start_browser_sync():
     """Sync wrapper for starting browser."""
     try:
@@ -230,8 +331,7 @@ async def run_browser_automation(prompt: str, model_name: str, progress=gr.Progr
     ):
         """Automated login to GummySearch."""
         page = await browser_session.get_current_page()
-        await page.goto("https://go.gummysearch.com/login/", wait_until="networkidle")
-        await page.wait_for_timeout(2000)
+        await goto_page(page, "https://go.gummysearch.com/login/", ['input[type="email"]', 'input[name="email"]'], label="gummy_login")
 
         try:
             await page.fill('input[name="email"], input[type="email"]', email)
@@ -241,7 +341,7 @@ async def run_browser_automation(prompt: str, model_name: str, progress=gr.Progr
             await page.click(
                 'button[type="submit"], button:has-text("Login"), button:has-text("Sign in")'
             )
-            await page.wait_for_timeout(3000)
+            await wait_for_quiet(page, "gummy_login_submit")
             return f"Logged in to GummySearch as {email}"
         except Exception as e:
             return f"Login failed or already logged in: {str(e)}"
@@ -250,20 +350,16 @@ async def run_browser_automation(prompt: str, model_name: str, progress=gr.Progr
     async def navigate_gummy_audiences(browser_session):
         """Navigate to GummySearch curated audiences page to discover underserved markets."""
         page = await browser_session.get_current_page()
-        await page.goto(
-            "https://go.gummysearch.com/audiences/curated/", wait_until="networkidle"
-        )
-        await page.wait_for_timeout(3000)
+        await goto_page(page, "https://go.gummysearch.com/audiences/curated/", label="gummy_audiences")
         return "Navigated to GummySearch curated audiences. Look for audiences with high engagement but few solutions."
 
     @tools.action(description="Navigate to a specific GummySearch audience by ID")
     async def navigate_gummy_audience(browser_session, audience_id: str):
         """Navigate to a specific audience. Example IDs: 092b8570cd (AirBnB Hosts)"""
         page = await browser_session.get_current_page()
-        await page.goto(
-            f"https://go.gummysearch.com/audience/{audience_id}/", wait_until="networkidle"
+        await goto_page(
+            page, f"https://go.gummysearch.com/audience/{audience_id}/", GUMMY_THEME_SELECTORS, label="gummy_audience"
         )
-        await page.wait_for_timeout(3000)
         return f"Navigated to audience {audience_id}. Use navigate_gummy_theme() to explore themes."
 
     @tools.action(description="Navigate to a GummySearch theme for current audience")
@@ -290,8 +386,7 @@ async def run_browser_automation(prompt: str, model_name: str, progress=gr.Progr
         theme_slug = theme_map.get(theme.lower(), theme)
         page = await browser_session.get_current_page()
         url = f"https://go.gummysearch.com/audience/{audience_id}/themes/{theme_slug}/"
-        await page.goto(url, wait_until="networkidle")
-        await page.wait_for_timeout(3000)
+        await goto_page(page, url, GUMMY_POST_SELECTORS, label="gummy_theme")
         return f"Navigated to {theme} theme. Use extract_gummy_theme_posts() to get posts."
 
     @tools.action(description="Extract posts from GummySearch theme results")
@@ -304,83 +399,16 @@ async def run_browser_automation(prompt: str, model_name: str, progress=gr.Progr
             browse_btn = await page.query_selector('a:has-text("Browse all"), button:has-text("Browse all")')
             if browse_btn:
                 await browse_btn.click()
-                await page.wait_for_timeout(2000)
+                await wait_for_content(page, GUMMY_POST_SELECTORS, label="gummy_browse_all")
         except Exception:
             pass
         
-        posts = await page.evaluate(
-            """
-            (maxPosts) => {
-                const results = [];
-                // GummySearch uses listitem elements for posts
-                const items = document.querySelectorAll('li[role="listitem"], [role="listitem"]');
-                
-                items.forEach((item, idx) => {
-                    if (idx >= maxPosts) return;
-                    
-                    const text = item.textContent || '';
-                    const links = item.querySelectorAll('a');
-                    let title = '';
-                    let body = '';
-                    let subreddit = '';
-                    let category = '';
-                    let upvotes = '';
-                    let comments = '';
-                    let date = '';
-                    let author = '';
-                    
-                    // Extract title from heading
-                    const heading = item.querySelector('h1, h2, h3, h4, h5, h6');
-                    if (heading) title = heading.textContent.trim();
-                    
-                    // Extract links for title and body
-                    links.forEach(link => {
-                        const href = link.getAttribute('href') || '';
-                        const linkText = link.textContent.trim();
-                        if (href.includes('reddit.com') && linkText.length > 20) {
-                            if (!title) title = linkText;
-                            else if (!body) body = linkText;
-                        }
-                        if (linkText.startsWith('r/')) subreddit = linkText;
-                        if (linkText.startsWith('u/')) author = linkText;
-                    });
-                    
-                    // Extract metadata from text patterns
-                    const upvoteMatch = text.match(/↑\\s*(\\d+)/);
-                    const commentMatch = text.match(/💬\\s*(\\d+)|○\\s*(\\d+)/);
-                    const dateMatch = text.match(/(\\w{3}\\s+\\d{1,2}\\/\\d{1,2}\\/\\d{4}|\\d{1,2}\\/\\d{1,2}\\/\\d{4})/);
-                    
-                    if (upvoteMatch) upvotes = upvoteMatch[1];
-                    if (commentMatch) comments = commentMatch[1] || commentMatch[2];
-                    if (dateMatch) date = dateMatch[1];
-                    
-                    // Extract category tags
-                    const categoryPatterns = ['Software Tool', 'Service', 'Physical Product', 'Website', 'API', 'Mobile App', 'Frustration', 'Disappointment', 'Advice'];
-                    categoryPatterns.forEach(cat => {
-                        if (text.includes(cat)) category = cat;
-                    });
-                    
-                    if (title && title.length > 10) {
-                        results.push({
-                            title: title.substring(0, 200),
-                            body: body.substring(0, 500),
-                            subreddit,
-                            category,
-                            upvotes,
-                            comments,
-                            date,
-                            author
-                        });
-                    }
-                });
-                
-                return results;
-            }
-            """,
-            max_posts
-        )
+        arg = [GUMMY_POST_SELECTORS, max_posts]
+        result = await extract_with_retry(page, "gummy_theme_posts", arg, GUMMY_POST_SELECTORS, label="gummy_theme_posts")
+        await snapshot_page(page, "gummy_theme_posts", "gummy_theme_posts", arg, result)
+        posts = result.items
         
-        return f"Extracted {len(posts)} posts from GummySearch:\n{posts}"
+        return f"Extracted {len(posts)} posts from GummySearch ({result.summary()}):\n{posts}"
 
     @tools.action(description="Extract GummySearch patterns (AI-summarized common needs)")
     async def extract_gummy_patterns(browser_session):
@@ -392,13 +420,14 @@ async def run_browser_automation(prompt: str, model_name: str, progress=gr.Progr
             patterns_link = await page.query_selector('a:has-text("Patterns"), [href*="patterns"]')
             if patterns_link:
                 await patterns_link.click()
-                await page.wait_for_timeout(2000)
+                await wait_for_quiet(page, "gummy_patterns_tab")
             
             # Click Find Patterns button if needed
             find_btn = await page.query_selector('button:has-text("Find Patterns")')
             if find_btn:
                 await find_btn.click()
-                await page.wait_for_timeout(5000)  # Patterns take time to generate
+                # Patterns take time to generate
+                await wait_for_content(page, GUMMY_PATTERN_SELECTORS, label="gummy_find_patterns", timeout_ms=30000)
         except Exception:
             pass
         
@@ -449,57 +478,25 @@ async def run_browser_automation(prompt: str, model_name: str, progress=gr.Progr
     async def extract_gummy_topics(browser_session, audience_id: str):
         """Navigate to Topics tab and extract topic list with counts."""
         page = await browser_session.get_current_page()
-        await page.goto(
-            f"https://go.gummysearch.com/audience/{audience_id}/topics/", wait_until="networkidle"
+        await goto_page(
+            page, f"https://go.gummysearch.com/audience/{audience_id}/topics/", GUMMY_TOPIC_SELECTORS, label="gummy_topics"
         )
-        await page.wait_for_timeout(3000)
         
-        topics = await page.evaluate(
-            """
-            () => {
-                const results = [];
-                const links = document.querySelectorAll('a[href*="/topics/"]');
-                
-                links.forEach(link => {
-                    const text = link.textContent || '';
-                    const parent = link.closest('div, li');
-                    const fullText = parent ? parent.textContent : text;
-                    
-                    // Extract topic name and metadata
-                    const topicMatch = text.match(/^([A-Za-z\\s-]+)/);
-                    const growthMatch = fullText.match(/-?\\d+%/);
-                    const subredditMatch = fullText.match(/r\\/[\\w_]+/g);
-                    
-                    if (topicMatch && topicMatch[1].trim().length > 2) {
-                        results.push({
-                            topic: topicMatch[1].trim(),
-                            growth: growthMatch ? growthMatch[0] : '',
-                            subreddits: subredditMatch || []
-                        });
-                    }
-                });
-                
-                // Dedupe
-                const seen = new Set();
-                return results.filter(t => {
-                    if (seen.has(t.topic)) return false;
-                    seen.add(t.topic);
-                    return true;
-                });
-            }
-            """
+        result = await extract_with_retry(
+            page, "gummy_topics", GUMMY_TOPIC_SELECTORS, GUMMY_TOPIC_SELECTORS, label="gummy_topics"
         )
+        await snapshot_page(page, "gummy_topics", "gummy_topics", GUMMY_TOPIC_SELECTORS, result)
+        topics = result.items
         
-        return f"Extracted {len(topics)} topics:\n{topics}"
+        return f"Extracted {len(topics)} topics ({result.summary()}):\n{topics}"
 
     @tools.action(description="Get GummySearch theme summary with counts")
     async def get_gummy_theme_summary(browser_session, audience_id: str):
         """Get summary of all themes with post counts for an audience."""
         page = await browser_session.get_current_page()
-        await page.goto(
-            f"https://go.gummysearch.com/audience/{audience_id}/themes/", wait_until="networkidle"
+        await goto_page(
+            page, f"https://go.gummysearch.com/audience/{audience_id}/themes/", GUMMY_THEME_SELECTORS, label="gummy_themes"
         )
-        await page.wait_for_timeout(3000)
         
         themes = await page.evaluate(
             """
@@ -530,10 +527,12 @@ async def run_browser_automation(prompt: str, model_name: str, progress=gr.Progr
     async def search_gummy_audience(browser_session, audience_id: str, query: str):
         """Search within a specific audience using keyword search."""
         page = await browser_session.get_current_page()
-        await page.goto(
-            f"https://go.gummysearch.com/audience/{audience_id}/", wait_until="networkidle"
+        await goto_page(
+            page,
+            f"https://go.gummysearch.com/audience/{audience_id}/",
+            ['input[placeholder*="Keyword" i]', 'input[placeholder*="search" i]'],
+            label="gummy_audience_search",
         )
-        await page.wait_for_timeout(2000)
         
         try:
             search_input = await page.query_selector(
@@ -542,7 +541,7 @@ async def run_browser_automation(prompt: str, model_name: str, progress=gr.Progr
             if search_input:
                 await search_input.fill(query)
                 await page.keyboard.press("Enter")
-                await page.wait_for_timeout(3000)
+                await wait_for_quiet(page, "gummy_search_results")
                 return f"Searched audience {audience_id} for: {query}"
             return "Could not find search input"
         except Exception as e:
@@ -553,18 +552,24 @@ async def run_browser_automation(prompt: str, model_name: str, progress=gr.Progr
 
     @tools.action(description="Search Reddit for pain points and problems")
     async def search_reddit(
-        browser_session, subreddit: str, query: str, sort: str = "relevance", time_filter: str = "year"
+        browser_session,
+        subreddit: str,
+        query: str,
+        sort: str = "relevance",
+        time_filter: str = "year",
+        max_posts: int = 20,
     ):
         """Search Reddit subreddit. sort: hot, new, top, relevance. time_filter: hour, day, week, month, year, all."""
-        page = await browser_session.get_current_page()
         search_url = f"https://www.reddit.com/r/{subreddit}/search/?q={query}&sort={sort}&restrict_sr=1&t={time_filter}"
-        await page.goto(search_url, wait_until="networkidle")
-        await page.wait_for_timeout(3000)
-        return f"Searched r/{subreddit} for '{query}' sorted by {sort}, time={time_filter}"
+        # Runs on a warm background tab so the agent's own tab is left alone
+        async with get_reddit_pool().page() as page:
+            result = await scroll_reddit_posts(page, search_url, max_posts)
+        posts = score_reddit_posts(result.items)
+        return f"Searched r/{subreddit} for '{query}' sorted by {sort}, time={time_filter}. Extracted {len(posts)} posts ({result.summary()}):\n{posts}"
 
     @tools.action(description="Search Reddit with SaaS intent queries")
     async def search_reddit_saas_intent(
-        browser_session, subreddit: str, intent: str = "solution_request"
+        browser_session, subreddit: str, intent: str = "solution_request", max_posts: int = 20
     ):
         """Search Reddit with pre-built SaaS discovery queries by intent type."""
         intent_queries = {
@@ -575,20 +580,19 @@ async def run_browser_automation(prompt: str, model_name: str, progress=gr.Progr
             "competition_gap": "alternative to OR better than OR replacement for",
         }
         query = intent_queries.get(intent, intent_queries["solution_request"])
-        page = await browser_session.get_current_page()
         search_url = f"https://www.reddit.com/r/{subreddit}/search/?q={query}&sort=relevance&restrict_sr=1&t=year"
-        await page.goto(search_url, wait_until="networkidle")
-        await page.wait_for_timeout(3000)
-        return f"Searched r/{subreddit} for {intent} intent"
+        async with get_reddit_pool().page() as page:
+            result = await scroll_reddit_posts(page, search_url, max_posts)
+        posts = score_reddit_posts(result.items)
+        return f"Searched r/{subreddit} for {intent} intent. Extracted {len(posts)} posts ({result.summary()}):\n{posts}"
 
     @tools.action(description="Navigate to a specific subreddit")
     async def navigate_subreddit(browser_session, subreddit: str, sort: str = "hot"):
         """Navigate to subreddit. sort: hot, new, top, rising."""
         page = await browser_session.get_current_page()
-        await page.goto(
-            f"https://www.reddit.com/r/{subreddit}/{sort}/", wait_until="networkidle"
+        await goto_page(
+            page, f"https://www.reddit.com/r/{subreddit}/{sort}/", REDDIT_POST_SELECTORS, label="reddit_subreddit"
         )
-        await page.wait_for_timeout(2000)
         return f"Navigated to r/{subreddit} ({sort})"
 
     @tools.action(description="Extract Reddit posts with full metadata and intent classification")
@@ -596,117 +600,13 @@ async def run_browser_automation(prompt: str, model_name: str, progress=gr.Progr
         """Extract structured post data from Reddit with SaaS validation signals."""
         page = await browser_session.get_current_page()
 
-        posts = await page.evaluate(
-            """
-            (maxPosts) => {
-                const results = [];
-                
-                // Intent classification keywords
-                const intents = {
-                    solution_request: ['looking for', 'recommend', 'anyone know', 'tool for', 'software for', 'app for', 'what do you use'],
-                    pain_point: ['frustrated', 'hate', 'annoying', 'struggle', 'waste of time', 'inefficient', 'broken', 'sucks'],
-                    advice_request: ['how do you', 'how to', 'best way', 'tips for', 'advice on', 'help with'],
-                    willingness_to_pay: ['would pay', 'pay for', 'budget', 'worth paying', 'subscription', 'pricing', 'cost'],
-                    idea: ['idea', 'what if', 'suggestion', 'feature request', 'wish there was'],
-                    self_promotion: ['built', 'created', 'launched', 'just released', 'my app', 'my tool', 'feedback on']
-                };
-                
-                function classifyIntent(text) {
-                    const lower = text.toLowerCase();
-                    const detected = [];
-                    for (const [intent, keywords] of Object.entries(intents)) {
-                        for (const kw of keywords) {
-                            if (lower.includes(kw)) {
-                                detected.push(intent);
-                                break;
-                            }
-                        }
-                    }
-                    return detected.length ? detected : ['general'];
-                }
-                
-                // Try multiple selectors for Reddit posts
-                const postSelectors = [
-                    'shreddit-post',
-                    '[data-testid="post-container"]',
-                    'article',
-                    '.Post',
-                    '.thing.link'
-                ];
-                
-                let posts = [];
-                for (const selector of postSelectors) {
-                    posts = document.querySelectorAll(selector);
-                    if (posts.length > 0) break;
-                }
-
-                posts.forEach((post, idx) => {
-                    if (idx >= maxPosts) return;
-                    
-                    let title = '';
-                    let body = '';
-                    let upvotes = '0';
-                    let comments = '0';
-                    let author = '';
-                    let timestamp = '';
-                    let url = '';
-                    let subreddit = '';
-                    
-                    // shreddit-post (new Reddit)
-                    if (post.tagName === 'SHREDDIT-POST') {
-                        title = post.getAttribute('post-title') || '';
-                        author = post.getAttribute('author') || '';
-                        upvotes = post.getAttribute('score') || '0';
-                        comments = post.getAttribute('comment-count') || '0';
-                        url = post.getAttribute('permalink') || '';
-                        subreddit = post.getAttribute('subreddit-prefixed-name') || '';
-                    } else {
-                        // Fallback selectors
-                        title = post.querySelector('h3, h2, [slot="title"], a.title, .title')?.textContent?.trim() || '';
-                        body = post.querySelector('[slot="text-body"], .md, .usertext-body, p')?.textContent?.trim() || '';
-                        upvotes = post.querySelector('[data-testid="post-vote-score"], .score, faceplate-number')?.textContent || '0';
-                        comments = post.querySelector('a[href*="comments"]')?.textContent?.match(/\\d+/)?.[0] || '0';
-                        author = post.querySelector('a[href*="/user/"]')?.textContent || '';
-                        const timeEl = post.querySelector('time, [datetime]');
-                        timestamp = timeEl?.getAttribute('datetime') || timeEl?.textContent || '';
-                    }
-                    
-                    if (title && title.length > 10) {
-                        const fullText = title + ' ' + body;
-                        const intentTypes = classifyIntent(fullText);
-                        
-                        // Calculate validation score
-                        let validationScore = 0;
-                        if (intentTypes.includes('solution_request')) validationScore += 3;
-                        if (intentTypes.includes('pain_point')) validationScore += 2;
-                        if (intentTypes.includes('willingness_to_pay')) validationScore += 4;
-                        validationScore += Math.min(parseInt(upvotes) / 10, 3);
-                        validationScore += Math.min(parseInt(comments) / 20, 2);
-                        
-                        results.push({
-                            title: title.substring(0, 200),
-                            body: body.substring(0, 500),
-                            upvotes: upvotes,
-                            comments: comments,
-                            author: author,
-                            timestamp: timestamp,
-                            subreddit: subreddit,
-                            url: url,
-                            intents: intentTypes,
-                            validation_score: Math.round(validationScore * 10) / 10
-                        });
-                    }
-                });
-                
-                // Sort by validation score
-                results.sort((a, b) => b.validation_score - a.validation_score);
-                return results;
-            }
-            """,
-            max_posts
-        )
+        # Shares the post extraction helper with the scroll-paginated searches (script_registry)
+        arg = [REDDIT_POST_SELECTORS, max_posts, 200, 500]
+        result = await extract_with_retry(page, "reddit_posts", arg, REDDIT_POST_SELECTORS, label="reddit_posts")
+        await snapshot_page(page, "reddit_posts", "reddit_posts", arg, result)
+        posts = score_reddit_posts(result.items)
 
-        return f"Extracted {len(posts)} posts with intent classification:\n{posts}"
+        return f"Extracted {len(posts)} posts with intent classification ({result.summary()}):\n{posts}"
 
     @tools.action(
         description="Check for willingness-to-pay signals in extracted content"
@@ -770,8 +670,7 @@ async def run_browser_automation(prompt: str, model_name: str, progress=gr.Progr
     @tools.action(description="Navigate to a specific URL")
     async def navigate_to(browser_session, url: str):
         page = await browser_session.get_current_page()
-        await page.goto(url, wait_until="networkidle")
-        await page.wait_for_timeout(2000)
+        await goto_page(page, url, label="navigate_to")
         return f"Navigated to: {url}"
 
     @tools.action(description="Wait for the page to load")
@@ -787,7 +686,7 @@ async def run_browser_automation(prompt: str, model_name: str, progress=gr.Progr
 
         for i in range(amount):
             await page.keyboard.press("PageDown")
-            await page.wait_for_timeout(800)
+            await wait_for_quiet(page, "scroll", quiet_ms=300, timeout_ms=1500)
 
         # Extract new content after scrolling
         content = await page.evaluate(
@@ -819,7 +718,7 @@ async def run_browser_automation(prompt: str, model_name: str, progress=gr.Progr
             )
             if posts and post_index < len(posts):
                 await posts[post_index].click()
-                await page.wait_for_timeout(2000)
+                await wait_for_content(page, REDDIT_COMMENT_SELECTORS, label="reddit_post")
                 return f"Clicked post {post_index}. Reading full discussion for validation..."
             return f"Post {post_index} not found"
         except Exception as e:
@@ -830,21 +729,12 @@ async def run_browser_automation(prompt: str, model_name: str, progress=gr.Progr
         """Extract top comments for additional validation signals."""
         page = await browser_session.get_current_page()
 
-        comments = await page.evaluate(
-            """
-        () => {
-            const commentElements = document.querySelectorAll('[data-testid="comment"], .comment, .usertext-body');
-            const extracted = [];
-            commentElements.forEach(el => {
-                const text = el.textContent || el.innerText;
-                if (text && text.length > 30 && text.length < 2000) {
-                    extracted.push(text.trim());
-                }
-            });
-            return extracted.slice(0, 20).join('\\n---\\n');
-        }
-        """
+        arg = [COMMENT_TEXT_SELECTORS, 20]
+        result = await extract_with_retry(
+            page, "reddit_comments", arg, COMMENT_TEXT_SELECTORS, label="reddit_comments", retries=0
         )
+        await snapshot_page(page, "reddit_comments", "reddit_comments", arg, result)
+        comments = "\n---\n".join(result.items)
 
         return f"Extracted comments:\n{comments[:10000] if comments else 'No comments found'}"
 
@@ -852,10 +742,9 @@ async def run_browser_automation(prompt: str, model_name: str, progress=gr.Progr
     async def google_competition_check(browser_session, search_query: str):
         """Search Google to check existing solutions/competition for an idea."""
         page = await browser_session.get_current_page()
-        await page.goto(
-            f"https://www.google.com/search?q={search_query}", wait_until="networkidle"
+        await goto_page(
+            page, f"https://www.google.com/search?q={search_query}", ["#search"], label="google_search"
         )
-        await page.wait_for_timeout(2000)
 
         # Count ads and organic results
         results_info = await page.evaluate(
@@ -875,7 +764,7 @@ async def run_browser_automation(prompt: str, model_name: str, progress=gr.Progr
     async def go_back(browser_session):
         page = await browser_session.get_current_page()
         await page.go_back()
-        await page.wait_for_timeout(1000)
+        await wait_for_quiet(page, "go_back")
         return "Navigated back to previous page"
 
     # Build the task with user's prompt
@@ -907,10 +796,10 @@ GUMMYSEARCH TOOLS (for structured audience research):
 - search_gummy_audience(audience_id, query): Search within audience
 
 REDDIT TOOLS (direct scraping with intent classification):
-- search_reddit(subreddit, query, sort, time_filter): Search subreddit
-- search_reddit_saas_intent(subreddit, intent): Search by intent type (solution_request/pain_point/advice_request/willingness_to_pay/competition_gap)
+- search_reddit(subreddit, query, sort, time_filter, max_posts): Search subreddit in the background and return posts with intent classification & validation scores
+- search_reddit_saas_intent(subreddit, intent, max_posts): Search by intent type (solution_request/pain_point/advice_request/willingness_to_pay/competition_gap), returns posts
 - navigate_subreddit(subreddit, sort): Go to subreddit
-- extract_reddit_posts(max_posts): Extract posts with intent classification & validation scores
+- extract_reddit_posts(max_posts): Extract posts from the current page with intent classification & validation scores
 - click_reddit_post(index): Click post for full discussion
 - extract_comments(): Extract comments for deeper validation
 
@@ -941,7 +830,7 @@ PHASE 2: REDDIT VALIDATION (Cross-reference)
 6. extract_saas_signals() to get structured data with engagement metrics
 
 PHASE 3: DEEP DIVE ON PROMISING IDEAS
-7. For posts with high engagement: click_reddit_post() then extract_comments()
+7. For posts with high engagement: navigate_to() the post URL (https://www.reddit.com + url) then extract_comments()
 8. check_payment_signals() on both post and comments
 9. Look for "I would pay for", "budget for", "currently using [expensive tool]"
 
@@ -1041,6 +930,16 @@ Be thorough. Cross-reference across platforms. Prioritize ideas with BOTH pain a
         except Exception:
             action_log += "No actions recorded\n"
 
+        wait_stats = format_wait_stats()
+        if wait_stats:
+            action_log += f"\n### ⏱️ Page Wait Timings\n\n{wait_stats}\n"
+        rate_stats = RATE_LIMITER.format_stats()
+        if rate_stats:
+            action_log += f"\n### 🚦 Request Pacing\n\n{rate_stats}\n"
+        extraction_stats = format_extraction_stats()
+        if extraction_stats:
+            action_log += f"\n### 🧩 Extraction Yield\n\n{extraction_stats}\n"
+
         # Save results to markdown file
         file_path, saved_attachments = save_results_markdown(
             formatted_result, action_log, prompt, model_name
@@ -1082,8 +981,12 @@ def run_async_task(prompt: str, model_name: str):
 
 async def close_browser_instance():
     """Close the browser instance."""
-    global browser_instance
+    global browser_instance, reddit_pool
     
+    if reddit_pool is not None:
+        await reddit_pool.close()
+        reddit_pool = None
+
     if browser_instance is not None:
         try:
             await browser_instance.stop()